@@ -679,9 +679,20 @@ def copy_db() -> None:
         typer.echo("Pre-release database not found in the cache directory.")
 
 
-async def _migration(*, test: bool, fix: bool) -> None:
+async def _migration(*, test: bool, fix: bool, check: bool) -> None:
     await initialize_services(fix_migration=fix)
     db_service = get_db_service()
+    if check:
+        from alembic.util.exc import AutogenerateDiffsDetected
+
+        try:
+            await db_service.check_migrations()
+        except AutogenerateDiffsDetected as exc:
+            console.print(f"[red]There's a mismatch between the models and the database.[/red]\n{exc}")
+            raise typer.Exit(1) from exc
+        await db_service.save_schema_fingerprint()
+        console.print("[green]The database schema matches the models.[/green]")
+        return
     if not test:
         await db_service.run_migrations()
     results = await db_service.run_migrations_test()
@@ -695,6 +706,10 @@ def migration(
         default=False,
         help="Fix migrations. This is a destructive operation, and should only be used if you know what you are doing.",
     ),
+    check: bool = typer.Option(  # noqa: FBT001
+        default=False,
+        help="Compare the database schema with the models, skipped at startup when the schema was already checked.",
+    ),
 ) -> None:
     """Run or test migrations."""
     if fix and not typer.confirm(
@@ -702,7 +717,7 @@ def migration(
     ):
         raise typer.Abort
 
-    asyncio.run(_migration(test=test, fix=fix))
+    asyncio.run(_migration(test=test, fix=fix, check=check))
 
 
 @app.command()
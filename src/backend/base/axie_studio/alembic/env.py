@@ -7,7 +7,7 @@ from sqlalchemy import pool, text
 from sqlalchemy.event import listen
 from sqlalchemy.ext.asyncio import async_engine_from_config
 
-from axie_studio.services.database.service import SQLModel
+from axie_studio.services.database.service import SCHEMA_FINGERPRINT_TABLE, SQLModel
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -31,6 +31,13 @@ NAMING_CONVENTION = {
 # target_metadata = mymodel.Base.metadata
 target_metadata = SQLModel.metadata
 target_metadata.naming_convention = NAMING_CONVENTION
+
+
+def include_name(name, type_, parent_names):  # noqa: ARG001
+    # The fingerprint table is managed by the database service, not by the models
+    return not (type_ == "table" and name == SCHEMA_FINGERPRINT_TABLE)
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -53,6 +60,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         render_as_batch=True,
@@ -80,7 +88,11 @@ def _sqlite_do_begin(conn):
 
 def _do_run_migrations(connection):
     context.configure(
-        connection=connection, target_metadata=target_metadata, render_as_batch=True, prepare_threshold=None
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+        render_as_batch=True,
+        prepare_threshold=None,
     )
 
     with context.begin_transaction():
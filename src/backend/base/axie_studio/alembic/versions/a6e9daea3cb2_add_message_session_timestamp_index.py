@@ -0,0 +1,42 @@
+"""Add (session_id, timestamp) index to the message table.
+
+Revision ID: a6e9daea3cb2
+Revises: add_user_tiers
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a6e9daea3cb2"
+down_revision: str | Sequence[str] | None = "add_user_tiers"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEX_NAME = "ix_message_session_id_timestamp"
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore[arg-type]
+    if "message" not in inspector.get_table_names():
+        return
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    if INDEX_NAME not in indexes_names:
+        with op.batch_alter_table("message", schema=None) as batch_op:
+            batch_op.create_index(INDEX_NAME, ["session_id", "timestamp"], unique=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore[arg-type]
+    if "message" not in inspector.get_table_names():
+        return
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    if INDEX_NAME in indexes_names:
+        with op.batch_alter_table("message", schema=None) as batch_op:
+            batch_op.drop_index(INDEX_NAME)
@@ -225,7 +225,8 @@ async def generate_flow_events(
             components_count = len(graph.vertices)
             vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
 
-            await chat_service.set_cache(flow_id_str, graph)
+            await chat_service.set_graph(flow_id_str, graph)
+            await graph.save_run_state()
             await log_telemetry(start_time, components_count, success=True)
 
         except Exception as exc:
@@ -307,7 +308,7 @@ async def generate_flow_events(
                 params = vertex_build_result.params
                 valid = vertex_build_result.valid
                 artifacts = vertex_build_result.artifacts
-                next_runnable_vertices = await graph.get_next_runnable_vertices(lock, vertex=vertex, cache=False)
+                next_runnable_vertices = await graph.get_next_runnable_vertices(lock, vertex=vertex)
                 top_level_vertices = graph.get_top_level_vertices(next_runnable_vertices)
 
                 result_data_response = ResultDataResponse.model_validate(result_dict, from_attributes=True)
@@ -341,8 +342,6 @@ async def generate_flow_events(
                     data=result_data_response,
                     artifacts=artifacts,
                 )
-            else:
-                await chat_service.set_cache(flow_id_str, graph)
 
             timedelta = time.perf_counter() - start_time
             duration = format_elapsed_time(timedelta)
@@ -9,12 +9,16 @@ from typing import TYPE_CHECKING, Annotated, Any
 from fastapi import Depends, HTTPException, Query
 from fastapi_pagination import Params
 from loguru import logger
-from sqlalchemy import delete
+from sqlalchemy import delete, update
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from axie_studio.base.mcp.tool_registry import mcp_tool_registry
 from axie_studio.graph.graph.base import Graph
+from axie_studio.processing.graph_cache import graph_template_cache
 from axie_studio.services.auth.utils import get_current_active_user, get_current_active_user_mcp
 from axie_studio.services.database.models.flow.model import Flow
+from axie_studio.services.database.models.flow.utils import infer_is_component, set_is_component
 from axie_studio.services.database.models.message.model import MessageTable
 from axie_studio.services.database.models.transactions.model import TransactionTable
 from axie_studio.services.database.models.user.model import User
@@ -91,17 +95,32 @@ def build_input_keys_response(langchain_object, artifacts):
 
 def validate_is_component(flows: list[Flow]):
     for flow in flows:
-        if not flow.data or flow.is_component is not None:
-            continue
-
-        is_component = get_is_component_from_data(flow.data)
-        if is_component is not None:
-            flow.is_component = is_component
-        else:
-            flow.is_component = len(flow.data.get("nodes", [])) == 1
+        set_is_component(flow)
     return flows
 
 
+async def persist_is_component(session: AsyncSession, *criteria) -> None:
+    """Infers and stores the `is_component` flag of the flows matching `criteria` that don't have it yet.
+
+    Flows saved without the flag used to get it from their data each time they were listed. Once it is
+    stored, listings can filter on it and select flow headers without loading the data.
+    """
+    stmt = select(Flow.id, Flow.data).where(
+        Flow.is_component == None,  # noqa: E711
+        Flow.data != None,  # noqa: E711
+        *criteria,
+    )
+    flags: dict[bool, list[uuid.UUID]] = {True: [], False: []}
+    for flow_id, data in (await session.exec(stmt)).all():
+        if data:
+            flags[infer_is_component(data)].append(flow_id)
+    for is_component, flow_ids in flags.items():
+        if flow_ids:
+            await session.exec(update(Flow).where(col(Flow.id).in_(flow_ids)).values(is_component=is_component))
+    if flags[True] or flags[False]:
+        await session.commit()
+
+
 def get_is_component_from_data(data: dict):
     """Returns True if the data is a component."""
     return data.get("is_component")
@@ -194,7 +213,7 @@ async def build_graph_from_db_no_cache(flow_id: uuid.UUID, session: AsyncSession
 
 async def build_graph_from_db(flow_id: uuid.UUID, session: AsyncSession, chat_service: ChatService, **kwargs):
     graph = await build_graph_from_db_no_cache(flow_id=flow_id, session=session, **kwargs)
-    await chat_service.set_cache(str(flow_id), graph)
+    await chat_service.set_graph(str(flow_id), graph)
     return graph
 
 
@@ -207,7 +226,8 @@ async def build_and_cache_graph_from_data(
     # Convert flow_id to str if it's UUID
     str_flow_id = str(flow_id) if isinstance(flow_id, uuid.UUID) else flow_id
     graph = Graph.from_payload(graph_data, str_flow_id)
-    await chat_service.set_cache(str_flow_id, graph)
+    await graph.initialize_run()
+    await chat_service.set_graph(str_flow_id, graph)
     return graph
 
 
@@ -310,6 +330,8 @@ async def cascade_delete_flow(session: AsyncSession, flow_id: uuid.UUID) -> None
     except Exception as e:
         msg = f"Unable to cascade delete flow: {flow_id}"
         raise RuntimeError(msg, e) from e
+    graph_template_cache.invalidate(str(flow_id))
+    mcp_tool_registry.invalidate(flow_id)
 
 
 def custom_params(
@@ -46,7 +46,6 @@ from axie_studio.api.v1.schemas import (
     VerticesOrderResponse,
 )
 from axie_studio.exceptions.component import ComponentBuildError
-from axie_studio.graph.graph.base import Graph
 from axie_studio.graph.utils import log_vertex_build
 from axie_studio.schema.schema import OutputValue
 from axie_studio.services.cache.utils import CacheMiss
@@ -113,7 +112,7 @@ async def retrieve_vertices_order(
         # and return the same structure but only with the ids
         components_count = len(graph.vertices)
         vertices_to_run = list(graph.vertices_to_run.union(get_top_level_vertices(graph, graph.vertices_to_run)))
-        await chat_service.set_cache(str(flow_id), graph)
+        await graph.save_run_state()
         background_tasks.add_task(
             telemetry_service.log_package_playground,
             PlaygroundPayload(
@@ -294,22 +293,22 @@ async def build_vertex(
     start_time = time.perf_counter()
     error_message = None
     try:
-        graph: Graph = await chat_service.get_cache(flow_id_str)
-    except KeyError as exc:
-        raise HTTPException(status_code=404, detail="Graph not found") from exc
-
-    try:
-        cache = await chat_service.get_cache(flow_id_str)
-        if isinstance(cache, CacheMiss):
-            # If there's no cache
-            logger.warning(f"No cache found for {flow_id_str}. Building graph starting at {vertex_id}")
+        graph = await chat_service.get_graph(flow_id_str)
+        if isinstance(graph, CacheMiss):
+            # The build started in another worker, or the graph expired
+            logger.warning(f"No graph found for {flow_id_str}. Building graph starting at {vertex_id}")
+            run_id = await chat_service.get_graph_run_id(flow_id_str)
             graph = await build_graph_from_db(
                 flow_id=flow_id,
                 session=await anext(get_session()),
                 chat_service=chat_service,
             )
+            if run_id is not None:
+                # Carry on with the run the build belongs to
+                graph.set_run_id(run_id)
+                await graph.load_run_state()
+                await chat_service.set_graph(flow_id_str, graph)
         else:
-            graph = cache.get("result")
             await graph.initialize_run()
         vertex = graph.get_vertex(vertex_id)
 
@@ -327,7 +326,7 @@ async def build_vertex(
             params = vertex_build_result.params
             valid = vertex_build_result.valid
             artifacts = vertex_build_result.artifacts
-            next_runnable_vertices = await graph.get_next_runnable_vertices(lock, vertex=vertex, cache=False)
+            next_runnable_vertices = await graph.get_next_runnable_vertices(lock, vertex=vertex)
             top_level_vertices = graph.get_top_level_vertices(next_runnable_vertices)
             result_data_response = ResultDataResponse.model_validate(result_dict, from_attributes=True)
         except Exception as exc:  # noqa: BLE001
@@ -347,8 +346,8 @@ async def build_vertex(
             artifacts = {}
             background_tasks.add_task(graph.end_all_traces_in_context(error=exc))
             # If there's an error building the vertex
-            # we need to clear the cache
-            await chat_service.clear_cache(flow_id_str)
+            # we need to clear the graph
+            await chat_service.clear_graph(flow_id_str)
 
         result_data_response.message = artifacts
 
@@ -373,8 +372,6 @@ async def build_vertex(
         graph.reset_inactivated_vertices()
         graph.reset_activated_vertices()
 
-        await chat_service.set_cache(flow_id_str, graph)
-
         # graph.stop_vertex tells us if the user asked
         # to stop the build of the graph at a certain vertex
         # if it is in next_vertices_ids, we need to remove other
@@ -421,23 +418,20 @@ async def build_vertex(
 
 
 async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService):
-    graph = None
     try:
         try:
-            cache = await chat_service.get_cache(flow_id)
+            graph = await chat_service.get_graph(flow_id)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Error building Component")
             yield str(StreamData(event="error", data={"error": str(exc)}))
             return
 
-        if isinstance(cache, CacheMiss):
-            # If there's no cache
-            msg = f"No cache found for {flow_id}."
+        if isinstance(graph, CacheMiss):
+            # The stream of a vertex can only be read in the worker that built it
+            msg = f"No graph found for {flow_id}."
             logger.error(msg)
             yield str(StreamData(event="error", data={"error": msg}))
             return
-        else:
-            graph = cache.get("result")
 
         try:
             vertex: InterfaceVertex = graph.get_vertex(vertex_id)
@@ -497,8 +491,6 @@ async def _stream_vertex(flow_id: str, vertex_id: str, chat_service: ChatService
             return
     finally:
         logger.debug("Closing stream")
-        if graph:
-            await chat_service.set_cache(flow_id, graph)
         yield str(StreamData(event="close", data={"message": "Stream closed"}))
 
 
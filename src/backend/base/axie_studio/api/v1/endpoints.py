@@ -41,6 +41,7 @@ from axie_studio.graph.schema import RunOutputs
 from axie_studio.helpers.flow import get_flow_by_id_or_endpoint_name
 from axie_studio.helpers.user import get_user_by_flow_id_or_endpoint_name
 from axie_studio.interface.initialize.loading import update_params_with_load_from_db_fields
+from axie_studio.processing.graph_cache import graph_template_cache
 from axie_studio.processing.process import process_tweaks, run_graph_internal
 from axie_studio.schema.graph import Tweaks
 from axie_studio.services.auth.utils import api_key_security, get_current_active_user
@@ -50,7 +51,6 @@ from axie_studio.services.database.models.flow.utils import get_all_webhook_comp
 from axie_studio.services.database.models.user.model import User, UserRead
 from axie_studio.services.deps import get_session_service, get_settings_service, get_telemetry_service
 from axie_studio.services.telemetry.schema import RunPayload
-from axie_studio.utils.compression import compress_response
 from axie_studio.utils.version import get_version_info
 
 if TYPE_CHECKING:
@@ -61,17 +61,19 @@ router = APIRouter(tags=["Base"])
 
 
 @router.get("/all", dependencies=[Depends(get_current_active_user)])
-async def get_all():
+async def get_all(request: Request):
     """Retrieve all component types with compression for better performance.
 
-    Returns a compressed response containing all available component types.
+    Returns a compressed response containing all available component types. The response is serialized and
+    compressed once until the component types change and carries an ETag, so clients that send it back in
+    If-None-Match get a 304 Not Modified.
     """
-    from axie_studio.interface.components import get_and_cache_all_types_dict
+    from axie_studio.interface.components import component_cache, get_and_cache_all_types_dict
 
     try:
-        all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
-        # Return compressed response using our utility function
-        return compress_response(all_types)
+        await get_and_cache_all_types_dict(settings_service=get_settings_service())
+        payload = await component_cache.aget_payload()
+        return payload.response(request)
 
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -93,7 +95,7 @@ def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
         if input_value is None:
             continue
 
-        request_has_input = input_request.input_value is not None
+        request_has_input = input_request.input_value is not None or input_request.input_values is not None
 
         if any(chat_key in key for chat_key in ("ChatInput", "Chat Input")):
             if request_has_input and input_request.input_type == "chat":
@@ -125,11 +127,18 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+        graph = graph_template_cache.get_graph(
+            flow, tweaks=input_request.tweaks or {}, stream=stream, user_id=str(user_id)
+        )
         inputs = None
-        if input_request.input_value is not None:
+        max_parallel_runs = 1
+        if input_request.input_values is not None:
+            inputs = [
+                InputValueRequest(components=[], input_value=input_value, type=input_request.input_type)
+                for input_value in input_request.input_values
+            ]
+            max_parallel_runs = get_settings_service().settings.graph_batch_max_concurrency
+        elif input_request.input_value is not None:
             inputs = [
                 InputValueRequest(
                     components=[],
@@ -157,6 +166,7 @@ async def simple_run_flow(
             outputs=outputs,
             stream=stream,
             event_manager=event_manager,
+            max_parallel_runs=max_parallel_runs,
         )
 
         return RunResponse(outputs=task_result, session_id=session_id)
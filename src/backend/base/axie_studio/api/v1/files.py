@@ -1,7 +1,6 @@
 import hashlib
 from datetime import datetime, timezone
 from http import HTTPStatus
-from io import BytesIO
 from pathlib import Path
 from typing import Annotated
 from uuid import UUID
@@ -14,8 +13,8 @@ from axie_studio.api.v1.schemas import UploadFileResponse
 from axie_studio.services.database.models.flow.model import Flow
 from axie_studio.services.deps import get_settings_service, get_storage_service
 from axie_studio.services.settings.service import SettingsService
-from axie_studio.services.storage.service import StorageService
-from axie_studio.services.storage.utils import build_content_type_from_extension
+from axie_studio.services.storage.service import FileSizeLimitExceededError, StorageService
+from axie_studio.services.storage.utils import build_content_type_from_extension, iter_upload_file
 
 router = APIRouter(tags=["Files"], prefix="/files")
 
@@ -60,13 +59,26 @@ async def upload_file(
         raise HTTPException(status_code=403, detail="You don't have access to this flow")
 
     try:
-        file_content = await file.read()
         timestamp = datetime.now(tz=timezone.utc).astimezone().strftime("%Y-%m-%d_%H-%M-%S")
-        file_name = file.filename or hashlib.sha256(file_content).hexdigest()
+        file_name = file.filename
+        if not file_name:
+            # Name the file after its checksum, computed without loading it in memory
+            file_hash = hashlib.sha256()
+            async for chunk in iter_upload_file(file):
+                file_hash.update(chunk)
+            await file.seek(0)
+            file_name = file_hash.hexdigest()
         full_file_name = f"{timestamp}_{file_name}"
         folder = str(flow.id)
-        await storage_service.save_file(flow_id=folder, file_name=full_file_name, data=file_content)
+        await storage_service.save_file_stream(
+            flow_id=folder,
+            file_name=full_file_name,
+            stream=iter_upload_file(file),
+            max_size=max_file_size_upload * 1024 * 1024,
+        )
         return UploadFileResponse(flow_id=str(flow.id), file_path=f"{folder}/{full_file_name}")
+    except FileSizeLimitExceededError as e:
+        raise HTTPException(status_code=413, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -89,13 +101,14 @@ async def download_file(
         raise HTTPException(status_code=500, detail=f"Content type not found for extension {extension}")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
+        file_size = await storage_service.get_file_size(flow_id=flow_id_str, file_name=file_name)
+        file_stream = await storage_service.get_file_stream(flow_id=flow_id_str, file_name=file_name)
         headers = {
             "Content-Disposition": f"attachment; filename={file_name} filename*=UTF-8''{file_name}",
             "Content-Type": "application/octet-stream",
-            "Content-Length": str(len(file_content)),
+            "Content-Length": str(file_size),
         }
-        return StreamingResponse(BytesIO(file_content), media_type=content_type, headers=headers)
+        return StreamingResponse(file_stream, media_type=content_type, headers=headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -119,8 +132,8 @@ async def download_image(file_name: str, flow_id: UUID):
         raise HTTPException(status_code=500, detail=f"Content type {content_type} is not an image")
 
     try:
-        file_content = await storage_service.get_file(flow_id=flow_id_str, file_name=file_name)
-        return StreamingResponse(BytesIO(file_content), media_type=content_type)
+        file_stream = await storage_service.get_file_stream(flow_id=flow_id_str, file_name=file_name)
+        return StreamingResponse(file_stream, media_type=content_type)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -137,8 +150,8 @@ async def download_profile_picture(
         config_path = Path(config_dir)  # type: ignore[arg-type]
         folder_path = config_path / "profile_pictures" / folder_name
         content_type = build_content_type_from_extension(extension)
-        file_content = await storage_service.get_file(flow_id=folder_path, file_name=file_name)  # type: ignore[arg-type]
-        return StreamingResponse(BytesIO(file_content), media_type=content_type)
+        file_stream = await storage_service.get_file_stream(flow_id=folder_path, file_name=file_name)  # type: ignore[arg-type]
+        return StreamingResponse(file_stream, media_type=content_type)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import io
+import asyncio
 import json
 import re
-import zipfile
 from datetime import datetime, timezone
 from typing import Annotated
 from uuid import UUID
@@ -11,19 +10,28 @@ from uuid import UUID
 import orjson
 from aiofile import async_open
 from anyio import Path
-from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlmodel import apaginate
+from sqlalchemy import case, null
 from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from axie_studio.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
+from axie_studio.api.utils import (
+    CurrentActiveUser,
+    DbSession,
+    cascade_delete_flow,
+    remove_api_keys,
+    validate_is_component,
+)
 from axie_studio.api.v1.schemas import FlowListCreate
+from axie_studio.base.mcp.tool_registry import mcp_tool_registry
 from axie_studio.helpers.user import get_user_by_flow_id_or_endpoint_name
 from axie_studio.initial_setup.constants import STARTER_FOLDER_NAME
 from axie_studio.logging import logger
+from axie_studio.processing.graph_cache import graph_template_cache
 from axie_studio.services.database.models.flow.model import (
     AccessTypeEnum,
     Flow,
@@ -32,11 +40,12 @@ from axie_studio.services.database.models.flow.model import (
     FlowRead,
     FlowUpdate,
 )
-from axie_studio.services.database.models.flow.utils import get_webhook_component_in_flow
+from axie_studio.services.database.models.flow.utils import get_webhook_component_in_flow, set_is_component
 from axie_studio.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
 from axie_studio.services.database.models.folder.model import Folder
 from axie_studio.services.deps import get_settings_service
-from axie_studio.utils.compression import compress_response
+from axie_studio.utils.compression import compress_response, precompressed_json_cache
+from axie_studio.utils.zip_stream import stream_zip
 
 # build router
 router = APIRouter(prefix="/flows", tags=["Flows"])
@@ -130,6 +139,7 @@ async def _new_flow(
 
         db_flow = Flow.model_validate(flow, from_attributes=True)
         db_flow.updated_at = datetime.now(timezone.utc)
+        set_is_component(db_flow)
 
         if db_flow.folder_id is None:
             # Make sure flows always have a folder
@@ -160,6 +170,7 @@ async def create_flow(
 ):
     # Check workflow limits before creating
     from axie_studio.services.tier_limits import track_workflow_creation
+
     await track_workflow_creation(current_user, session)
 
     try:
@@ -187,9 +198,60 @@ async def create_flow(
     return db_flow
 
 
+FLOW_HEADER_COLUMNS = (
+    Flow.id,
+    Flow.name,
+    Flow.folder_id,
+    Flow.is_component,
+    Flow.endpoint_name,
+    Flow.description,
+    # The data is only part of the headers of components
+    case((Flow.is_component == True, Flow.data), else_=null()).label("data"),  # noqa: E712
+    Flow.access_type,
+    Flow.tags,
+    Flow.mcp_enabled,
+    Flow.action_name,
+    Flow.action_description,
+)
+
+
+async def _read_flow_headers(
+    session: AsyncSession,
+    request: Request,
+    criteria: list,
+    *,
+    limit: int | None = None,
+    cursor: UUID | None = None,
+) -> Response:
+    """Lists flow headers selecting only their columns, with optional keyset pagination on the flow id.
+
+    When `limit` is set, flows are ordered by id and the id to pass as `cursor` for the next page is
+    returned in the `X-Next-Cursor` header, if there are more flows. The response is served from the
+    compressed payload of an identical previous listing, and as a 304 if the client already has it.
+    """
+    stmt = select(*FLOW_HEADER_COLUMNS).where(*criteria)
+    if limit is not None:
+        stmt = stmt.order_by(col(Flow.id))
+        if cursor is not None:
+            stmt = stmt.where(col(Flow.id) > cursor)
+        stmt = stmt.limit(limit + 1)
+    rows = (await session.exec(stmt)).all()
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1].id
+    flow_headers = [FlowHeader.model_validate(row, from_attributes=True) for row in rows]
+    response = (await asyncio.to_thread(precompressed_json_cache.get, flow_headers)).response(request)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return response
+
+
 @router.get("/", response_model=list[FlowRead] | Page[FlowRead] | list[FlowHeader], status_code=200)
 async def read_flows(
     *,
+    request: Request,
     current_user: CurrentActiveUser,
     session: DbSession,
     remove_example_flows: bool = False,
@@ -198,10 +260,14 @@ async def read_flows(
     folder_id: UUID | None = None,
     params: Annotated[Params, Depends()],
     header_flows: bool = False,
+    limit: Annotated[int | None, Query(ge=1)] = None,
+    cursor: UUID | None = None,
 ):
     """Retrieve a list of flows with pagination support.
 
     Args:
+        request (Request): The request, whose `Accept-Encoding` and `If-None-Match` headers are used to serve
+            flow headers.
         current_user (User): The current authenticated user.
         session (Session): The database session.
         settings_service (SettingsService): The settings service.
@@ -214,11 +280,17 @@ async def read_flows(
         params (Params): Pagination parameters.
         remove_example_flows (bool, optional): Whether to remove example flows. Defaults to False.
         header_flows (bool, optional): Whether to return only specific headers of the flows. Defaults to False.
+        limit (int, optional): The maximum number of flow headers to return, ordered by id. Defaults to None.
+            Only supported with `get_all` and `header_flows`, a 400 error is returned otherwise.
+        cursor (UUID, optional): Return the flow headers after this flow id, from `X-Next-Cursor`.
+            Only supported with `get_all` and `header_flows`, like `limit`.
 
     Returns:
         list[FlowRead] | Page[FlowRead] | list[FlowHeader]
         A list of flows or a paginated response containing the list of flows or a list of flow headers.
     """
+    if (limit is not None or cursor is not None) and not (get_all and header_flows):
+        raise HTTPException(status_code=400, detail="limit and cursor can only be used with get_all and header_flows")
     try:
         auth_settings = get_settings_service().auth_settings
 
@@ -238,17 +310,22 @@ async def read_flows(
             folder_id = default_folder_id
 
         if auth_settings.AUTO_LOGIN:
-            stmt = select(Flow).where(
-                (Flow.user_id == None) | (Flow.user_id == current_user.id)  # noqa: E711
-            )
+            owner_criterion = (Flow.user_id == None) | (Flow.user_id == current_user.id)  # noqa: E711
         else:
-            stmt = select(Flow).where(Flow.user_id == current_user.id)
+            owner_criterion = Flow.user_id == current_user.id
+        criteria = [owner_criterion]
 
         if remove_example_flows:
-            stmt = stmt.where(Flow.folder_id != starter_folder_id)
+            criteria.append(Flow.folder_id != starter_folder_id)
 
         if components_only:
-            stmt = stmt.where(Flow.is_component == True)  # noqa: E712
+            criteria.append(Flow.is_component == True)  # noqa: E712
+
+        if get_all and header_flows:
+            # Headers are selected without the data, relying on the is_component flag stored at startup
+            return await _read_flow_headers(session, request, criteria, limit=limit, cursor=cursor)
+
+        stmt = select(Flow).where(*criteria)
 
         if get_all:
             flows = (await session.exec(stmt)).all()
@@ -257,10 +334,6 @@ async def read_flows(
                 flows = [flow for flow in flows if flow.is_component]
             if remove_example_flows and starter_folder_id:
                 flows = [flow for flow in flows if flow.folder_id != starter_folder_id]
-            if header_flows:
-                # Convert to FlowHeader objects and compress the response
-                flow_headers = [FlowHeader.model_validate(flow, from_attributes=True) for flow in flows]
-                return compress_response(flow_headers)
 
             # Compress the full flows response
             return compress_response(flows)
@@ -364,6 +437,8 @@ async def update_flow(
         session.add(db_flow)
         await session.commit()
         await session.refresh(db_flow)
+        graph_template_cache.invalidate(str(flow_id))
+        mcp_tool_registry.invalidate(flow_id)
 
         await _save_flow_to_fs(db_flow)
 
@@ -416,6 +491,7 @@ async def create_flows(
     """Create multiple new flows."""
     # Check workflow limits for batch creation
     from axie_studio.services.tier_limits import TierLimitsService
+
     limits_service = TierLimitsService(session)
 
     # Check if user can create all requested flows
@@ -425,7 +501,7 @@ async def create_flows(
     db_flows = []
     for flow in flow_list.flows:
         flow.user_id = current_user.id
-        db_flow = Flow.model_validate(flow, from_attributes=True)
+        db_flow = set_is_component(Flow.model_validate(flow, from_attributes=True))
         session.add(db_flow)
         db_flows.append(db_flow)
     await session.commit()
@@ -524,27 +600,19 @@ async def download_multiple_file(
     flows_without_api_keys = [remove_api_keys(flow.model_dump()) for flow in flows]
 
     if len(flows_without_api_keys) > 1:
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
 
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
+        async def zip_members():
             for flow in flows_without_api_keys:
-                # Convert the flow object to JSON
+                # Convert the flow object to JSON as the ZIP file is streamed
                 flow_json = json.dumps(jsonable_encoder(flow))
-
-                # Write the JSON to the ZIP file
-                zip_file.writestr(f"{flow['name']}.json", flow_json)
-
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
+                yield f"{flow['name']}.json", flow_json.encode("utf-8")
 
         # Generate the filename with the current datetime
         current_time = datetime.now(tz=timezone.utc).astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"{current_time}_langflow_flows.zip"
 
         return StreamingResponse(
-            zip_stream,
+            stream_zip(zip_members()),
             media_type="application/x-zip-compressed",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -19,8 +19,8 @@ from sqlmodel import select
 from axie_studio.api.v1.endpoints import simple_run_flow
 from axie_studio.api.v1.schemas import SimplifiedAPIRequest
 from axie_studio.base.mcp.constants import MAX_MCP_TOOL_NAME_LENGTH
-from axie_studio.base.mcp.util import get_flow_snake_case, get_unique_name, sanitize_mcp_name
-from axie_studio.helpers.flow import json_schema_from_flow
+from axie_studio.base.mcp.tool_registry import mcp_tool_registry
+from axie_studio.base.mcp.util import get_unique_name
 from axie_studio.schema.message import Message
 from axie_studio.services.database.models import Flow
 from axie_studio.services.database.models.user.model import User
@@ -175,7 +175,7 @@ async def handle_call_tool(
 
     async def execute_tool(session):
         # Get flow id from name
-        flow = await get_flow_snake_case(name, current_user.id, session, is_action=is_action)
+        flow = await mcp_tool_registry.find_flow(session, name, current_user.id, is_action=is_action)
         if not flow:
             msg = f"Flow with name '{name}' not found"
             raise ValueError(msg)
@@ -285,35 +285,25 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
     tools = []
     try:
         async with session_scope() as session:
-            # Build query based on parameters
-            if project_id:
-                # Filter flows by project and optionally by MCP enabled status
-                flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
-                if mcp_enabled_only:
-                    flows_query = flows_query.where(Flow.mcp_enabled == True)  # noqa: E712
-            else:
-                # Get all flows
-                flows_query = select(Flow)
-
-            flows = (await session.exec(flows_query)).all()
+            # Only the flows that changed since the last listing are loaded to build their input schema
+            flows = await mcp_tool_registry.list_flows(
+                session, project_id=project_id, mcp_enabled_only=mcp_enabled_only
+            )
+            flows = [flow for flow in flows if flow.user_id is not None]
+            input_schemas = await mcp_tool_registry.get_input_schemas(session, flows)
 
             existing_names = set()
             for flow in flows:
-                if flow.user_id is None:
-                    continue
-
                 # For project-specific tools, use action names if available
                 if project_id:
-                    base_name = (
-                        sanitize_mcp_name(flow.action_name) if flow.action_name else sanitize_mcp_name(flow.name)
-                    )
+                    base_name = flow.action_tool_name
                     name = get_unique_name(base_name, MAX_MCP_TOOL_NAME_LENGTH, existing_names)
                     description = flow.action_description or (
                         flow.description if flow.description else f"Tool generated from flow: {name}"
                     )
                 else:
                     # For global tools, use simple sanitized names
-                    base_name = sanitize_mcp_name(flow.name)
+                    base_name = flow.tool_name
                     name = base_name[:MAX_MCP_TOOL_NAME_LENGTH]
                     if name in existing_names:
                         i = 1
@@ -329,11 +319,14 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
                         f"{flow.id}: {flow.description}" if flow.description else f"Tool generated from flow: {name}"
                     )
 
+                input_schema = input_schemas.get(flow.id)
+                if input_schema is None:
+                    continue
                 try:
                     tool = types.Tool(
                         name=name,
                         description=description,
-                        inputSchema=json_schema_from_flow(flow),
+                        inputSchema=input_schema,
                     )
                     tools.append(tool)
                     existing_names.add(name)
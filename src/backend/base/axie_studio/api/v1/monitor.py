@@ -18,6 +18,7 @@ from axie_studio.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from axie_studio.services.database.models.vertex_builds.model import VertexBuildMapModel
+from axie_studio.services.deps import get_db_service
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
@@ -25,6 +26,8 @@ router = APIRouter(prefix="/monitor", tags=["Monitor"])
 @router.get("/builds")
 async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
     try:
+        # Builds are written in the background, make sure the pending ones are visible
+        await get_db_service().log_writer.flush()
         vertex_builds = await get_vertex_builds_by_flow_id(session, flow_id)
         return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
     except Exception as e:
@@ -34,6 +37,7 @@ async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSessio
 @router.delete("/builds", status_code=204)
 async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> None:
     try:
+        await get_db_service().log_writer.flush()
         await delete_vertex_builds_by_flow_id(session, flow_id)
         await session.commit()
     except Exception as e:
@@ -187,6 +191,7 @@ async def get_transactions(
     params: Annotated[Params | None, Depends(custom_params)],
 ) -> Page[TransactionTable]:
     try:
+        await get_db_service().log_writer.flush()
         stmt = (
             select(TransactionTable)
             .where(TransactionTable.flow_id == flow_id)
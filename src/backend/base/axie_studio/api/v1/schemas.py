@@ -12,6 +12,7 @@ from pydantic import (
     field_serializer,
     field_validator,
     model_serializer,
+    model_validator,
 )
 
 from axie_studio.graph.schema import RunOutputs
@@ -380,6 +381,18 @@ class SimplifiedAPIRequest(BaseModel):
     )
     tweaks: Tweaks | None = Field(default=None, description="The tweaks")
     session_id: str | None = Field(default=None, description="The session id")
+    input_values: list[str] | None = Field(
+        default=None,
+        description="A batch of input values. The flow runs once per value, several runs at a time, "
+        "and the outputs are returned in the same order as the values.",
+    )
+
+    @model_validator(mode="after")
+    def validate_input_values(self):
+        if self.input_values is not None and self.input_value is not None:
+            msg = "Pass either input_value or input_values, not both."
+            raise ValueError(msg)
+        return self
 
 
 # (alias) type ReactFlowJsonObject<NodeData = any, EdgeData = any> = {
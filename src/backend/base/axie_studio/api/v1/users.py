@@ -15,6 +15,7 @@ from axie_studio.services.auth.utils import (
     get_password_hash,
     verify_password,
 )
+from axie_studio.services.database.models.api_key.crud import api_key_cache
 from axie_studio.services.database.models.user.crud import get_user_by_id, update_user
 from axie_studio.services.database.models.user.model import User, UserCreate, UserRead, UserUpdate
 from axie_studio.services.deps import get_settings_service
@@ -109,7 +110,9 @@ async def patch_user(
     if user_db := await get_user_by_id(session, user_id):
         if not update_password:
             user_update.password = user_db.password
-        return await update_user(user_db, user_update, session)
+        updated_user = await update_user(user_db, user_update, session)
+        api_key_cache.invalidate(user_id=user_id)
+        return updated_user
     raise HTTPException(status_code=404, detail="User not found")
 
 
@@ -132,6 +135,7 @@ async def reset_password(
     user.password = new_password
     await session.commit()
     await session.refresh(user)
+    api_key_cache.invalidate(user_id=user_id)
 
     return user
 
@@ -155,5 +159,6 @@ async def delete_user(
 
     await session.delete(user_db)
     await session.commit()
+    api_key_cache.invalidate(user_id=user_id)
 
     return {"detail": "User deleted"}
@@ -1,7 +1,5 @@
-import io
 import re
 import uuid
-import zipfile
 from collections.abc import AsyncGenerator, AsyncIterable
 from datetime import datetime
 from http import HTTPStatus
@@ -18,7 +16,13 @@ from axie_studio.api.schemas import UploadFileResponse
 from axie_studio.api.utils import CurrentActiveUser, DbSession
 from axie_studio.services.database.models.file.model import File as UserFile
 from axie_studio.services.deps import get_settings_service, get_storage_service
-from axie_studio.services.storage.service import StorageService
+from axie_studio.services.storage.service import (
+    STREAM_CHUNK_SIZE,
+    FileSizeLimitExceededError,
+    StorageService,
+    StoredFile,
+)
+from axie_studio.utils.zip_stream import stream_zip
 
 router = APIRouter(tags=["Files"], prefix="/files")
 
@@ -63,19 +67,28 @@ async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser,
     return file
 
 
-async def save_file_routine(file, storage_service, current_user: CurrentActiveUser, file_content=None, file_name=None):
-    """Routine to save the file content to the storage service."""
+async def save_file_routine(
+    file,
+    storage_service,
+    current_user: CurrentActiveUser,
+    file_content=None,
+    file_name=None,
+    *,
+    max_size: int | None = None,
+) -> tuple[uuid.UUID, str, StoredFile]:
+    """Routine to stream the file content to the storage service, chunk by chunk."""
     file_id = uuid.uuid4()
 
-    if not file_content:
-        file_content = await file.read()
     if not file_name:
         file_name = file.filename
+    stream = byte_stream_generator(file_content if file_content else file, chunk_size=STREAM_CHUNK_SIZE)
 
     # Save the file using the storage service.
-    await storage_service.save_file(flow_id=str(current_user.id), file_name=file_name, data=file_content)
+    stored_file = await storage_service.save_file_stream(
+        flow_id=str(current_user.id), file_name=file_name, stream=stream, max_size=max_size
+    )
 
-    return file_id, file_name
+    return file_id, file_name, stored_file
 
 
 @router.post("", status_code=HTTPStatus.CREATED)
@@ -142,32 +155,34 @@ async def upload_user_file(
             # Create the unique filename with extension for storage
             unique_filename = f"{root_filename}.{file_extension}" if file_extension else root_filename
 
-        # Read file content and save with unique filename
+        # Stream file content and save with unique filename
         try:
-            file_id, stored_file_name = await save_file_routine(
-                file, storage_service, current_user, file_name=unique_filename
+            file_id, stored_file_name, stored_file = await save_file_routine(
+                file,
+                storage_service,
+                current_user,
+                file_name=unique_filename,
+                max_size=max_file_size_upload * 1024 * 1024,
             )
+        except FileSizeLimitExceededError as e:
+            raise HTTPException(status_code=413, detail=str(e)) from e
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error saving file: {e}") from e
 
-        # Compute the file size based on the path
-        file_size = await storage_service.get_file_size(
-            flow_id=str(current_user.id),
-            file_name=stored_file_name,
-        )
-
         # Create a new file record
         new_file = UserFile(
             id=file_id,
             user_id=current_user.id,
             name=root_filename,
             path=f"{current_user.id}/{stored_file_name}",
-            size=file_size,
+            size=stored_file.size,
         )
         session.add(new_file)
 
         await session.commit()
         await session.refresh(new_file)
+    except HTTPException:
+        raise
     except Exception as e:
         # Optionally, you could also delete the file from disk if the DB insert fails.
         raise HTTPException(status_code=500, detail=f"Database error: {e}") from e
@@ -208,24 +223,20 @@ async def load_sample_files(current_user: CurrentActiveUser, session: DbSession,
         binary_data = sample_file_path.read_bytes()
 
         # Write the sample file content to the storage service
-        file_id, _ = await save_file_routine(
+        file_id, _, stored_file = await save_file_routine(
             sample_file_path,
             storage_service,
             current_user,
             file_content=binary_data,
             file_name=sample_file_name,
         )
-        file_size = await storage_service.get_file_size(
-            flow_id=str(current_user.id),
-            file_name=sample_file_name,
-        )
         # Create a UserFile object for the sample file
         sample_file = UserFile(
             id=file_id,
             user_id=current_user.id,
             name=root_filename,
             path=sample_file_name,
-            size=file_size,
+            size=stored_file.size,
         )
 
         session.add(sample_file)
@@ -307,34 +318,26 @@ async def download_files_batch(
         if not files:
             raise HTTPException(status_code=404, detail="No files found")
 
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
-
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for file in files:
-                # Get the file content from storage
-                file_content = await storage_service.get_file(
-                    flow_id=str(current_user.id), file_name=file.path.split("/")[-1]
-                )
-
-                # Get the file extension from the original filename
-                file_extension = Path(file.path).suffix
-                # Create the filename with extension
-                filename_with_extension = f"{file.name}{file_extension}"
-
-                # Write the file to the ZIP with the proper extension
-                zip_file.writestr(filename_with_extension, file_content)
+        # Open the stream of every file before the response starts, so a missing file fails the request instead
+        # of the archive. Only the chunks are read lazily, one file at a time, while the archive is sent.
+        members = []
+        for file in files:
+            file_stream = await storage_service.get_file_stream(
+                flow_id=str(current_user.id), file_name=file.path.split("/")[-1]
+            )
+            # Name the file in the ZIP with the extension of the original filename
+            members.append((f"{file.name}{Path(file.path).suffix}", file_stream))
 
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
+        async def zip_members():
+            for member in members:
+                yield member
 
         # Generate the filename with the current datetime
         current_time = datetime.now(tz=ZoneInfo("UTC")).astimezone().strftime("%Y%m%d_%H%M%S")
         filename = f"{current_time}_langflow_files.zip"
 
         return StreamingResponse(
-            zip_stream,
+            stream_zip(zip_members()),
             media_type="application/x-zip-compressed",
             headers={"Content-Disposition": f"attachment; filename={filename}"},
         )
@@ -410,7 +413,7 @@ async def download_file(
         file_name = file.path.split("/")[-1]
 
         # Get file stream
-        file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
+        file_stream = await storage_service.get_file_stream(flow_id=str(current_user.id), file_name=file_name)
 
         if file_stream is None:
             raise HTTPException(status_code=404, detail="File stream not available")
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import pandas as pd
+from langchain_community.utilities import SQLDatabase
+from loguru import logger
+from sqlalchemy import create_engine, literal_column, select, text
+
+from axie_studio.schema.dataframe import DataFrame
+from axie_studio.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.sql import Executable
+
+# Whitespace and comments are skipped, while quoted strings and identifiers are kept as a single token
+SQL_TOKEN_PATTERN = re.compile(
+    r"""(?P<skip>\s+|--[^\n]*|/\*.*?\*/)|(?P<quoted>'(?:[^']|'')*'|"(?:[^"]|"")*"|`[^`]*`|\[[^\]]*\])|(?P<word>\w+)|.""",
+    re.DOTALL,
+)
+# Only plain queries can be wrapped in a subquery to push the row limit down to the database
+SELECT_VERBS = {"select", "values"}
+# Clauses that end the list of tables of a FROM
+FROM_END_KEYWORDS = {"where", "group", "having", "window", "order", "limit", "offset", "fetch", "for"}
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class CachedDatabase(NamedTuple):
+    database: SQLDatabase
+    reflected_at: float
+
+
+def _sql_tokens(query: str) -> list[str]:
+    tokens = []
+    for match in SQL_TOKEN_PATTERN.finditer(query):
+        if match.lastgroup == "skip":
+            continue
+        tokens.append("?" if match.lastgroup == "quoted" else match.group().lower())
+    return tokens
+
+
+def _skip_parentheses(tokens: list[str], start: int) -> int:
+    """Returns the index of the token after the parenthesized group opened at `start`."""
+    depth = 0
+    for i in range(start, len(tokens)):
+        if tokens[i] == "(":
+            depth += 1
+        elif tokens[i] == ")":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return len(tokens)
+
+
+def _is_select(tokens: list[str]) -> bool:
+    i = 0
+    while i < len(tokens) and tokens[i] == "(":
+        i += 1
+    if i < len(tokens) and tokens[i] == "with":
+        i += 1
+        if i < len(tokens) and tokens[i] == "recursive":
+            i += 1
+        while i < len(tokens):
+            # name [(columns)] AS [NOT] [MATERIALIZED] (query)
+            i += 1
+            if i < len(tokens) and tokens[i] == "(":
+                i = _skip_parentheses(tokens, i)
+            if i >= len(tokens) or tokens[i] != "as":
+                return False
+            i += 1
+            if i < len(tokens) and tokens[i] == "not":
+                i += 1
+            if i < len(tokens) and tokens[i] == "materialized":
+                i += 1
+            if i >= len(tokens) or tokens[i] != "(":
+                return False
+            end = _skip_parentheses(tokens, i)
+            # A data-modifying query in a CTE can't be wrapped in a subquery either
+            if not _is_select(tokens[i + 1 : end - 1]):
+                return False
+            i = end
+            if i >= len(tokens) or tokens[i] != ",":
+                break
+            i += 1
+        while i < len(tokens) and tokens[i] == "(":
+            i += 1
+    return i < len(tokens) and tokens[i] in SELECT_VERBS
+
+
+def is_select_query(query: str) -> bool:
+    """Returns whether the top-level statement of a query is a `SELECT` (or `VALUES`), including its CTEs.
+
+    `WITH` queries whose main statement or any CTE is an `INSERT`, `UPDATE`, `DELETE`... are not.
+    """
+    return _is_select(_sql_tokens(query))
+
+
+def _can_wrap(tokens: list[str]) -> bool:
+    """Returns whether a select query returns the same rows once wrapped in a subquery.
+
+    The outer query doesn't have to keep the order of an `ORDER BY`, which SQL Server rejects in a subquery
+    anyway, and joins or lists of tables can return several columns with the same name, which MySQL and SQL
+    Server reject in a subquery.
+    """
+    while tokens and tokens[0] == "(" and _skip_parentheses(tokens, 0) == len(tokens):
+        tokens = tokens[1:-1]
+    in_from = False
+    i = 0
+    while i < len(tokens):
+        word = tokens[i]
+        if word == "(":
+            i = _skip_parentheses(tokens, i)
+            continue
+        if word == "join" or (word == "order" and tokens[i + 1 : i + 2] == ["by"]):
+            return False
+        if word == "from":
+            in_from = True
+        elif word in FROM_END_KEYWORDS or word in SELECT_VERBS:
+            in_from = False
+        elif word == "," and in_from:
+            return False
+        i += 1
+    return True
+
+
+def limit_query(query: str, max_rows: int) -> str | Executable:
+    """Returns the query with a row limit the database enforces, if `max_rows` is positive.
+
+    The query is wrapped in a subquery selected with the limit clause of the database dialect (`LIMIT`,
+    `TOP`, `FETCH FIRST`...). Statements that can't be wrapped, like `SHOW` or `PRAGMA`, and queries that
+    could return other rows once wrapped, like the ones with an `ORDER BY` or a join, are returned as is:
+    `SQLEngineRegistry.iter_dataframes` stops fetching their rows at the limit instead.
+    """
+    tokens = _sql_tokens(query)
+    if max_rows <= 0 or not _is_select(tokens) or not _can_wrap(tokens):
+        return query
+    subquery = text(query.strip().rstrip(";")).columns().subquery("limited_query")
+    return select(literal_column("*")).select_from(subquery).limit(max_rows)
+
+
+class SQLEngineRegistry:
+    """A per-worker registry of SQLAlchemy engines, shared by every SQL component using the same database.
+
+    Creating an engine for each component run opened new connections and reflected the database schema
+    again on every query. Engines are now kept by database URL, so queries reuse the connections of their
+    pool (checked with a ping before use), and the `SQLDatabase` wrapping an engine is rebuilt, reflecting
+    the schema again, only once it is older than the `sql_schema_cache_ttl` setting.
+    """
+
+    def __init__(self) -> None:
+        self._engines: dict[str, Engine] = {}
+        self._databases: dict[str, CachedDatabase] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _create_engine(database_url: str) -> Engine:
+        settings = get_settings_service().settings
+        try:
+            return create_engine(
+                database_url,
+                pool_pre_ping=True,
+                pool_size=settings.sql_engine_pool_size,
+                max_overflow=settings.sql_engine_max_overflow,
+            )
+        except TypeError:
+            # The pool of some dialects, like in-memory SQLite, doesn't take a size
+            return create_engine(database_url, pool_pre_ping=True)
+
+    def get_engine(self, database_url: str) -> Engine:
+        with self._lock:
+            engine = self._engines.get(database_url)
+            if engine is None:
+                engine = self._create_engine(database_url)
+                self._engines[database_url] = engine
+            return engine
+
+    def get_database(self, database_url: str) -> SQLDatabase:
+        """Returns the `SQLDatabase` of `database_url`, reflecting its schema again if it expired."""
+        ttl = get_settings_service().settings.sql_schema_cache_ttl
+        with self._lock:
+            cached = self._databases.get(database_url)
+        if cached is not None and time.monotonic() - cached.reflected_at < ttl:
+            return cached.database
+
+        database = SQLDatabase(self.get_engine(database_url))
+        with self._lock:
+            self._databases[database_url] = CachedDatabase(database, time.monotonic())
+        return database
+
+    def invalidate(self, database_url: str) -> None:
+        """Disposes of the engine of `database_url` and forgets its schema."""
+        with self._lock:
+            self._databases.pop(database_url, None)
+            engine = self._engines.pop(database_url, None)
+        if engine is not None:
+            engine.dispose()
+
+    def dispose(self) -> None:
+        """Closes the connections of every engine."""
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+            self._databases.clear()
+        for engine in engines:
+            engine.dispose()
+
+    def iter_dataframes(
+        self,
+        database_url: str,
+        query: str,
+        *,
+        max_rows: int = 0,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[DataFrame]:
+        """Runs a query and yields its rows in DataFrames of at most `chunk_size` rows.
+
+        Rows are streamed from a server-side cursor where the driver supports it, so large results are never
+        held in memory at once. If `max_rows` is positive, at most that many rows are returned: the database
+        applies the limit when the query can be wrapped with it, and the rows are cut here otherwise.
+        """
+        statement = limit_query(query, max_rows)
+        if isinstance(statement, str):
+            statement = text(statement)
+        remaining = max_rows if max_rows > 0 else None
+        with self.get_engine(database_url).connect() as connection:
+            result = connection.execution_options(stream_results=True, max_row_buffer=chunk_size).execute(statement)
+            if result.returns_rows:
+                columns = list(result.keys())
+                for rows in result.partitions(chunk_size):
+                    if remaining is not None:
+                        # Statements that couldn't be limited by the database are truncated here
+                        rows = rows[:remaining]  # noqa: PLW2901
+                        remaining -= len(rows)
+                    yield DataFrame(pd.DataFrame.from_records(rows, columns=columns))
+                    if remaining == 0:
+                        break
+                result.close()
+            # Like `SQLDatabase.run`, commit the statements that write
+            connection.commit()
+
+    def read_dataframe(self, database_url: str, query: str, *, max_rows: int = 0, **kwargs: Any) -> DataFrame:
+        """Runs a query and returns all its rows, fetched in chunks, as one DataFrame."""
+        chunks = list(self.iter_dataframes(database_url, query, max_rows=max_rows, **kwargs))
+        if not chunks:
+            return DataFrame()
+        if len(chunks) == 1:
+            return chunks[0]
+        logger.debug(f"Fetched {len(chunks)} chunks of rows")
+        return DataFrame(pd.concat(chunks, ignore_index=True))
+
+
+sql_engine_registry = SQLEngineRegistry()
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict, defaultdict
+from typing import TYPE_CHECKING, NamedTuple
+from urllib.parse import urlsplit
+
+import httpx
+from bs4 import BeautifulSoup
+from loguru import logger
+
+from axie_studio.utils.http_client import HttpResponseCache, get_http_client
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+PAGE_CACHE_MAX_SIZE = 64 * 1024 * 1024
+
+
+class FetchedPage(NamedTuple):
+    url: str
+    status_code: int
+    content_type: str
+    html: str
+
+
+class CachedPage(NamedTuple):
+    etag: str | None
+    last_modified: str | None
+    page: FetchedPage
+
+
+class PageCache:
+    """A per-worker LRU cache of fetched pages, revalidated with conditional GET requests.
+
+    Pages served with an `ETag` or `Last-Modified` header are kept, bounded by the total length of their
+    content. The next fetch of the same URL sends `If-None-Match` / `If-Modified-Since` and reuses the cached
+    page when the server answers 304 Not Modified, so unchanged pages are not downloaded again.
+
+    Pages are keyed by URL and by the request headers, like `HttpResponseCache`, so a page fetched with some
+    credentials is never served to a request made with other ones.
+    """
+
+    def __init__(self, max_size: int = PAGE_CACHE_MAX_SIZE) -> None:
+        self._pages: OrderedDict[str, CachedPage] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.total_size = 0
+
+    @staticmethod
+    def cache_key(url: str, headers: dict[str, str] | None) -> str:
+        return HttpResponseCache.cache_key(url, headers, follow_redirects=True)
+
+    def get(self, key: str) -> CachedPage | None:
+        with self._lock:
+            entry = self._pages.get(key)
+            if entry is not None:
+                self._pages.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedPage) -> None:
+        size = len(entry.page.html)
+        with self._lock:
+            if (previous := self._pages.pop(key, None)) is not None:
+                self.total_size -= len(previous.page.html)
+            if size > self.max_size:
+                return
+            while self._pages and self.total_size + size > self.max_size:
+                _, evicted = self._pages.popitem(last=False)
+                self.total_size -= len(evicted.page.html)
+            self._pages[key] = entry
+            self.total_size += size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+            self.total_size = 0
+
+
+page_cache = PageCache()
+
+
+def extract_page_data(page: FetchedPage, *, as_text: bool) -> dict[str, str]:
+    """Extracts the text (or raw HTML) and metadata of a page, like `RecursiveUrlLoader` does."""
+    soup = BeautifulSoup(page.html, "lxml")
+    description = soup.find("meta", attrs={"name": "description"})
+    html = soup.find("html")
+    title = soup.find("title")
+    return {
+        "text": soup.get_text() if as_text else page.html,
+        "url": page.url,
+        "title": title.get_text() if title else "",
+        "description": (description.get("content") if description else None) or "",
+        "content_type": page.content_type,
+        "language": (html.get("lang") if html else None) or "",
+    }
+
+
+async def fetch_page(
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    timeout: float | None = None,
+    check_response_status: bool = False,
+    cache: PageCache | None = page_cache,
+) -> FetchedPage:
+    """Fetches a page with the shared HTTP client, revalidating the cached copy if there is one."""
+    request_headers = dict(headers or {})
+    key = PageCache.cache_key(url, headers)
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None:
+        if cached.etag:
+            request_headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            request_headers["If-Modified-Since"] = cached.last_modified
+
+    response = await get_http_client().get(url, headers=request_headers, timeout=timeout, follow_redirects=True)
+    if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+        logger.debug(f"{url} was not modified, using the cached page")
+        return cached.page
+    if check_response_status:
+        response.raise_for_status()
+
+    page = FetchedPage(
+        url=url,
+        status_code=response.status_code,
+        content_type=response.headers.get("Content-Type", ""),
+        html=response.text,
+    )
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if cache is not None and response.is_success and (etag or last_modified):
+        cache.set(key, CachedPage(etag=etag, last_modified=last_modified, page=page))
+    return page
+
+
+async def fetch_pages(
+    urls: list[str],
+    *,
+    headers: dict[str, str] | None = None,
+    timeout: float | None = None,
+    check_response_status: bool = False,
+    max_per_host: int = 6,
+) -> AsyncIterator[tuple[int, FetchedPage | Exception]]:
+    """Fetches pages concurrently, yielding (index of the URL, page or error) as each page arrives.
+
+    At most `max_per_host` requests are sent to the same host at once.
+    """
+    host_semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(max_per_host))
+
+    async def _fetch(index: int, url: str) -> tuple[int, FetchedPage | Exception]:
+        async with host_semaphores[urlsplit(url).netloc]:
+            try:
+                page = await fetch_page(
+                    url, headers=headers, timeout=timeout, check_response_status=check_response_status
+                )
+            except (httpx.HTTPError, httpx.InvalidURL) as e:
+                return index, e
+        return index, page
+
+    tasks = [asyncio.create_task(_fetch(index, url)) for index, url in enumerate(urls)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import orjson
+from langchain_core.embeddings import Embeddings
+from loguru import logger
+from pydantic import SecretStr
+
+from axie_studio.services.deps import get_settings_service
+
+EMBEDDING_CACHE_FILENAME = "embedding_cache.db"
+SECRET_FIELD_MARKERS = ("key", "token", "secret", "password", "credential")
+
+
+def embeddings_identity(embeddings: Embeddings) -> str:
+    """Returns a hash of the class and settings of an embedding model, so different models never share vectors.
+
+    The settings are the plain (JSON serializable) attributes of the model. Its secrets, such as API keys,
+    are part of the hash too, so the vectors of one user's model are never served to a model built with
+    another key. The secrets are only ever stored hashed.
+    """
+    settings: dict[str, Any] = {}
+    secrets: dict[str, str] = {}
+    for name, value in sorted(vars(embeddings).items()):
+        if name.startswith("_"):
+            continue
+        if isinstance(value, SecretStr):
+            secrets[name] = value.get_secret_value()
+            continue
+        try:
+            settings[name] = orjson.loads(orjson.dumps(value))
+        except TypeError:
+            continue
+        if any(marker in name.lower() for marker in SECRET_FIELD_MARKERS):
+            secrets[name] = str(settings.pop(name))
+    model_class = type(embeddings)
+    identity = orjson.dumps(
+        {
+            "class": f"{model_class.__module__}.{model_class.__qualname__}",
+            "settings": settings,
+            "secrets": hashlib.sha256(orjson.dumps(secrets, option=orjson.OPT_SORT_KEYS)).hexdigest(),
+        },
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.sha256(identity).hexdigest()
+
+
+class EmbeddingStore:
+    """A store of embedding vectors in a local SQLite database, with an in-memory LRU front.
+
+    Vectors are stored as arrays of doubles, so cached vectors are exactly the ones the model returned.
+    The database is written in the config directory and shared by the workers of the server.
+
+    Args:
+        path: The database file. If None, vectors are only kept in memory.
+        memory_size: The maximum number of vectors kept in memory.
+    """
+
+    def __init__(self, path: Path | None, memory_size: int) -> None:
+        self.path = path
+        self.memory_size = memory_size
+        self._vectors: OrderedDict[str, list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._connection is None and self.path is not None:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("CREATE TABLE IF NOT EXISTS embedding (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+                connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not open the embedding cache {self.path}, keeping vectors in memory: {e}")
+                self.path = None
+                return None
+            self._connection = connection
+        return self._connection
+
+    def _remember(self, key: str, vector: list[float]) -> None:
+        self._vectors[key] = vector
+        self._vectors.move_to_end(key)
+        while len(self._vectors) > self.memory_size:
+            self._vectors.popitem(last=False)
+
+    def get_many(self, keys: list[str]) -> list[list[float] | None]:
+        """Returns the vector stored for each key, or None for the keys that are not in the store."""
+        with self._lock:
+            found: dict[str, list[float]] = {}
+            missing = []
+            for key in keys:
+                if (vector := self._vectors.get(key)) is not None:
+                    self._vectors.move_to_end(key)
+                    found[key] = vector
+                else:
+                    missing.append(key)
+            if missing and (connection := self._connect()) is not None:
+                unique_missing = list(dict.fromkeys(missing))
+                try:
+                    # Stay below SQLite's limit on the number of query parameters
+                    for start in range(0, len(unique_missing), 500):
+                        chunk = unique_missing[start : start + 500]
+                        rows = connection.execute(
+                            f"SELECT key, vector FROM embedding WHERE key IN ({','.join('?' * len(chunk))})",  # noqa: S608
+                            chunk,
+                        ).fetchall()
+                        for key, blob in rows:
+                            vector = array("d", blob).tolist()
+                            found[key] = vector
+                            self._remember(key, vector)
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not read the embedding cache: {e}")
+        return [found.get(key) for key in keys]
+
+    def set_many(self, vectors: dict[str, list[float]]) -> None:
+        with self._lock:
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+            if (connection := self._connect()) is None:
+                return
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO embedding (key, vector) VALUES (?, ?)",
+                        [(key, array("d", vector).tobytes()) for key, vector in vectors.items()],
+                    )
+            except sqlite3.Error as e:
+                logger.warning(f"Could not write the embedding cache: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            self._vectors.clear()
+
+
+class CachedEmbeddings(Embeddings):
+    """Wraps an embedding model to reuse the vectors of the texts it embedded before.
+
+    Vectors are keyed by the identity of the model (see `embeddings_identity`) and a hash of the text, so
+    re-indexing a document set only embeds the chunks that changed. Documents and queries are cached
+    separately, since some models embed them differently. `embed_documents` looks all the texts up at
+    once and sends only the missing ones to the model, in a single call.
+
+    Args:
+        embeddings: The embedding model.
+        store: Where vectors are cached.
+    """
+
+    def __init__(self, embeddings: Embeddings, store: EmbeddingStore) -> None:
+        self.embeddings = embeddings
+        self.store = store
+        self.identity = embeddings_identity(embeddings)
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the attributes of the wrapped model, such as `model` or `dimensions`
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def _key(self, kind: str, text: str) -> str:
+        return hashlib.sha256(f"{self.identity}\x00{kind}\x00{text}".encode()).hexdigest()
+
+    def _lookup(self, texts: list[str]) -> tuple[list[str], list[list[float] | None], list[int]]:
+        keys = [self._key("document", text) for text in texts]
+        vectors = self.store.get_many(keys)
+        # Identical texts are embedded once
+        missing: dict[str, int] = {}
+        for i, vector in enumerate(vectors):
+            if vector is None:
+                missing.setdefault(keys[i], i)
+        return keys, vectors, list(missing.values())
+
+    def _merge(
+        self, keys: list[str], vectors: list[list[float] | None], missing: list[int], new_vectors: list[list[float]]
+    ) -> list[list[float]]:
+        computed = {keys[i]: list(vector) for i, vector in zip(missing, new_vectors, strict=True)}
+        if computed:
+            self.store.set_many(computed)
+        return [vector if vector is not None else computed[keys[i]] for i, vector in enumerate(vectors)]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, vectors, missing = self._lookup(texts)
+        new_vectors = self.embeddings.embed_documents([texts[i] for i in missing]) if missing else []
+        return self._merge(keys, vectors, missing, new_vectors)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        keys, vectors, missing = await asyncio.to_thread(self._lookup, texts)
+        new_vectors = await self.embeddings.aembed_documents([texts[i] for i in missing]) if missing else []
+        return await asyncio.to_thread(self._merge, keys, vectors, missing, new_vectors)
+
+    def embed_query(self, text: str) -> list[float]:
+        key = self._key("query", text)
+        if (vector := self.store.get_many([key])[0]) is not None:
+            return vector
+        vector = list(self.embeddings.embed_query(text))
+        self.store.set_many({key: vector})
+        return vector
+
+    async def aembed_query(self, text: str) -> list[float]:
+        key = self._key("query", text)
+        if (vector := (await asyncio.to_thread(self.store.get_many, [key]))[0]) is not None:
+            return vector
+        vector = list(await self.embeddings.aembed_query(text))
+        await asyncio.to_thread(self.store.set_many, {key: vector})
+        return vector
+
+
+_embedding_store: EmbeddingStore | None = None
+_embedding_store_lock = threading.Lock()
+
+
+def get_embedding_store() -> EmbeddingStore:
+    """Returns the embedding store of this worker, stored in the config directory."""
+    global _embedding_store  # noqa: PLW0603
+    with _embedding_store_lock:
+        if _embedding_store is None:
+            settings = get_settings_service().settings
+            path = Path(settings.config_dir) / EMBEDDING_CACHE_FILENAME if settings.config_dir else None
+            _embedding_store = EmbeddingStore(path, settings.embedding_cache_memory_size)
+        return _embedding_store
+
+
+def cache_embeddings(embeddings: Embeddings) -> Embeddings:
+    """Wraps an embedding model with the embedding cache if the `embedding_cache_enabled` setting is on."""
+    if not get_settings_service().settings.embedding_cache_enabled or isinstance(embeddings, CachedEmbeddings):
+        return embeddings
+    if not isinstance(embeddings, Embeddings):
+        return embeddings
+    return CachedEmbeddings(embeddings, get_embedding_store())
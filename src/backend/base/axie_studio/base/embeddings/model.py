@@ -1,3 +1,6 @@
+from functools import wraps
+
+from axie_studio.base.embeddings.cache import cache_embeddings
 from axie_studio.custom.custom_component.component import Component
 from axie_studio.field_typing import Embeddings
 from axie_studio.io import Output
@@ -10,6 +13,20 @@ class LCEmbeddingsModel(Component):
         Output(display_name="Embedding Model", name="embeddings", method="build_embeddings"),
     ]
 
+    def __init_subclass__(cls, **kwargs):
+        """Wraps the embeddings built by subclasses with the embedding cache, when it is enabled."""
+        super().__init_subclass__(**kwargs)
+        method = cls.__dict__.get("build_embeddings")
+        if method is None or getattr(method, "is_embedding_cache_wrapped", False):
+            return
+
+        @wraps(method)
+        def build_embeddings(self, *args, **kwargs):
+            return cache_embeddings(method(self, *args, **kwargs))
+
+        build_embeddings.is_embedding_cache_wrapped = True
+        cls.build_embeddings = build_embeddings
+
     def _validate_outputs(self) -> None:
         required_output_methods = ["build_embeddings"]
         output_names = [output.name for output in self.outputs]
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
+from uuid import UUID
+
+from loguru import logger
+from sqlmodel import col, select
+
+from axie_studio.base.mcp.util import sanitize_mcp_name
+from axie_studio.helpers.flow import json_schema_from_flow
+from axie_studio.services.database.models.flow.model import Flow
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+@lru_cache(maxsize=4096)
+def cached_sanitize_mcp_name(name: str) -> str:
+    """Memoized `sanitize_mcp_name`, tool names are resolved from the same flow names over and over."""
+    return sanitize_mcp_name(name)
+
+
+class FlowToolInfo(NamedTuple):
+    """The columns of a flow needed to describe it as an MCP tool, without its data."""
+
+    id: UUID
+    user_id: UUID | None
+    folder_id: UUID | None
+    name: str
+    description: str | None
+    action_name: str | None
+    action_description: str | None
+    updated_at: datetime | None
+
+    @property
+    def tool_name(self) -> str:
+        """The sanitized flow name."""
+        return cached_sanitize_mcp_name(self.name)
+
+    @property
+    def action_tool_name(self) -> str:
+        """The sanitized action name, falling back to the sanitized flow name."""
+        return cached_sanitize_mcp_name(self.action_name) if self.action_name else self.tool_name
+
+
+FLOW_TOOL_COLUMNS = (
+    Flow.id,
+    Flow.user_id,
+    Flow.folder_id,
+    Flow.name,
+    Flow.description,
+    Flow.action_name,
+    Flow.action_description,
+    Flow.updated_at,
+)
+
+
+class MCPToolRegistry:
+    """A per-worker registry of the MCP tools built from flows.
+
+    Describing a flow as a tool only needs a few columns of the flow table, but its input schema is built
+    from the flow data with a full `Graph`. The registry keeps the input schema of each flow version
+    (flow id and `updated_at`), so listing the tools of a project only loads and parses the flows that
+    changed since the last listing. Tool names are resolved to flows from a map of the tool names of each
+    user, loading the data of the matching flow only.
+
+    Input schemas are dropped when a flow is updated or deleted, and the least recently used ones are evicted
+    beyond `max_size` flows, or users for the tool names.
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self._schemas: OrderedDict[UUID, tuple[datetime | None, dict[str, Any]]] = OrderedDict()
+        self._tool_names: OrderedDict[tuple[UUID, bool], dict[str, UUID]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = max_size
+
+    def get_input_schema(self, flow_id: UUID, updated_at: datetime | None) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._schemas.get(flow_id)
+            if entry is None or entry[0] != updated_at:
+                return None
+            self._schemas.move_to_end(flow_id)
+            return entry[1]
+
+    def set_input_schema(self, flow_id: UUID, updated_at: datetime | None, schema: dict[str, Any]) -> None:
+        with self._lock:
+            self._schemas[flow_id] = (updated_at, schema)
+            self._schemas.move_to_end(flow_id)
+            while len(self._schemas) > self.max_size:
+                self._schemas.popitem(last=False)
+
+    def invalidate(self, flow_id: UUID | str) -> None:
+        """Removes the input schema of the given flow."""
+        with self._lock:
+            self._schemas.pop(UUID(str(flow_id)), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._schemas.clear()
+            self._tool_names.clear()
+
+    @staticmethod
+    async def list_flows(
+        session: AsyncSession,
+        *,
+        project_id: UUID | None = None,
+        mcp_enabled_only: bool = False,
+    ) -> list[FlowToolInfo]:
+        """Lists the flows exposed as tools, in a project if `project_id` is given, without their data."""
+        stmt = select(*FLOW_TOOL_COLUMNS)
+        if project_id:
+            stmt = stmt.where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+            if mcp_enabled_only:
+                stmt = stmt.where(Flow.mcp_enabled == True)  # noqa: E712
+        return [FlowToolInfo(*row) for row in (await session.exec(stmt)).all()]
+
+    async def get_input_schemas(self, session: AsyncSession, flows: list[FlowToolInfo]) -> dict[UUID, dict[str, Any]]:
+        """Returns the input schema of each flow, building the missing ones from the flow data.
+
+        Flows whose schema can't be built are left out of the result.
+        """
+        schemas: dict[UUID, dict[str, Any]] = {}
+        missing: dict[UUID, FlowToolInfo] = {}
+        for flow in flows:
+            schema = self.get_input_schema(flow.id, flow.updated_at)
+            if schema is None:
+                missing[flow.id] = flow
+            else:
+                schemas[flow.id] = schema
+        if not missing:
+            return schemas
+
+        for db_flow in (await session.exec(select(Flow).where(col(Flow.id).in_(list(missing))))).all():
+            try:
+                schema = json_schema_from_flow(db_flow)
+            except Exception as e:  # noqa: BLE001
+                logger.warning(f"Error in building the input schema of flow {db_flow.id}: {e!s}")
+                continue
+            # Key the schema by the listed version, the flow may have changed in between
+            self.set_input_schema(db_flow.id, missing[db_flow.id].updated_at, schema)
+            schemas[db_flow.id] = schema
+        return schemas
+
+    async def find_flow(
+        self,
+        session: AsyncSession,
+        tool_name: str,
+        user_id: UUID | str,
+        *,
+        is_action: bool | None = None,
+    ) -> Flow | None:
+        """Returns the flow of `user_id` exposed as the tool named `tool_name`, like `get_flow_snake_case`.
+
+        The flow id is looked up in the tool names of the user, which are only listed again when the flow
+        they point to no longer matches, for instance after it was renamed or deleted, or when no flow has
+        that name yet.
+        """
+        uuid_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
+        key = (uuid_user_id, bool(is_action))
+        with self._lock:
+            names = self._tool_names.get(key)
+            flow_id = names.get(tool_name) if names is not None else None
+            if names is not None:
+                self._tool_names.move_to_end(key)
+        if flow_id is not None:
+            flow = await session.get(Flow, flow_id)
+            if flow is not None and self._is_tool(flow, tool_name, uuid_user_id, is_action=is_action):
+                return flow
+
+        names = await self._list_tool_names(session, uuid_user_id, is_action=is_action)
+        with self._lock:
+            self._tool_names[key] = names
+            self._tool_names.move_to_end(key)
+            while len(self._tool_names) > self.max_size:
+                self._tool_names.popitem(last=False)
+        flow_id = names.get(tool_name)
+        return await session.get(Flow, flow_id) if flow_id is not None else None
+
+    @staticmethod
+    def _is_tool(flow: Flow, tool_name: str, user_id: UUID, *, is_action: bool | None) -> bool:
+        if flow.user_id != user_id or flow.is_component:
+            return False
+        if is_action and flow.action_name:
+            return cached_sanitize_mcp_name(flow.action_name) == tool_name
+        return cached_sanitize_mcp_name(flow.name) == tool_name
+
+    @staticmethod
+    async def _list_tool_names(session: AsyncSession, user_id: UUID, *, is_action: bool | None) -> dict[str, UUID]:
+        """Maps the tool names of the flows of `user_id` to their ids, keeping the first flow of each name."""
+        stmt = select(*FLOW_TOOL_COLUMNS).where(Flow.user_id == user_id).where(Flow.is_component == False)  # noqa: E712
+        names: dict[str, UUID] = {}
+        for row in (await session.exec(stmt)).all():
+            flow = FlowToolInfo(*row)
+            names.setdefault(flow.action_tool_name if is_action else flow.tool_name, flow.id)
+        return names
+
+
+mcp_tool_registry = MCPToolRegistry()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
+
+from loguru import logger
+
+from axie_studio.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+T = TypeVar("T")
+
+BYTES_PER_MB = 1024 * 1024
+
+
+class CachedIndex(NamedTuple):
+    stamp: tuple
+    value: Any
+    size: int
+
+
+def files_stamp(*paths: Path) -> tuple[tuple[int, int], ...]:
+    """Returns the modification time and size of each file, used to tell whether an index changed on disk."""
+    stamps = []
+    for path in paths:
+        stat = path.stat()
+        stamps.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamps)
+
+
+class VectorIndexCache:
+    """A per-worker LRU cache of vector indexes loaded from disk, shared by every run of every flow.
+
+    Vector store components used to read their index from the persist directory on each search. Indexes
+    are cached by a key (the store kind, persist directory and index name) along with a stamp of their
+    files, usually their modification times and sizes, so an index written since it was cached is loaded
+    again on the next search.
+
+    The cache is bounded by the approximate size of the indexes it holds, evicting the least recently used
+    ones first. The bound is read from the `vector_index_cache_max_size` setting, in MB; 0 disables the
+    cache.
+    """
+
+    def __init__(self, max_size: int | None = None) -> None:
+        self._indexes: OrderedDict[tuple, CachedIndex] = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: dict[tuple, threading.Lock] = {}
+        self._max_size = max_size
+        self.total_size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        """The maximum size of the cached indexes, in bytes."""
+        if self._max_size is not None:
+            return self._max_size
+        return get_settings_service().settings.vector_index_cache_max_size * BYTES_PER_MB
+
+    def _get(self, key: tuple, stamp: tuple) -> CachedIndex | None:
+        with self._lock:
+            entry = self._indexes.get(key)
+            if entry is None or entry.stamp != stamp:
+                self.misses += 1
+                return None
+            self._indexes.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _set(self, key: tuple, entry: CachedIndex) -> None:
+        max_size = self.max_size
+        with self._lock:
+            if (previous := self._indexes.pop(key, None)) is not None:
+                self.total_size -= previous.size
+            if entry.size > max_size:
+                return
+            while self._indexes and self.total_size + entry.size > max_size:
+                evicted_key, evicted = self._indexes.popitem(last=False)
+                self._load_locks.pop(evicted_key, None)
+                self.total_size -= evicted.size
+            self._indexes[key] = entry
+            self.total_size += entry.size
+
+    def get_or_load(self, key: tuple, stamp: tuple, loader: Callable[[], T], *, size: int) -> T:
+        """Returns the index cached for `key` and `stamp`, loading it with `loader` if needed.
+
+        Concurrent calls for the same key wait for a single load.
+
+        Args:
+            key: The key of the index.
+            stamp: The state of the index files, an index cached with another stamp is loaded again.
+            loader: Loads the index.
+            size: The approximate size of the index in memory, in bytes.
+        """
+        if self.max_size <= 0:
+            return loader()
+        if (entry := self._get(key, stamp)) is not None:
+            return entry.value
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            # Another thread may have loaded the index while this one was waiting
+            with self._lock:
+                entry = self._indexes.get(key)
+            if entry is not None and entry.stamp == stamp:
+                return entry.value
+            try:
+                value = loader()
+                self._set(key, CachedIndex(stamp=stamp, value=value, size=size))
+                logger.debug(f"Loaded vector index {key} ({size / BYTES_PER_MB:.1f} MB)")
+            finally:
+                # Only the keys of cached indexes keep their lock, so that the locks don't pile up
+                with self._lock:
+                    if key not in self._indexes:
+                        self._load_locks.pop(key, None)
+        return value
+
+    def invalidate(self, *key_prefix: Any) -> None:
+        """Removes the indexes whose key starts with `key_prefix`."""
+        with self._lock:
+            for key in [k for k in self._indexes if k[: len(key_prefix)] == key_prefix]:
+                self.total_size -= self._indexes.pop(key).size
+                self._load_locks.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+            self._load_locks.clear()
+            self.total_size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+
+vector_index_cache = VectorIndexCache()
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import re
 import tempfile
@@ -28,6 +29,7 @@ from axie_studio.schema.data import Data
 from axie_studio.schema.dotdict import dotdict
 from axie_studio.services.deps import get_settings_service
 from axie_studio.utils.component_utils import set_current_fields, set_field_advanced, set_field_display
+from axie_studio.utils.http_client import HttpResponseCache, get_http_client, http_response_cache
 
 # Define fields for each mode
 MODE_FIELDS = {
@@ -167,6 +169,33 @@ class APIRequestComponent(Component):
             ),
             advanced=True,
         ),
+        BoolInput(
+            name="cache_responses",
+            display_name="Cache Responses",
+            value=False,
+            info=(
+                "Cache GET responses as allowed by their Cache-Control, Expires, ETag and Last-Modified headers, "
+                "and revalidate stale ones instead of downloading them again."
+            ),
+            advanced=True,
+        ),
+        MessageTextInput(
+            name="batch_urls",
+            display_name="Batch URLs",
+            info=(
+                "More URLs to request with the same method, headers and body. When set, the API Response output "
+                "holds one response per URL under 'responses'."
+            ),
+            is_list=True,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            value=5,
+            info="The maximum number of batch requests sent at once.",
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -291,6 +320,7 @@ class APIRequestComponent(Component):
         follow_redirects: bool = True,
         save_to_file: bool = False,
         include_httpx_metadata: bool = False,
+        cache: HttpResponseCache | None = None,
     ) -> Data:
         method = method.upper()
         if method not in {"GET", "POST", "PATCH", "PUT", "DELETE"}:
@@ -301,16 +331,21 @@ class APIRequestComponent(Component):
         redirection_history = []
 
         try:
-            # Prepare request parameters
-            request_params = {
-                "method": method,
-                "url": url,
-                "headers": headers,
-                "json": processed_body,
-                "timeout": timeout,
-                "follow_redirects": follow_redirects,
-            }
-            response = await client.request(**request_params)
+            if cache is not None and method == "GET" and not processed_body:
+                response = await cache.get(
+                    client, url, headers=headers, timeout=timeout, follow_redirects=follow_redirects
+                )
+            else:
+                # Prepare request parameters
+                request_params = {
+                    "method": method,
+                    "url": url,
+                    "headers": headers,
+                    "json": processed_body,
+                    "timeout": timeout,
+                    "follow_redirects": follow_redirects,
+                }
+                response = await client.request(**request_params)
 
             redirection_history = [
                 {
@@ -404,21 +439,9 @@ class APIRequestComponent(Component):
             return {item["key"]: item["value"] for item in headers if self._is_valid_key_value_item(item)}
         return {}
 
-    async def make_api_request(self) -> Data:
-        """Make HTTP request with optimized parameter handling."""
-        method = self.method
-        url = self.url_input.strip() if isinstance(self.url_input, str) else ""
-        headers = self.headers or {}
-        body = self.body or {}
-        timeout = self.timeout
-        follow_redirects = self.follow_redirects
-        save_to_file = self.save_to_file
-        include_httpx_metadata = self.include_httpx_metadata
-
-        # if self.mode == "cURL" and self.curl_input:
-        #     self._build_config = self.parse_curl(self.curl_input, dotdict())
-        #     # After parsing curl, get the normalized URL
-        #     url = self._build_config["url_input"]["value"]
+    def _prepare_url(self, url: Any, query_params: dict) -> str:
+        """Normalize and validate a URL, then add the query parameters to it."""
+        url = url.strip() if isinstance(url, str) else ""
 
         # Normalize URL before validation
         url = self._normalize_url(url)
@@ -428,32 +451,58 @@ class APIRequestComponent(Component):
             msg = f"Invalid URL provided: {url}"
             raise ValueError(msg)
 
-        # Process query parameters
+        return self.add_query_params(url, query_params)
+
+    def _query_params(self) -> dict:
+        """Process the query parameters input into a dictionary."""
         if isinstance(self.query_params, str):
-            query_params = dict(parse_qsl(self.query_params))
-        else:
-            query_params = self.query_params.data if self.query_params else {}
-
-        # Process headers and body
-        headers = self._process_headers(headers)
-        body = self._process_body(body)
-        url = self.add_query_params(url, query_params)
-
-        async with httpx.AsyncClient() as client:
-            result = await self.make_request(
-                client,
-                method,
-                url,
-                headers,
-                body,
-                timeout,
-                follow_redirects=follow_redirects,
-                save_to_file=save_to_file,
-                include_httpx_metadata=include_httpx_metadata,
+            return dict(parse_qsl(self.query_params))
+        return self.query_params.data if self.query_params else {}
+
+    async def _send(self, url: str) -> Data:
+        """Send the configured request to `url` with the shared HTTP client."""
+        return await self.make_request(
+            get_http_client(),
+            self.method,
+            url,
+            self._process_headers(self.headers or {}),
+            self._process_body(self.body or {}),
+            self.timeout,
+            follow_redirects=self.follow_redirects,
+            save_to_file=self.save_to_file,
+            include_httpx_metadata=self.include_httpx_metadata,
+            cache=http_response_cache if self.cache_responses else None,
+        )
+
+    async def make_api_request(self) -> Data:
+        """Make HTTP request with optimized parameter handling."""
+        # if self.mode == "cURL" and self.curl_input:
+        #     self._build_config = self.parse_curl(self.curl_input, dotdict())
+        #     # After parsing curl, get the normalized URL
+        #     url = self._build_config["url_input"]["value"]
+
+        query_params = self._query_params()
+        if any(isinstance(url, str) and url.strip() for url in self.batch_urls or []):
+            urls = [self.url_input, *self.batch_urls]
+            result = await self._send_batch(
+                [self._prepare_url(url, query_params) for url in urls if isinstance(url, str) and url.strip()]
             )
+        else:
+            result = await self._send(self._prepare_url(self.url_input, query_params))
         self.status = result
         return result
 
+    async def _send_batch(self, urls: list[str]) -> Data:
+        """Send the request to each URL concurrently, one response per URL in their order."""
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency or 1))
+
+        async def _bounded_send(url: str) -> Data:
+            async with semaphore:
+                return await self._send(url)
+
+        results = await asyncio.gather(*(_bounded_send(url) for url in urls))
+        return Data(data={"responses": [result.data for result in results]})
+
     def update_build_config(self, build_config: dotdict, field_value: Any, field_name: str | None = None) -> dotdict:
         """Update the build config based on the selected mode."""
         if field_name != "mode":
@@ -1,19 +1,18 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
-from langchain_community.utilities import SQLDatabase
 from sqlalchemy.exc import SQLAlchemyError
 
-from axie_studio.custom.custom_component.component_with_cache import ComponentWithCache
-from axie_studio.io import BoolInput, MessageTextInput, MultilineInput, Output
+from axie_studio.base.data.sql_engines import limit_query, sql_engine_registry
+from axie_studio.custom.custom_component.component import Component
+from axie_studio.io import BoolInput, IntInput, MessageTextInput, MultilineInput, Output
 from axie_studio.schema.dataframe import DataFrame
 from axie_studio.schema.message import Message
-from axie_studio.services.cache.utils import CacheMiss
 
 if TYPE_CHECKING:
-    from sqlalchemy.engine import Result
+    from langchain_community.utilities import SQLDatabase
 
 
-class SQLComponent(ComponentWithCache):
+class SQLComponent(Component):
     """A sql component."""
 
     display_name = "SQL Database"
@@ -29,17 +28,11 @@ class SQLComponent(ComponentWithCache):
 
     def maybe_create_db(self):
         if self.database_url != "":
-            cached_db = self._shared_component_cache.get(self.database_url)
-            if not isinstance(cached_db, CacheMiss):
-                self.db = cached_db
-                return
-            self.log("Connecting to database")
             try:
-                self.db = SQLDatabase.from_uri(self.database_url)
+                self.db = sql_engine_registry.get_database(self.database_url)
             except Exception as e:
                 msg = f"An error occurred while connecting to the database: {e}"
                 raise ValueError(msg) from e
-            self._shared_component_cache.set(self.database_url, self.db)
 
     inputs = [
         MessageTextInput(name="database_url", display_name="Database URL", required=True),
@@ -53,6 +46,16 @@ class SQLComponent(ComponentWithCache):
             info="If True, the error will be added to the result",
             advanced=True,
         ),
+        IntInput(
+            name="max_rows",
+            display_name="Max Rows",
+            value=0,
+            info=(
+                "The maximum number of rows returned for a query. 0 means no limit. Queries with an ORDER BY or a "
+                "join are not limited by the database, their rows are cut once fetched."
+            ),
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -65,7 +68,7 @@ class SQLComponent(ComponentWithCache):
         error = None
         self.maybe_create_db()
         try:
-            result = self.db.run(self.query, include_columns=self.include_columns)
+            result = self.db.run(limit_query(self.query, self.max_rows), include_columns=self.include_columns)
             self.status = result
         except SQLAlchemyError as e:
             msg = f"An error occurred while running the SQL Query: {e}"
@@ -82,18 +85,16 @@ class SQLComponent(ComponentWithCache):
 
         return Message(text=result)
 
-    def __execute_query(self) -> list[dict[str, Any]]:
+    def __execute_query(self) -> DataFrame:
         self.maybe_create_db()
         try:
-            cursor: Result[Any] = self.db.run(self.query, fetch="cursor")
-            return [x._asdict() for x in cursor.fetchall()]
+            return sql_engine_registry.read_dataframe(self.database_url, self.query, max_rows=self.max_rows)
         except SQLAlchemyError as e:
             msg = f"An error occurred while running the SQL Query: {e}"
             self.log(msg)
             raise ValueError(msg) from e
 
     def run_sql_query(self) -> DataFrame:
-        result = self.__execute_query()
-        df_result = DataFrame(result)
+        df_result = self.__execute_query()
         self.status = df_result
         return df_result
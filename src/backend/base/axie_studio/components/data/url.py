@@ -1,3 +1,4 @@
+import asyncio
 import re
 
 import requests
@@ -5,6 +6,7 @@ from bs4 import BeautifulSoup
 from langchain_community.document_loaders import RecursiveUrlLoader
 from loguru import logger
 
+from axie_studio.base.data.url_fetcher import extract_page_data, fetch_pages
 from axie_studio.custom.custom_component.component import Component
 from axie_studio.field_typing.range_spec import RangeSpec
 from axie_studio.helpers.data import safe_convert
@@ -203,6 +205,9 @@ class URLComponent(Component):
 
         return url
 
+    def _get_headers(self) -> dict[str, str]:
+        return {header["key"]: header["value"] for header in self.headers}
+
     def _create_loader(self, url: str) -> RecursiveUrlLoader:
         """Creates a RecursiveUrlLoader instance with the configured settings.
 
@@ -212,7 +217,6 @@ class URLComponent(Component):
         Returns:
             RecursiveUrlLoader: Configured loader instance
         """
-        headers_dict = {header["key"]: header["value"] for header in self.headers}
         extractor = (lambda x: x) if self.format == "HTML" else (lambda x: BeautifulSoup(x, "lxml").get_text())
 
         return RecursiveUrlLoader(
@@ -222,7 +226,7 @@ class URLComponent(Component):
             use_async=self.use_async,
             extractor=extractor,
             timeout=self.timeout,
-            headers=headers_dict,
+            headers=self._get_headers(),
             check_response_status=self.check_response_status,
             continue_on_failure=self.continue_on_failure,
             base_url=url,  # Add base_url to ensure consistent domain crawling
@@ -231,9 +235,64 @@ class URLComponent(Component):
             link_regex=None,  # Allow customization of link filtering
         )
 
-    def fetch_url_contents(self) -> list[dict]:
+    async def _fetch_pages(self, urls: list[str]) -> list[dict]:
+        """Fetches the URLs concurrently, extracting the content of each page as soon as it arrives.
+
+        Returns:
+            list[dict]: The content of the pages that could be fetched, in the order of the URLs
+        """
+        pages: dict[int, dict] = {}
+        async for index, page in fetch_pages(
+            urls,
+            headers=self._get_headers(),
+            timeout=self.timeout,
+            check_response_status=self.check_response_status,
+            max_per_host=get_settings_service().settings.http_client_max_connections_per_host,
+        ):
+            if isinstance(page, Exception):
+                if not self.continue_on_failure:
+                    raise page
+                logger.warning(f"Error loading documents from {urls[index]}: {page}")
+                continue
+            pages[index] = await asyncio.to_thread(extract_page_data, page, as_text=self.format != "HTML")
+            logger.debug(f"Loaded {urls[index]}")
+        return [pages[index] for index in sorted(pages)]
+
+    async def _crawl(self, urls: list[str]) -> list[dict]:
+        """Crawls the URLs recursively, running one loader per URL concurrently."""
+
+        async def _load(url: str) -> list:
+            logger.debug(f"Loading documents from {url}")
+            try:
+                docs = await asyncio.to_thread(self._create_loader(url).load)
+            except requests.exceptions.RequestException as e:
+                logger.exception(f"Error loading documents from {url}: {e}")
+                return []
+            if not docs:
+                logger.warning(f"No documents found for {url}")
+            else:
+                logger.debug(f"Found {len(docs)} documents from {url}")
+            return docs
+
+        all_docs = [doc for docs in await asyncio.gather(*(_load(url) for url in urls)) for doc in docs]
+        return [
+            {
+                "text": doc.page_content,
+                "url": doc.metadata.get("source", ""),
+                "title": doc.metadata.get("title", ""),
+                "description": doc.metadata.get("description", ""),
+                "content_type": doc.metadata.get("content_type", ""),
+                "language": doc.metadata.get("language", ""),
+            }
+            for doc in all_docs
+        ]
+
+    async def fetch_url_contents(self) -> list[dict]:
         """Load documents from the configured URLs.
 
+        With a depth of 1, the URLs are fetched concurrently with the shared HTTP client. Deeper crawls use
+        one RecursiveUrlLoader per URL, also run concurrently.
+
         Returns:
             List[Data]: List of Data objects containing the fetched content
 
@@ -241,47 +300,22 @@ class URLComponent(Component):
             ValueError: If no valid URLs are provided or if there's an error loading documents
         """
         try:
-            urls = list({self.ensure_url(url) for url in self.urls if url.strip()})
+            urls = list(dict.fromkeys(self.ensure_url(url) for url in self.urls if url.strip()))
             logger.debug(f"URLs: {urls}")
             if not urls:
                 msg = "No valid URLs provided."
                 raise ValueError(msg)
 
-            all_docs = []
-            for url in urls:
-                logger.debug(f"Loading documents from {url}")
-
-                try:
-                    loader = self._create_loader(url)
-                    docs = loader.load()
-
-                    if not docs:
-                        logger.warning(f"No documents found for {url}")
-                        continue
+            if self.max_depth <= 1:
+                pages = await self._fetch_pages(urls)
+            else:
+                pages = await self._crawl(urls)
 
-                    logger.debug(f"Found {len(docs)} documents from {url}")
-                    all_docs.extend(docs)
-
-                except requests.exceptions.RequestException as e:
-                    logger.exception(f"Error loading documents from {url}: {e}")
-                    continue
-
-            if not all_docs:
+            if not pages:
                 msg = "No documents were successfully loaded from any URL"
                 raise ValueError(msg)
 
-            # data = [Data(text=doc.page_content, **doc.metadata) for doc in all_docs]
-            data = [
-                {
-                    "text": safe_convert(doc.page_content, clean_data=True),
-                    "url": doc.metadata.get("source", ""),
-                    "title": doc.metadata.get("title", ""),
-                    "description": doc.metadata.get("description", ""),
-                    "content_type": doc.metadata.get("content_type", ""),
-                    "language": doc.metadata.get("language", ""),
-                }
-                for doc in all_docs
-            ]
+            data = [{**page, "text": safe_convert(page["text"], clean_data=True)} for page in pages]
         except Exception as e:
             error_msg = e.message if hasattr(e, "message") else e
             msg = f"Error loading documents: {error_msg!s}"
@@ -289,11 +323,11 @@ class URLComponent(Component):
             raise ValueError(msg) from e
         return data
 
-    def fetch_content(self) -> DataFrame:
+    async def fetch_content(self) -> DataFrame:
         """Convert the documents to a DataFrame."""
-        return DataFrame(data=self.fetch_url_contents())
+        return DataFrame(data=await self.fetch_url_contents())
 
-    def fetch_content_as_message(self) -> Message:
+    async def fetch_content_as_message(self) -> Message:
         """Convert the documents to a Message."""
-        url_contents = self.fetch_url_contents()
+        url_contents = await self.fetch_url_contents()
         return Message(text="\n\n".join([x["text"] for x in url_contents]), data={"data": url_contents})
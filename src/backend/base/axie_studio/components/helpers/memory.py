@@ -3,7 +3,7 @@ from typing import Any, cast
 from axie_studio.custom.custom_component.component import Component
 from axie_studio.helpers.data import data_to_text
 from axie_studio.inputs.inputs import DropdownInput, HandleInput, IntInput, MessageTextInput, MultilineInput, TabInput
-from axie_studio.memory import aget_messages, astore_message
+from axie_studio.memory import aget_message_history, aget_messages, astore_message
 from axie_studio.schema.data import Data
 from axie_studio.schema.dataframe import DataFrame
 from axie_studio.schema.dotdict import dotdict
@@ -208,16 +208,14 @@ class MemoryComponent(Component):
                 expected_type = MESSAGE_SENDER_AI if sender_type == MESSAGE_SENDER_AI else MESSAGE_SENDER_USER
                 stored = [m for m in stored if m.type == expected_type]
         else:
-            # For internal memory, we always fetch the last N messages by ordering by DESC
-            stored = await aget_messages(
+            # For internal memory, the last N messages are selected by the database
+            history = await aget_message_history(
+                session_id,
+                limit=n_messages or 10000,
                 sender=sender_type,
                 sender_name=sender_name,
-                session_id=session_id,
-                limit=10000,
-                order=order,
             )
-            if n_messages:
-                stored = stored[-n_messages:] if order == "ASC" else stored[:n_messages]
+            stored = history.messages if order == "ASC" else history.messages[::-1]
 
         # self.status = stored
         return cast(Data, stored)
@@ -1,7 +1,11 @@
+import pickle
 from pathlib import Path
 
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.faiss import dependable_faiss_import
+from loguru import logger
 
+from axie_studio.base.vectorstores.index_cache import files_stamp, vector_index_cache
 from axie_studio.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
 from axie_studio.helpers.data import docs_to_data
 from axie_studio.io import BoolInput, HandleInput, IntInput, StrInput
@@ -36,6 +40,14 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
             advanced=True,
             value=True,
         ),
+        BoolInput(
+            name="memory_map_index",
+            display_name="Memory-map Index",
+            info="Map the index file in memory instead of reading it, so large indexes are paged in from disk "
+            "as they are searched. Only some index types support it, others are read as usual.",
+            advanced=True,
+            value=False,
+        ),
         HandleInput(name="embedding", display_name="Embedding", input_types=["Embeddings"]),
         IntInput(
             name="number_of_results",
@@ -81,22 +93,56 @@ class FaissVectorStoreComponent(LCVectorStoreComponent):
 
         faiss = FAISS.from_documents(documents=documents, embedding=self.embedding)
         faiss.save_local(str(path), self.index_name)
+        vector_index_cache.invalidate("faiss", str(path), self.index_name)
         return faiss
 
-    def search_documents(self) -> list[Data]:
-        """Search for documents in the FAISS vector store."""
-        path = self.get_persist_directory()
-        index_path = path / f"{self.index_name}.faiss"
-
-        if not index_path.exists():
-            vector_store = self.build_vector_store()
-        else:
-            vector_store = FAISS.load_local(
+    def _read_index(self, path: Path) -> FAISS:
+        """Reads the index like `FAISS.load_local`, memory-mapping the index file if requested."""
+        if not self.memory_map_index:
+            return FAISS.load_local(
                 folder_path=str(path),
                 embeddings=self.embedding,
                 index_name=self.index_name,
                 allow_dangerous_deserialization=self.allow_dangerous_deserialization,
             )
+        faiss = dependable_faiss_import()
+        index_file = str(path / f"{self.index_name}.faiss")
+        try:
+            index = faiss.read_index(index_file, faiss.IO_FLAG_MMAP)
+        except RuntimeError as e:
+            logger.debug(f"Could not memory-map FAISS index {index_file}, reading it instead: {e}")
+            index = faiss.read_index(index_file)
+        with (path / f"{self.index_name}.pkl").open("rb") as f:
+            docstore, index_to_docstore_id = pickle.load(f)  # noqa: S301
+        return FAISS(self.embedding, index, docstore, index_to_docstore_id)
+
+    def load_vector_store(self, path: Path) -> FAISS:
+        """Returns the index stored in `path`, from the vector index cache when it didn't change on disk."""
+        if not self.allow_dangerous_deserialization:
+            msg = (
+                "Loading a FAISS index deserializes a pickle file. "
+                "Enable 'Allow Dangerous Deserialization' only if you trust the source of the index."
+            )
+            raise ValueError(msg)
+        index_path = path / f"{self.index_name}.faiss"
+        docstore_path = path / f"{self.index_name}.pkl"
+        stamp = files_stamp(index_path, docstore_path)
+        size = stamp[1][1] if self.memory_map_index else stamp[0][1] + stamp[1][1]
+        cached = vector_index_cache.get_or_load(
+            ("faiss", str(path), self.index_name, self.memory_map_index),
+            stamp,
+            lambda: self._read_index(path),
+            size=size,
+        )
+        # The index is shared, only the embeddings of this component are its own
+        return FAISS(self.embedding, cached.index, cached.docstore, cached.index_to_docstore_id)
+
+    def search_documents(self) -> list[Data]:
+        """Search for documents in the FAISS vector store."""
+        path = self.get_persist_directory()
+        index_path = path / f"{self.index_name}.faiss"
+
+        vector_store = self.load_vector_store(path) if index_path.exists() else self.build_vector_store()
 
         if not vector_store:
             msg = "Failed to load the FAISS index."
@@ -5,6 +5,7 @@ from langchain_chroma import Chroma
 from loguru import logger
 from typing_extensions import override
 
+from axie_studio.base.vectorstores.index_cache import vector_index_cache
 from axie_studio.base.vectorstores.model import LCVectorStoreComponent, check_cached_vector_store
 from axie_studio.base.vectorstores.utils import chroma_collection_to_data
 from axie_studio.inputs.inputs import MultilineInput
@@ -212,8 +213,7 @@ class LocalDBComponent(LCVectorStoreComponent):
             logger.debug(f"Using default persist directory: {persist_directory}")
 
         chroma = Chroma(
-            persist_directory=persist_directory,
-            client=None,
+            client=self.get_chroma_client(persist_directory),
             embedding_function=self.embedding,
             collection_name=self.collection_name,
         )
@@ -222,6 +222,23 @@ class LocalDBComponent(LCVectorStoreComponent):
         self.status = chroma_collection_to_data(chroma.get(limit=self.limit))
         return chroma
 
+    @staticmethod
+    def get_chroma_client(persist_directory: str):
+        """Returns a Chroma client for the directory, shared by every build through the vector index cache.
+
+        Chroma reads its storage on each query, so a client stays valid until its database file is replaced.
+        """
+        import chromadb
+
+        database_path = Path(persist_directory) / "chroma.sqlite3"
+        stamp = (database_path.stat().st_ino,) if database_path.exists() else ()
+        return vector_index_cache.get_or_load(
+            ("chroma", persist_directory),
+            stamp,
+            lambda: chromadb.PersistentClient(path=persist_directory),
+            size=0,
+        )
+
     def _add_documents_to_vector_store(self, vector_store: "Chroma") -> None:
         """Adds documents to the Vector Store."""
         ingest_data: list | Data | DataFrame = self.ingest_data
@@ -4,6 +4,7 @@ import ast
 import asyncio
 import inspect
 from collections.abc import AsyncIterator, Iterator
+from contextlib import aclosing
 from copy import deepcopy
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, get_type_hints
@@ -22,6 +23,7 @@ from axie_studio.base.tools.constants import (
     TOOLS_METADATA_INPUT_NAME,
 )
 from axie_studio.custom.tree_visitor import RequiredInputsVisitor
+from axie_studio.events.event_manager import TokenBuffer
 from axie_studio.exceptions.component import StreamingError
 from axie_studio.field_typing import Tool  # noqa: TC001 Needed by _add_toolkit_output
 
@@ -38,7 +40,7 @@ from axie_studio.schema.properties import Source
 from axie_studio.services.tracing.schema import Log
 from axie_studio.template.field.base import UNDEFINED, Input, Output
 from axie_studio.template.frontend_node.custom_components import ComponentFrontendNode
-from axie_studio.utils.async_helpers import run_until_complete
+from axie_studio.utils.async_helpers import iterate_in_thread, run_until_complete
 from axie_studio.utils.util import find_closest_match
 
 from .custom_component import CustomComponent
@@ -71,6 +73,70 @@ BACKWARDS_COMPATIBLE_ATTRIBUTES = ["user_id", "vertex", "tracing_service"]
 CONFIG_ATTRIBUTES = ["_display_name", "_description", "_icon", "_name", "_metadata"]
 
 
+_SCALAR_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def _is_flat_container(value: list | dict | set) -> bool:
+    """Returns whether a list, dict or set holds only scalars, so a shallow copy of it is independent."""
+    if isinstance(value, dict):
+        return all(isinstance(item, _SCALAR_TYPES) for item in value.values())
+    return all(isinstance(item, _SCALAR_TYPES) for item in value)
+
+
+class ComponentDescriptor:
+    """Class-level data shared by every instance of a component class, computed once per class.
+
+    Attributes:
+        inputs: The class `inputs` list the input specs were built from.
+        outputs: The class `outputs` list the output specs were built from.
+        input_specs: A private copy of each input, keyed by name, that instances copy on init.
+        output_specs: A private copy of each output, keyed by name, that instances copy on init.
+        container_fields: The names of the list, dict and set fields of each spec, keyed by spec id, with whether
+            they hold nested values and have to be deep copied.
+        return_types: The formatted return types of the output methods, filled in as they are resolved.
+        code: The source code of the module the class is defined in, once it is read.
+    """
+
+    __slots__ = ("code", "container_fields", "input_specs", "inputs", "output_specs", "outputs", "return_types")
+
+    def __init__(self, inputs: list[InputTypes], outputs: list[Output]) -> None:
+        self.inputs = inputs
+        self.outputs = outputs
+        self.input_specs: dict[str, InputTypes] = {}
+        for input_ in inputs or []:
+            try:
+                self.input_specs[input_.name] = deepcopy(input_)
+            except TypeError:
+                self.input_specs[input_.name] = input_
+        self.output_specs: dict[str, Output] = {output.name: deepcopy(output) for output in outputs or []}
+        self.container_fields: dict[int, tuple[tuple[str, bool], ...]] = {
+            id(spec): tuple(
+                (key, not _is_flat_container(value))
+                for key, value in spec.__dict__.items()
+                if isinstance(value, list | dict | set)
+            )
+            for spec in [*self.input_specs.values(), *self.output_specs.values()]
+        }
+        self.return_types: dict[str, list[str]] = {}
+        self.code: str | None = None
+
+    def copy_spec(self, spec: BaseModel) -> BaseModel:
+        """Returns a copy of an input or output spec for a component instance.
+
+        The copy shares every field value with the spec except lists, dicts and sets, which are copied so the
+        instance can modify them in place. Those holding only scalars get a shallow copy, which is much cheaper
+        than a deep copy, while nested ones, like the rows of a table, are deep copied. Other values are only
+        replaced, not modified in place, on component instances.
+        """
+        fields = spec.__dict__
+        return spec.model_copy(
+            update={
+                key: deepcopy(fields[key]) if deep else fields[key].copy()
+                for key, deep in self.container_fields[id(spec)]
+            }
+        )
+
+
 class PlaceholderGraph(NamedTuple):
     """A placeholder graph structure for components, providing backwards compatibility.
 
@@ -100,6 +166,15 @@ class Component(CustomComponent):
     selected_output: str | None = None
     code_class_base_inheritance: ClassVar[str] = "Component"
 
+    @classmethod
+    def _get_descriptor(cls) -> ComponentDescriptor:
+        """Returns the descriptor of the class, building it on first use or when inputs or outputs were replaced."""
+        descriptor = cls.__dict__.get("_component_descriptor")
+        if descriptor is None or descriptor.inputs is not cls.inputs or descriptor.outputs is not cls.outputs:
+            descriptor = ComponentDescriptor(cls.inputs, cls.outputs)
+            cls._component_descriptor = descriptor
+        return descriptor
+
     def __init__(self, **kwargs) -> None:
         # Initialize instance-specific attributes first
         if overlap := self._there_is_overlap_in_inputs_and_outputs():
@@ -344,8 +419,10 @@ class Component(CustomComponent):
                 msg = "Could not find module for class"
                 raise ValueError(msg)
 
-            class_code = inspect.getsource(module)
-            self._code = class_code
+            descriptor = self._get_descriptor()
+            if descriptor.code is None:
+                descriptor.code = inspect.getsource(module)
+            self._code = descriptor.code
         except (OSError, TypeError) as e:
             msg = f"Could not find source code for {self.__class__.__name__}"
             raise ValueError(msg) from e
@@ -467,13 +544,18 @@ class Component(CustomComponent):
                     raise ValueError(msg) from e
         else:
             outputs = self.outputs
+        descriptor = self._get_descriptor()
+        output_specs = descriptor.output_specs if outputs is descriptor.outputs else {}
         for output in outputs:
             if output.name is None:
                 msg = "Output name cannot be None."
                 raise ValueError(msg)
-            # Deepcopy is required to avoid modifying the original component;
+            # A copy is required to avoid modifying the original component;
             # allows each instance of each component to modify its own output
-            self._outputs_map[output.name] = deepcopy(output)
+            if (spec := output_specs.get(output.name)) is not None:
+                self._outputs_map[output.name] = descriptor.copy_spec(spec)
+            else:
+                self._outputs_map[output.name] = deepcopy(output)
 
     def map_inputs(self, inputs: list[InputTypes]) -> None:
         """Maps the given inputs to the component.
@@ -485,10 +567,15 @@ class Component(CustomComponent):
             ValueError: If the input name is None.
 
         """
+        descriptor = self._get_descriptor()
+        input_specs = descriptor.input_specs if inputs is descriptor.inputs else {}
         for input_ in inputs:
             if input_.name is None:
                 msg = self.build_component_error_message("Input name cannot be None")
                 raise ValueError(msg)
+            if (spec := input_specs.get(input_.name)) is not None:
+                self._inputs[input_.name] = descriptor.copy_spec(spec)
+                continue
             try:
                 self._inputs[input_.name] = deepcopy(input_)
             except TypeError:
@@ -899,12 +986,20 @@ class Component(CustomComponent):
                 raise ValueError(msg) from e
 
     def _get_method_return_type(self, method_name: str) -> list[str]:
+        # Methods set on the instance can differ from the class ones, so only class methods are cached
+        return_types = self._get_descriptor().return_types if method_name not in self.__dict__ else {}
+        if (cached := return_types.get(method_name)) is not None:
+            return list(cached)
         method = getattr(self, method_name)
         return_type = get_type_hints(method).get("return")
         if return_type is None:
-            return []
-        extracted_return_types = self._extract_return_type(return_type)
-        return [format_type(extracted_return_type) for extracted_return_type in extracted_return_types]
+            formatted = []
+        else:
+            extracted_return_types = self._extract_return_type(return_type)
+            formatted = [format_type(extracted_return_type) for extracted_return_type in extracted_return_types]
+        if method_name not in self.__dict__:
+            return_types[method_name] = formatted
+        return list(formatted)
 
     def _update_template(self, frontend_node: dict):
         return frontend_node
@@ -1570,49 +1665,84 @@ class Component(CustomComponent):
             msg = "The message must be an iterator or an async iterator."
             raise TypeError(msg)
 
-        if isinstance(iterator, AsyncIterator):
-            return await self._handle_async_iterator(iterator, message.id, message)
+        token_buffer = self._create_token_buffer(message.id)
+        chunks: list[str] = []
         try:
-            complete_message = ""
-            first_chunk = True
-            for chunk in iterator:
-                complete_message = await self._process_chunk(
-                    chunk.content, complete_message, message.id, message, first_chunk=first_chunk
-                )
-                first_chunk = False
-        except Exception as e:
-            raise StreamingError(cause=e, source=message.properties.source) from e
-        else:
-            return complete_message
+            if isinstance(iterator, AsyncIterator):
+                await self._handle_async_iterator(iterator, chunks, message.id, message, token_buffer)
+                return "".join(chunks)
+            try:
+                first_chunk = True
+                # Generating the chunks of a sync stream blocks, so they are pulled in a thread to keep the event
+                # loop free to send the tokens. The chunks pulled while the loop is busy are handed over together.
+                async with aclosing(iterate_in_thread(iterator)) as batches:
+                    async for batch in batches:
+                        for chunk in batch:
+                            await self._process_chunk(
+                                chunk.content,
+                                chunks,
+                                message.id,
+                                message,
+                                first_chunk=first_chunk,
+                                token_buffer=token_buffer,
+                            )
+                            first_chunk = False
+            except Exception as e:
+                raise StreamingError(cause=e, source=message.properties.source) from e
+            return "".join(chunks)
+        finally:
+            if token_buffer is not None:
+                token_buffer.flush()
+
+    def _create_token_buffer(self, message_id: str) -> TokenBuffer | None:
+        if not self._event_manager:
+            return None
+        from axie_studio.services.deps import get_settings_service
+
+        settings = get_settings_service().settings
+        return TokenBuffer(
+            self._event_manager,
+            message_id,
+            max_delay=settings.stream_token_batch_interval / 1000,
+            max_size=settings.stream_token_batch_size,
+        )
 
-    async def _handle_async_iterator(self, iterator: AsyncIterator, message_id: str, message: Message) -> str:
-        complete_message = ""
+    async def _handle_async_iterator(
+        self,
+        iterator: AsyncIterator,
+        chunks: list[str],
+        message_id: str,
+        message: Message,
+        token_buffer: TokenBuffer | None = None,
+    ) -> None:
         first_chunk = True
         async for chunk in iterator:
-            complete_message = await self._process_chunk(
-                chunk.content, complete_message, message_id, message, first_chunk=first_chunk
+            await self._process_chunk(
+                chunk.content, chunks, message_id, message, first_chunk=first_chunk, token_buffer=token_buffer
             )
             first_chunk = False
-        return complete_message
 
     async def _process_chunk(
-        self, chunk: str, complete_message: str, message_id: str, message: Message, *, first_chunk: bool = False
-    ) -> str:
-        complete_message += chunk
+        self,
+        chunk: str,
+        chunks: list[str],
+        message_id: str,
+        message: Message,
+        *,
+        first_chunk: bool = False,
+        token_buffer: TokenBuffer | None = None,
+    ) -> None:
+        chunks.append(chunk)
         if self._event_manager:
             if first_chunk:
                 # Send the initial message only on the first chunk
                 msg_copy = message.model_copy()
-                msg_copy.text = complete_message
+                msg_copy.text = chunk
                 await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
-        return complete_message
+            if token_buffer is not None:
+                token_buffer.add(chunk)
+            else:
+                self._event_manager.on_token(data={"chunk": chunk, "id": str(message_id)})
 
     async def send_error(
         self,
@@ -1,3 +1,5 @@
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 # Import compatibility layer early to ensure langflow modules are available
@@ -12,8 +14,87 @@ from axie_studio.utils import validate
 if TYPE_CHECKING:
     from axie_studio.custom.custom_component.custom_component import CustomComponent
 
+DEFAULT_COMPONENT_CLASS_CACHE_SIZE = 512
+
+
+class ComponentClassCache:
+    """A process-wide LRU cache of component classes built from source code.
+
+    Building a class from source parses the code, imports every module it references and compiles the
+    class definition. The result only depends on the source, so it is cached keyed by the code hash.
+    The full source is stored alongside each entry and compared on lookup, so a hash collision or a
+    changed source is always treated as a miss and the entry is rebuilt.
+
+    Attributes:
+        max_size (int): Maximum number of classes kept in the cache.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups that required building the class.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_COMPONENT_CLASS_CACHE_SIZE) -> None:
+        self._cache: OrderedDict[str, tuple[str, type]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, code_hash: str, code: str) -> type | None:
+        """Returns the cached class for the given code, or None if it is not cached."""
+        with self._lock:
+            entry = self._cache.get(code_hash)
+            if entry is None or entry[0] != code:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(code_hash)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, code_hash: str, code: str, class_: type) -> None:
+        """Stores a class, evicting the least recently used one if the cache is full."""
+        with self._lock:
+            if code_hash in self._cache:
+                self._cache.move_to_end(code_hash)
+            elif len(self._cache) >= self.max_size:
+                self._cache.popitem(last=False)
+            self._cache[code_hash] = (code, class_)
+
+    def invalidate(self, code_hash: str) -> None:
+        """Removes a single class from the cache."""
+        with self._lock:
+            self._cache.pop(code_hash, None)
+
+    def clear(self) -> None:
+        """Removes every class from the cache and resets the counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._cache), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+component_class_cache = ComponentClassCache()
+
 
 def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
+    """Evaluate custom component code.
+
+    Classes are cached in `component_class_cache` so the same source is only compiled once per process.
+    """
+    # Imported here because axie_studio.custom.utils imports this module
+    from axie_studio.custom.utils import _generate_code_hash
+
+    if not code:
+        return validate.create_class(code, validate.extract_class_name(code))
+    code_hash = _generate_code_hash(code, __name__, "CustomComponent")
+    if (cached_class := component_class_cache.get(code_hash, code)) is not None:
+        return cached_class
     class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    custom_class = validate.create_class(code, class_name)
+    component_class_cache.set(code_hash, code, custom_class)
+    return custom_class
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import json
 import time
@@ -14,8 +15,6 @@ from typing_extensions import Protocol
 from axie_studio.schema.playground_events import create_event_by_type
 
 if TYPE_CHECKING:
-    import asyncio
-
     from axie_studio.schema.log import LoggableType
 
 
@@ -86,6 +85,51 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
+class TokenBuffer:
+    """Coalesces streamed tokens into fewer token events.
+
+    Buffered tokens are sent together in one `on_token` event as soon as `max_size` bytes are buffered or
+    `max_delay` seconds have passed since the first of them was buffered. If either budget is 0, every token
+    is sent in its own event. Everything runs on the event loop, so no token is handed off to a thread.
+
+    Args:
+        event_manager (EventManager): The event manager used to send the token events.
+        message_id (str): The ID of the message the tokens belong to.
+        max_delay (float): The maximum time in seconds a token is held back.
+        max_size (int): The number of buffered bytes that triggers sending the tokens.
+    """
+
+    def __init__(self, event_manager: EventManager, message_id: str, *, max_delay: float, max_size: int) -> None:
+        self.event_manager = event_manager
+        self.message_id = str(message_id)
+        self.max_delay = max_delay
+        self.max_size = max_size
+        self._chunks: list[str] = []
+        self._size = 0
+        self._timer: asyncio.TimerHandle | None = None
+
+    def add(self, chunk: str) -> None:
+        """Buffers a token, sending the buffered tokens if a budget is reached."""
+        self._chunks.append(chunk)
+        self._size += len(chunk.encode("utf-8"))
+        if self.max_delay <= 0 or self.max_size <= 0 or self._size >= self.max_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_delay, self.flush)
+
+    def flush(self) -> None:
+        """Sends the buffered tokens, if any."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._chunks:
+            return
+        chunk = "".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
+        self.event_manager.on_token(data={"chunk": chunk, "id": self.message_id})
+
+
 def create_default_event_manager(queue):
     manager = EventManager(queue)
     manager.register_event("on_token", "token")
@@ -11,7 +11,6 @@ import traceback
 import uuid
 from collections import defaultdict, deque
 from datetime import datetime, timezone
-from functools import partial
 from itertools import chain
 from typing import TYPE_CHECKING, Any, cast
 
@@ -19,9 +18,15 @@ from loguru import logger
 
 from axie_studio.exceptions.component import ComponentBuildError
 from axie_studio.graph.edge.base import CycleEdge, Edge
-from axie_studio.graph.graph.constants import Finish, lazy_load_vertex_dict
+from axie_studio.graph.graph.constants import DEFAULT_MAX_CONCURRENCY, Finish, lazy_load_vertex_dict
 from axie_studio.graph.graph.runnable_vertices_manager import RunnableVerticesManager
-from axie_studio.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
+from axie_studio.graph.graph.schema import (
+    ExecutionMode,
+    GraphData,
+    GraphDump,
+    StartConfigDict,
+    VertexBuildResult,
+)
 from axie_studio.graph.graph.state_model import create_state_model_from_graph
 from axie_studio.graph.graph.utils import (
     find_all_cycle_edges,
@@ -104,6 +109,9 @@ class Graph:
         self.stop_vertex: str | None = None
         self.inactive_vertices: set = set()
         self.edges: list[CycleEdge] = []
+        self._edges_by_source: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._edges_by_target: dict[str, list[CycleEdge]] = defaultdict(list)
+        self._edge_positions: dict[int, int] = {}
         self.vertices: list[Vertex] = []
         self.run_manager = RunnableVerticesManager()
         self._vertices: list[NodeData] = []
@@ -715,6 +723,8 @@ class Graph:
         session_id: str,
         fallback_to_env_vars: bool,
         event_manager: EventManager | None = None,
+        execution_mode: ExecutionMode = "layered",
+        max_concurrency: int | None = None,
     ) -> list[ResultData | None]:
         """Runs the graph with the given inputs.
 
@@ -727,6 +737,8 @@ class Graph:
             session_id (str): The session ID for the graph.
             fallback_to_env_vars (bool): Whether to fallback to environment variables.
             event_manager (EventManager | None): The event manager for the graph.
+            execution_mode (ExecutionMode): How vertices are scheduled. See `process`.
+            max_concurrency (int | None): Maximum number of vertices built at once in "eager" mode.
 
         Returns:
             List[Optional["ResultData"]]: The outputs of the graph.
@@ -750,13 +762,6 @@ class Graph:
                 raise ValueError(msg)
             vertex.update_raw_params({"session_id": session_id})
         # Process the graph
-        try:
-            cache_service = get_chat_service()
-            if self.flow_id:
-                await cache_service.set_cache(self.flow_id, self)
-        except Exception:  # noqa: BLE001
-            logger.exception("Error setting cache")
-
         try:
             # Prioritize the webhook component if it exists
             start_component_id = find_start_component_id(self._is_input_vertices)
@@ -764,6 +769,8 @@ class Graph:
                 start_component_id=start_component_id,
                 fallback_to_env_vars=fallback_to_env_vars,
                 event_manager=event_manager,
+                execution_mode=execution_mode,
+                max_concurrency=max_concurrency,
             )
             self.increment_run_count()
         except Exception as exc:
@@ -799,6 +806,9 @@ class Graph:
         stream: bool = False,
         fallback_to_env_vars: bool = False,
         event_manager: EventManager | None = None,
+        execution_mode: ExecutionMode = "layered",
+        max_concurrency: int | None = None,
+        max_parallel_runs: int = 1,
     ) -> list[RunOutputs]:
         """Runs the graph with the given inputs.
 
@@ -811,6 +821,11 @@ class Graph:
             stream (bool, optional): Whether to stream the results or not. Defaults to False.
             fallback_to_env_vars (bool, optional): Whether to fallback to environment variables. Defaults to False.
             event_manager (EventManager | None): The event manager for the graph.
+            execution_mode (ExecutionMode): How vertices are scheduled. Defaults to "layered".
+            max_concurrency (int | None): Maximum number of vertices built at once in "eager" mode.
+            max_parallel_runs (int): Maximum number of inputs run at once. When greater than 1 and there is
+                more than one input, each input runs on its own clone of the graph, which must not have been
+                run yet. The outputs are returned in the order of the inputs either way. Defaults to 1.
 
         Returns:
             List[RunOutputs]: The outputs of the graph.
@@ -836,6 +851,20 @@ class Graph:
             self.session_id = session_id
         for _ in range(len(inputs) - len(types)):
             types.append("chat")  # default to chat
+        if max_parallel_runs > 1 and len(inputs) > 1:
+            return await self._arun_parallel(
+                inputs,
+                inputs_components=inputs_components,
+                types=types,
+                outputs=outputs or [],
+                session_id=session_id or "",
+                stream=stream,
+                fallback_to_env_vars=fallback_to_env_vars,
+                event_manager=event_manager,
+                execution_mode=execution_mode,
+                max_concurrency=max_concurrency,
+                max_parallel_runs=max_parallel_runs,
+            )
         for run_inputs, components, input_type in zip(inputs, inputs_components, types, strict=True):
             run_outputs = await self._run(
                 inputs=run_inputs,
@@ -846,12 +875,67 @@ class Graph:
                 session_id=session_id or "",
                 fallback_to_env_vars=fallback_to_env_vars,
                 event_manager=event_manager,
+                execution_mode=execution_mode,
+                max_concurrency=max_concurrency,
             )
             run_output_object = RunOutputs(inputs=run_inputs, outputs=run_outputs)
             logger.debug(f"Run outputs: {run_output_object}")
             vertex_outputs.append(run_output_object)
         return vertex_outputs
 
+    async def _arun_parallel(
+        self,
+        inputs: list[dict[str, str]],
+        *,
+        inputs_components: list[list[str]],
+        types: list[InputType | None],
+        outputs: list[str],
+        session_id: str,
+        stream: bool,
+        fallback_to_env_vars: bool,
+        event_manager: EventManager | None,
+        execution_mode: ExecutionMode,
+        max_concurrency: int | None,
+        max_parallel_runs: int,
+    ) -> list[RunOutputs]:
+        """Runs each input on its own clone of the graph, at most `max_parallel_runs` at a time.
+
+        If a run fails, the runs that have not finished yet are cancelled and the error is raised.
+        """
+        semaphore = asyncio.Semaphore(max_parallel_runs)
+
+        async def _run_input(run_inputs: dict[str, str], components: list[str], input_type: InputType | None):
+            async with semaphore:
+                graph = self.clone()
+                graph.session_id = self.session_id
+                run_outputs = await graph._run(
+                    inputs=run_inputs,
+                    input_components=components,
+                    input_type=input_type,
+                    outputs=outputs,
+                    stream=stream,
+                    session_id=session_id,
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    event_manager=event_manager,
+                    execution_mode=execution_mode,
+                    max_concurrency=max_concurrency,
+                )
+            return RunOutputs(inputs=run_inputs, outputs=run_outputs)
+
+        tasks = [
+            asyncio.create_task(_run_input(run_inputs, components, input_type))
+            for run_inputs, components, input_type in zip(inputs, inputs_components, types, strict=True)
+        ]
+        try:
+            vertex_outputs = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        logger.debug(f"Ran {len(vertex_outputs)} inputs with up to {max_parallel_runs} runs at a time")
+        return list(vertex_outputs)
+
     def next_vertex_to_build(self):
         """Returns the next vertex to be built.
 
@@ -947,8 +1031,8 @@ class Graph:
 
     def get_edge(self, source_id: str, target_id: str) -> CycleEdge | None:
         """Returns the edge between two vertices."""
-        for edge in self.edges:
-            if edge.source_id == source_id and edge.target_id == target_id:
+        for edge in self._edges_by_source.get(source_id, []):
+            if edge.target_id == target_id:
                 return edge
         return None
 
@@ -1031,6 +1115,61 @@ class Graph:
 
         return new_graph
 
+    def clone(self) -> Graph:
+        """Returns an independent copy of the graph that is ready to be run.
+
+        Unlike `copy.deepcopy`, which rebuilds the graph from its payload, the already built vertices,
+        edges and adjacency maps are copied as they are. Parsing, edge validation and parameter building
+        are skipped and only the component instances are created again, so each clone gets fresh run
+        state. This is meant for graphs created with `from_payload` that have not been run yet.
+        """
+        if self._start is not None or self._end is not None:
+            return copy.deepcopy(self)
+
+        new_graph = type(self)(
+            flow_id=self.flow_id,
+            flow_name=self.flow_name,
+            description=self.description,
+            user_id=self.user_id,
+            context=dict(self.context),
+        )
+        # Components are created again below, so they must not be copied along with their vertices
+        memo: dict[int, Any] = {id(self): new_graph}
+        for vertex in self.vertices:
+            if vertex.custom_component is not None:
+                memo[id(vertex.custom_component)] = None
+
+        for attr in (
+            "raw_graph_data",
+            "_graph_data",
+            "_vertices",
+            "_edges",
+            "vertices",
+            "edges",
+            "top_level_vertices",
+            "predecessor_map",
+            "successor_map",
+            "in_degree_map",
+            "parent_child_map",
+            "run_manager",
+            "_is_input_vertices",
+            "_is_output_vertices",
+            "_is_state_vertices",
+            "has_session_id_vertices",
+            "_cycles",
+            "_cycle_vertices",
+            "_is_cyclic",
+        ):
+            if attr in self.__dict__:
+                setattr(new_graph, attr, copy.deepcopy(self.__dict__[attr], memo))
+        new_graph.vertex_map = {vertex.id: vertex for vertex in new_graph.vertices}
+        new_graph._build_edge_index()
+
+        new_graph._instantiate_components_in_vertices()
+        new_graph._set_cache_to_vertices_in_cycle()
+        new_graph._set_cache_if_listen_notify_components()
+        return new_graph
+
     def __setstate__(self, state):
         run_manager = state["run_manager"]
         if isinstance(run_manager, RunnableVerticesManager):
@@ -1039,6 +1178,7 @@ class Graph:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
         self.__dict__.update(state)
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
+        self._build_edge_index()
         self.tracing_service = get_tracing_service()
         self.set_run_id(self._run_id)
 
@@ -1099,6 +1239,7 @@ class Graph:
             new_edges.append(edge)
         new_edges += other_vertex.edges
         self.edges = new_edges
+        self._build_edge_index()
 
     def vertex_data_is_identical(self, vertex: Vertex, other_vertex: Vertex) -> bool:
         data_is_equivalent = vertex == other_vertex
@@ -1209,12 +1350,14 @@ class Graph:
         for edge in vertex.edges:
             if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
                 self.edges.append(edge)
+                self._index_edge(edge, len(self.edges) - 1)
 
     def _build_graph(self) -> None:
         """Builds the graph from the vertices and edges."""
         self.vertices = self._build_vertices()
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         self.edges = self._build_edges()
+        self._build_edge_index()
 
         # This is a hack to make sure that the LLM vertex is sent to
         # the toolkit vertex
@@ -1271,6 +1414,31 @@ class Graph:
         self.vertices.remove(vertex)
         self.vertex_map.pop(vertex_id)
         self.edges = [edge for edge in self.edges if vertex_id not in {edge.source_id, edge.target_id}]
+        self._build_edge_index()
+
+    def _build_edge_index(self) -> None:
+        """Rebuilds the source and target keyed indexes of `self.edges`.
+
+        Must be called whenever `self.edges` is replaced. The cached incoming and outgoing edges of every
+        vertex are reset as well since they are derived from the index.
+        """
+        self._edges_by_source = defaultdict(list)
+        self._edges_by_target = defaultdict(list)
+        self._edge_positions = {}
+        for position, edge in enumerate(self.edges):
+            self._index_edge(edge, position)
+        for vertex in self.vertices:
+            vertex._incoming_edges = None
+            vertex._outgoing_edges = None
+
+    def _index_edge(self, edge: CycleEdge, position: int) -> None:
+        self._edges_by_source[edge.source_id].append(edge)
+        self._edges_by_target[edge.target_id].append(edge)
+        self._edge_positions[id(edge)] = position
+        for vertex_id in (edge.source_id, edge.target_id):
+            if vertex := self.vertex_map.get(vertex_id):
+                vertex._incoming_edges = None
+                vertex._outgoing_edges = None
 
     def _build_vertex_params(self) -> None:
         """Identifies and handles the LLM vertex within the graph."""
@@ -1347,10 +1515,76 @@ class Graph:
         self.reset_inactivated_vertices()
         self.reset_activated_vertices()
 
-        await chat_service.set_cache(str(self.flow_id or self._run_id), self)
         self._record_snapshot(vertex_id)
         return vertex_build_result
 
+    def get_run_state(self, vertex: Vertex | None = None) -> dict[str, Any]:
+        """Returns the records that describe the state of the current run.
+
+        Only the state of the run manager and, if a vertex is given, the status and results of that vertex
+        are included, so the state can be saved incrementally after each vertex is built.
+
+        Args:
+            vertex (Vertex | None): The vertex whose record should be included. Defaults to None.
+
+        Returns:
+            dict[str, Any]: The records, by name.
+        """
+        run_manager = {
+            key: sorted(value) if isinstance(value, set) else value for key, value in self.run_manager.to_dict().items()
+        }
+        records: dict[str, Any] = {"run_manager": run_manager}
+        if vertex is not None:
+            records[f"vertex:{vertex.id}"] = {
+                "built": vertex.built,
+                "frozen": vertex.frozen,
+                "state": vertex.state.value,
+                "results": vertex.results,
+            }
+        return records
+
+    async def save_run_state(self, vertex: Vertex | None = None) -> None:
+        """Saves the state of the current run, keyed by its run ID.
+
+        Interactive builds save it after each vertex instead of caching the whole graph, so a worker that
+        does not have the graph can rebuild it and carry on with `load_run_state`.
+
+        Args:
+            vertex (Vertex | None): The vertex that was just built, if any. Defaults to None.
+        """
+        if not self._run_id:
+            return
+        try:
+            await get_chat_service().set_run_state(self._run_id, self.get_run_state(vertex))
+        except Exception:  # noqa: BLE001
+            logger.exception("Error saving run state")
+
+    async def load_run_state(self, run_id: str | None = None) -> dict[str, dict[str, Any]]:
+        """Restores the run manager from the saved state of a run.
+
+        Args:
+            run_id (str | None): The ID of the run. Defaults to the current run ID.
+
+        Returns:
+            dict[str, dict[str, Any]]: The saved records of the vertices of the run, by vertex ID.
+        """
+        run_id = run_id or self.run_id
+        names = ["run_manager", *(f"vertex:{vertex_id}" for vertex_id in self.vertex_map)]
+        records = await get_chat_service().get_run_state(run_id, names)
+        if (run_manager := records.pop("run_manager", None)) is not None:
+            cycle_vertices = self.run_manager.cycle_vertices
+            self.run_manager = RunnableVerticesManager.from_dict(
+                {
+                    "run_map": defaultdict(list, run_manager["run_map"]),
+                    "run_predecessors": defaultdict(list, run_manager["run_predecessors"]),
+                    "vertices_to_run": set(run_manager["vertices_to_run"]),
+                    "vertices_being_run": set(run_manager["vertices_being_run"]),
+                    "ran_at_least_once": set(run_manager["ran_at_least_once"]),
+                }
+            )
+            self.run_manager.cycle_vertices = cycle_vertices
+        return {name.removeprefix("vertex:"): record for name, record in records.items()}
+
     def get_snapshot(self):
         return copy.deepcopy(
             {
@@ -1499,25 +1733,31 @@ class Graph:
         is_target: bool | None = None,
         is_source: bool | None = None,
     ) -> list[CycleEdge]:
-        """Returns a list of edges for a given vertex."""
+        """Returns a list of edges for a given vertex.
+
+        The edges are looked up in the source and target indexes and returned in the same order as they
+        appear in `self.edges`.
+        """
         # The idea here is to return the edges that have the vertex_id as source or target
         # or both
-        return [
-            edge
-            for edge in self.edges
-            if (edge.source_id == vertex_id and is_source is not False)
-            or (edge.target_id == vertex_id and is_target is not False)
-        ]
+        outgoing = self._edges_by_source.get(vertex_id, []) if is_source is not False else []
+        incoming = self._edges_by_target.get(vertex_id, []) if is_target is not False else []
+        if not incoming:
+            return list(outgoing)
+        if not outgoing:
+            return list(incoming)
+        # Self-loops are in both indexes, but must only be returned once
+        edges = [*outgoing, *(edge for edge in incoming if edge.source_id != vertex_id)]
+        return sorted(edges, key=lambda edge: self._edge_positions[id(edge)])
 
     def get_vertices_with_target(self, vertex_id: str) -> list[Vertex]:
         """Returns the vertices connected to a vertex."""
         vertices: list[Vertex] = []
-        for edge in self.edges:
-            if edge.target_id == vertex_id:
-                vertex = self.get_vertex(edge.source_id)
-                if vertex is None:
-                    continue
-                vertices.append(vertex)
+        for edge in self._edges_by_target.get(vertex_id, []):
+            vertex = self.get_vertex(edge.source_id)
+            if vertex is None:
+                continue
+            vertices.append(vertex)
         return vertices
 
     async def process(
@@ -1526,16 +1766,54 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        execution_mode: ExecutionMode = "layered",
+        max_concurrency: int | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph.
+
+        In "layered" mode the vertices in each layer are run in parallel and the next layer is only
+        computed once every vertex of the current one has finished. In "eager" mode each vertex is
+        scheduled as soon as its own predecessors are done, so a slow vertex only delays its successors.
+
+        Args:
+            fallback_to_env_vars (bool): Whether to fallback to environment variables.
+            start_component_id (str | None): The ID of the component to start from.
+            event_manager (EventManager | None): The event manager for the graph.
+            execution_mode (ExecutionMode): Either "layered" or "eager". Defaults to "layered".
+            max_concurrency (int | None): Maximum number of vertices built at once in "eager" mode.
+                Defaults to `DEFAULT_MAX_CONCURRENCY`.
+
+        Raises:
+            ValueError: If the execution mode is unknown or max_concurrency is lower than 1.
+        """
+        if execution_mode not in {"layered", "eager"}:
+            msg = f"Invalid execution mode: {execution_mode}. Expected 'layered' or 'eager'"
+            raise ValueError(msg)
+        if max_concurrency is None:
+            max_concurrency = DEFAULT_MAX_CONCURRENCY
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1. Got {max_concurrency}"
+            raise ValueError(msg)
         has_webhook_component = "webhook" in start_component_id.lower() if start_component_id else False
         first_layer = self.sort_vertices(start_component_id=start_component_id)
+        await self.initialize_run()
+        lock = asyncio.Lock()
+        if execution_mode == "eager":
+            await self._process_eager(
+                first_layer,
+                lock=lock,
+                fallback_to_env_vars=fallback_to_env_vars,
+                event_manager=event_manager,
+                has_webhook_component=has_webhook_component,
+                max_concurrency=max_concurrency,
+            )
+            logger.debug("Graph processing complete")
+            return self
+
         vertex_task_run_count: dict[str, int] = {}
         to_process = deque(first_layer)
         layer_index = 0
         chat_service = get_chat_service()
-        await self.initialize_run()
-        lock = asyncio.Lock()
         while to_process:
             current_batch = list(to_process)  # Copy current deque items to a list
             to_process.clear()  # Clear the deque for new items
@@ -1573,6 +1851,90 @@ class Graph:
         logger.debug("Graph processing complete")
         return self
 
+    async def _process_eager(
+        self,
+        first_layer: list[str],
+        *,
+        lock: asyncio.Lock,
+        fallback_to_env_vars: bool,
+        event_manager: EventManager | None,
+        has_webhook_component: bool,
+        max_concurrency: int,
+    ) -> None:
+        """Runs the graph as a dataflow, scheduling successors as soon as they become runnable.
+
+        Readiness is decided by the RunnableVerticesManager exactly as in layered mode, but the
+        successors of a vertex are computed and scheduled right after that vertex finishes instead of
+        after the whole layer. The first failing vertex cancels every build still in flight.
+        """
+        chat_service = get_chat_service()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        vertex_task_run_count: dict[str, int] = {}
+        in_flight: dict[asyncio.Task, str] = {}
+
+        async def build_with_limit(vertex_id: str) -> VertexBuildResult:
+            async with semaphore:
+                return await self.build_vertex(
+                    vertex_id=vertex_id,
+                    user_id=self.user_id,
+                    inputs_dict={},
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    get_cache=chat_service.get_cache,
+                    set_cache=chat_service.set_cache,
+                    event_manager=event_manager,
+                )
+
+        def schedule(vertex_id: str) -> None:
+            if vertex_id in in_flight.values():
+                return
+            run_count = vertex_task_run_count.get(vertex_id, 0)
+            task = asyncio.create_task(build_with_limit(vertex_id), name=f"{vertex_id} Run {run_count}")
+            in_flight[task] = vertex_id
+            vertex_task_run_count[vertex_id] = run_count + 1
+
+        for vertex_id in first_layer:
+            schedule(vertex_id)
+
+        try:
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                vertices: list[Vertex] = []
+                for task in sorted(done, key=lambda t: t.get_name()):
+                    vertex_id = in_flight.pop(task)
+                    exc = task.exception()
+                    if exc is not None:
+                        logger.error(f"Task {task.get_name()} failed with exception: {exc}")
+                        if has_webhook_component and isinstance(exc, Exception):
+                            await self._log_vertex_build_from_exception(vertex_id, exc)
+                        raise exc
+                    result = task.result()
+                    if self.flow_id is not None:
+                        await log_vertex_build(
+                            flow_id=self.flow_id,
+                            vertex_id=result.vertex.id,
+                            valid=result.valid,
+                            params=result.params,
+                            data=result.result_dict,
+                            artifacts=result.artifacts,
+                        )
+                    vertices.append(result.vertex)
+
+                for v in vertices:
+                    self.run_manager.remove_vertex_from_runnables(v.id)
+                    logger.debug(f"Vertex {v.id}, result: {v.built_result}, object: {v.built_object}")
+
+                next_runnable_vertices: set[str] = set()
+                for v in vertices:
+                    next_runnable_vertices.update(await self.get_next_runnable_vertices(lock, vertex=v, cache=False))
+                for vertex_id in sorted(next_runnable_vertices):
+                    schedule(vertex_id)
+        finally:
+            # Cancel whatever is still running if we are leaving because of an error or a cancellation
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         """Determines the next set of runnable vertices from a list of successor vertex IDs.
 
@@ -1588,16 +1950,22 @@ class Graph:
 
         return sorted(next_runnable_vertices)
 
-    async def get_next_runnable_vertices(self, lock: asyncio.Lock, vertex: Vertex, *, cache: bool = True) -> list[str]:
+    async def get_next_runnable_vertices(
+        self,
+        lock: asyncio.Lock,
+        vertex: Vertex,
+        *,
+        cache: bool = True,
+    ) -> list[str]:
         """Determines the next set of runnable vertex IDs after a vertex completes execution.
 
         If the completed vertex is a state vertex, any recently activated state vertices are also included.
-        Updates the run manager to reflect the new runnable state and optionally caches the updated graph state.
+        Updates the run manager to reflect the new runnable state and optionally saves the updated run state.
 
         Args:
             lock: An asyncio lock for thread-safe updates.
             vertex: The vertex that has just finished execution.
-            cache: If True, caches the updated graph state.
+            cache: If True, saves the updated run state of the graph.
 
         Returns:
             A list of vertex IDs that are ready to be executed next.
@@ -1614,9 +1982,8 @@ class Graph:
                     next_runnable_vertices.remove(v_id)
                 else:
                     self.run_manager.add_to_vertices_being_run(next_v_id)
-            if cache and self.flow_id is not None:
-                set_cache_coro = partial(get_chat_service().set_cache, key=self.flow_id)
-                await set_cache_coro(data=self, lock=lock)
+            if cache:
+                await self.save_run_state(vertex)
         if vertex.is_state:
             next_runnable_vertices.extend(self.activated_vertices)
         return next_runnable_vertices
@@ -1837,7 +2204,7 @@ class Graph:
         The count reflects the number of edges between the input vertex and each neighbor.
         """
         neighbors: dict[Vertex, int] = {}
-        for edge in self.edges:
+        for edge in self.get_vertex_edges(vertex.id):
             if edge.source_id == vertex.id:
                 neighbor = self.get_vertex(edge.target_id)
                 if neighbor is None:
@@ -9,6 +9,9 @@ if TYPE_CHECKING:
     from axie_studio.graph.vertex.base import Vertex
     from axie_studio.graph.vertex.vertex_types import CustomComponentVertex
 
+DEFAULT_MAX_CONCURRENCY = 16
+"""Default maximum number of vertices built at the same time in "eager" execution mode."""
+
 
 class Finish:
     def __bool__(self) -> bool:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, NamedTuple, Protocol
+from typing import TYPE_CHECKING, Literal, NamedTuple, Protocol
 
 from typing_extensions import NotRequired, TypedDict
 
@@ -12,6 +12,13 @@ if TYPE_CHECKING:
     from axie_studio.graph.vertex.base import Vertex
     from axie_studio.schema.log import LoggableType
 
+ExecutionMode = Literal["layered", "eager"]
+"""How `Graph.process` schedules vertices.
+
+- "layered": vertices are run layer by layer and each layer waits for all of its vertices to finish.
+- "eager": each vertex is scheduled as soon as all of its own predecessors have finished.
+"""
+
 
 class ViewPort(TypedDict):
     x: float
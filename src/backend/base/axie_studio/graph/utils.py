@@ -12,11 +12,8 @@ from axie_studio.interface.utils import extract_input_variables_from_prompt
 from axie_studio.schema.data import Data
 from axie_studio.schema.message import Message
 from axie_studio.serialization.serialization import get_max_items_length, get_max_text_length, serialize
-from axie_studio.services.database.models.transactions.crud import log_transaction as crud_log_transaction
 from axie_studio.services.database.models.transactions.model import TransactionBase
-from axie_studio.services.database.models.vertex_builds.crud import log_vertex_build as crud_log_vertex_build
 from axie_studio.services.database.models.vertex_builds.model import VertexBuildBase
-from axie_studio.services.database.utils import session_getter
 from axie_studio.services.deps import get_db_service, get_settings_service
 
 if TYPE_CHECKING:
@@ -118,7 +115,8 @@ async def log_transaction(
     """Asynchronously logs a transaction record for a vertex in a flow if transaction storage is enabled.
 
     Serializes the source vertex's primitive parameters and result, handling pandas DataFrames as needed,
-    and records transaction details including inputs, outputs, status, error, and flow ID in the database.
+    and queues the transaction details including inputs, outputs, status, error, and flow ID to be written to
+    the database in the background.
     If the flow ID is not provided, attempts to retrieve it from the source vertex's graph.
     Logs warnings and errors on serialization or database failures.
     """
@@ -155,11 +153,7 @@ async def log_transaction(
             error=error,
             flow_id=flow_id if isinstance(flow_id, UUID) else UUID(flow_id),
         )
-        async with session_getter(get_db_service()) as session:
-            with session.no_autoflush:
-                inserted = await crud_log_transaction(session, transaction)
-                if inserted:
-                    logger.debug(f"Logged transaction: {inserted.id}")
+        await get_db_service().log_writer.put(transaction)
     except Exception as exc:  # noqa: BLE001
         logger.error(f"Error logging transaction: {exc!s}")
 
@@ -175,7 +169,8 @@ async def log_vertex_build(
 ) -> None:
     """Asynchronously logs a vertex build record to the database if vertex build storage is enabled.
 
-    Serializes the provided data and artifacts with configurable length and item limits before storing.
+    Serializes the provided data and artifacts with configurable length and item limits and queues the record
+    to be written to the database in the background.
     Converts parameters to string if present. Handles exceptions by logging errors.
     """
     try:
@@ -196,9 +191,7 @@ async def log_vertex_build(
             data=serialize(data, max_length=get_max_text_length(), max_items=get_max_items_length()),
             artifacts=serialize(artifacts, max_length=get_max_text_length(), max_items=get_max_items_length()),
         )
-        async with session_getter(get_db_service()) as session:
-            inserted = await crud_log_vertex_build(session, vertex_build)
-            logger.debug(f"Logged vertex build: {inserted.build_id}")
+        await get_db_service().log_writer.put(vertex_build)
     except Exception:  # noqa: BLE001
         logger.exception("Error logging vertex build")
 
@@ -182,13 +182,13 @@ class Vertex:
     @property
     def outgoing_edges(self) -> list[CycleEdge]:
         if self._outgoing_edges is None:
-            self._outgoing_edges = [edge for edge in self.edges if edge.source_id == self.id]
+            self._outgoing_edges = self.graph.get_vertex_edges(self.id, is_target=False)
         return self._outgoing_edges
 
     @property
     def incoming_edges(self) -> list[CycleEdge]:
         if self._incoming_edges is None:
-            self._incoming_edges = [edge for edge in self.edges if edge.target_id == self.id]
+            self._incoming_edges = self.graph.get_vertex_edges(self.id, is_source=False)
         return self._incoming_edges
 
     # Get edge connected to an output of a certain name
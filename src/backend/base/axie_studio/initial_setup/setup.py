@@ -33,18 +33,29 @@ from axie_studio.base.constants import (
     SKIPPED_FIELD_ATTRIBUTES,
 )
 from axie_studio.initial_setup.constants import STARTER_FOLDER_DESCRIPTION, STARTER_FOLDER_NAME
+from axie_studio.initial_setup.sync_manifest import (
+    FLOWS_MANIFEST_FILENAME,
+    STARTER_PROJECTS_MANIFEST_FILENAME,
+    SyncManifest,
+    compute_catalog_version,
+    compute_manifest_version,
+    content_hash,
+)
 from axie_studio.services.auth.utils import create_super_user
 from axie_studio.services.database.models.flow.model import Flow, FlowCreate
+from axie_studio.services.database.models.flow.utils import set_is_component
 from axie_studio.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
 from axie_studio.services.database.models.folder.model import Folder, FolderCreate, FolderRead
 from axie_studio.services.database.models.user.crud import get_user_by_username
 from axie_studio.services.deps import get_settings_service, get_storage_service, get_variable_service, session_scope
+from axie_studio.services.settings.base import Settings
 from axie_studio.template.field.prompt import DEFAULT_PROMPT_INTUT_TYPES
 from axie_studio.utils.util import escape_json_dump
 
 # In the folder ./starter_projects we have a few JSON files that represent
 # starter projects. We want to load these into the database so that users
 # can use them as a starting point for their own projects.
+STARTER_PROJECTS_PATH = anyio.Path(__file__).parent / "starter_projects"
 
 
 def update_projects_components_with_latest_component_versions(project_data, all_types_dict):
@@ -514,29 +525,43 @@ def log_node_changes(node_changes_log) -> None:
         logger.debug("\n".join(formatted_messages))
 
 
+async def load_starter_project(file: anyio.Path, retries=3, delay=1) -> dict:
+    attempt = 0
+    while True:
+        async with async_open(str(file), "r", encoding="utf-8") as f:
+            content = await f.read()
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError as e:
+            attempt += 1
+            if attempt >= retries:
+                msg = f"Error loading starter project {file}: {e}"
+                raise ValueError(msg) from e
+            await asyncio.sleep(delay)  # Wait before retrying
+
+
 async def load_starter_projects(retries=3, delay=1) -> list[tuple[anyio.Path, dict]]:
-    starter_projects = []
-    folder = anyio.Path(__file__).parent / "starter_projects"
     logger.debug("Loading starter projects")
-    async for file in folder.glob("*.json"):
-        attempt = 0
-        while attempt < retries:
-            async with async_open(str(file), "r", encoding="utf-8") as f:
-                content = await f.read()
-            try:
-                project = orjson.loads(content)
-                starter_projects.append((file, project))
-                break  # Break if load is successful
-            except orjson.JSONDecodeError as e:
-                attempt += 1
-                if attempt >= retries:
-                    msg = f"Error loading starter project {file}: {e}"
-                    raise ValueError(msg) from e
-                await asyncio.sleep(delay)  # Wait before retrying
+    starter_projects = [
+        (file, await load_starter_project(file, retries, delay)) async for file in STARTER_PROJECTS_PATH.glob("*.json")
+    ]
     logger.debug(f"Loaded {len(starter_projects)} starter projects")
     return starter_projects
 
 
+def _get_sync_manifest_path(settings: Settings, filename: str) -> Path | None:
+    if not settings.sync_manifest_enabled or not settings.config_dir:
+        return None
+    return Path(settings.config_dir) / filename
+
+
+def _load_starter_projects_manifest(path: Path, all_types_dict: dict, settings: Settings) -> SyncManifest:
+    version = compute_manifest_version(
+        compute_catalog_version(all_types_dict), settings.update_starter_projects, settings.database_url
+    )
+    return SyncManifest.load(path, version)
+
+
 async def copy_profile_pictures() -> None:
     """Asynchronously copies profile pictures from the source directory to the target configuration directory.
 
@@ -681,7 +706,7 @@ def create_new_project(
         gradient=project_gradient,
         tags=project_tags,
     )
-    db_flow = Flow.model_validate(new_project, from_attributes=True)
+    db_flow = set_is_component(Flow.model_validate(new_project, from_attributes=True))
     session.add(db_flow)
 
 
@@ -690,13 +715,6 @@ async def get_all_flows_similar_to_project(session: AsyncSession, folder_id: UUI
     return list((await session.exec(stmt)).first().flows)
 
 
-async def delete_starter_projects(session, folder_id) -> None:
-    flows = await get_all_flows_similar_to_project(session, folder_id)
-    for flow in flows:
-        await session.delete(flow)
-    await session.commit()
-
-
 async def folder_exists(session, folder_name):
     stmt = select(Folder).where(Folder.name == folder_name)
     folder = (await session.exec(stmt)).first()
@@ -746,13 +764,41 @@ async def load_flows_from_directory() -> None:
         # Ensure that the default folder exists for this user
         _ = await get_or_create_default_folder(session, user.id)
 
+        manifest = None
+        existing_flow_ids: set[UUID] = set()
+        if manifest_path := _get_sync_manifest_path(settings_service.settings, FLOWS_MANIFEST_FILENAME):
+            version = compute_manifest_version(
+                Path(flows_path).resolve(), user.id, settings_service.settings.database_url
+            )
+            manifest = await asyncio.to_thread(SyncManifest.load, manifest_path, version)
+            if recorded_ids := [UUID(entry["flow_id"]) for entry in manifest.entries.values()]:
+                stmt = select(Flow.id).where(col(Flow.id).in_(recorded_ids))
+                existing_flow_ids = set((await session.exec(stmt)).all())
+
+        file_names = set()
+        skipped_files = 0
         for file_path in await asyncio.to_thread(Path(flows_path).iterdir):
             if not await anyio.Path(file_path).is_file() or file_path.suffix != ".json":
                 continue
+            file_names.add(file_path.name)
+            content = await anyio.Path(file_path).read_bytes()
+            file_hash = content_hash(content)
+            entry = manifest.get(file_path.name, file_hash) if manifest is not None else None
+            if entry is not None and UUID(entry["flow_id"]) in existing_flow_ids:
+                skipped_files += 1
+                continue
             logger.info(f"Loading flow from file: {file_path.name}")
-            async with async_open(str(file_path), "r", encoding="utf-8") as f:
-                content = await f.read()
-            await upsert_flow_from_file(content, file_path.stem, session, user.id)
+            flow_id = await upsert_flow_from_file(content, file_path.stem, session, user.id)
+            if manifest is not None and flow_id is not None:
+                manifest.set(file_path.name, file_hash, flow_id=str(flow_id))
+        if skipped_files:
+            logger.debug(f"Skipped {skipped_files} unchanged flow files")
+
+        if manifest is not None:
+            manifest.prune(file_names)
+            # Only record the files once their flows are stored
+            await session.commit()
+            await asyncio.to_thread(manifest.save)
 
 
 async def detect_github_url(url: str) -> str:
@@ -833,7 +879,9 @@ async def load_bundles_from_urls() -> tuple[list[TemporaryDirectory], list[str]]
     return temp_dirs, list(component_paths)
 
 
-async def upsert_flow_from_file(file_content: AnyStr, filename: str, session: AsyncSession, user_id: UUID) -> None:
+async def upsert_flow_from_file(
+    file_content: AnyStr, filename: str, session: AsyncSession, user_id: UUID
+) -> UUID | None:
     flow = orjson.loads(file_content)
     flow_endpoint_name = flow.get("endpoint_name")
     if _is_valid_uuid(filename):
@@ -845,7 +893,7 @@ async def upsert_flow_from_file(file_content: AnyStr, filename: str, session: As
             flow_id = UUID(flow_id)
         except ValueError:
             logger.error(f"Invalid UUID string: {flow_id}")
-            return
+            return None
 
     existing = await find_existing_flow(session, flow_id, flow_endpoint_name)
     if existing:
@@ -868,20 +916,24 @@ async def upsert_flow_from_file(file_content: AnyStr, filename: str, session: As
                 existing.id = UUID(existing.id)
             except ValueError:
                 logger.error(f"Invalid UUID string: {existing.id}")
-                return
+                return None
 
         session.add(existing)
-    else:
-        logger.info(f"Creating new flow: {flow_id} with endpoint name {flow_endpoint_name}")
+        return existing.id
 
-        # Assign the newly created flow to the default folder
-        folder = await get_or_create_default_folder(session, user_id)
-        flow["user_id"] = user_id
-        flow["folder_id"] = folder.id
-        flow = Flow.model_validate(flow)
-        flow.updated_at = datetime.now(tz=timezone.utc).astimezone()
+    logger.info(f"Creating new flow: {flow_id} with endpoint name {flow_endpoint_name}")
 
-        session.add(flow)
+    # Assign the newly created flow to the default folder
+    folder = await get_or_create_default_folder(session, user_id)
+    flow["user_id"] = user_id
+    flow["folder_id"] = folder.id
+    # Files saved without the flag get it from their data rather than the model default
+    flow.setdefault("is_component", None)
+    flow = set_is_component(Flow.model_validate(flow))
+    flow.updated_at = datetime.now(tz=timezone.utc).astimezone()
+
+    session.add(flow)
+    return flow.id
 
 
 async def find_existing_flow(session, flow_id, flow_endpoint_name):
@@ -911,30 +963,54 @@ async def create_or_update_starter_projects(all_types_dict: dict) -> None:
         # this is intended to be used to skip all startup project logic.
         return
 
+    settings = get_settings_service().settings
+    update_projects = settings.update_starter_projects
     async with session_scope() as session:
         new_folder = await get_or_create_starter_folder(session)
-        starter_projects = await load_starter_projects()
+        manifest = None
+        if manifest_path := _get_sync_manifest_path(settings, STARTER_PROJECTS_MANIFEST_FILENAME):
+            manifest = await asyncio.to_thread(_load_starter_projects_manifest, manifest_path, all_types_dict, settings)
+
+        existing_flows: dict[str, list[Flow]] = defaultdict(list)
+        for existing_flow in await get_all_flows_similar_to_project(session, new_folder.id):
+            existing_flows[existing_flow.name].append(existing_flow)
 
-        if get_settings_service().settings.update_starter_projects:
+        if update_projects:
             logger.debug("Updating starter projects")
-            # 1. Delete all existing starter projects
-            successfully_updated_projects = 0
-            await delete_starter_projects(session, new_folder.id)
             await copy_profile_pictures()
+        else:
+            # Even if we're not updating starter projects, we still need to create any that don't exist
+            logger.debug("Creating new starter projects")
 
-            # 2. Update all starter projects with the latest component versions (this modifies the actual file data)
-            for project_path, project in starter_projects:
-                (
-                    project_name,
-                    project_description,
-                    project_is_component,
-                    updated_at_datetime,
-                    project_data,
-                    project_icon,
-                    project_icon_bg_color,
-                    project_gradient,
-                    project_tags,
-                ) = get_project_data(project)
+        processed_projects = 0
+        skipped_projects = 0
+        project_names = set()
+        file_names = set()
+        async for project_path in STARTER_PROJECTS_PATH.glob("*.json"):
+            file_names.add(project_path.name)
+            file_hash = content_hash(await project_path.read_bytes())
+            # Skip the projects whose file and components did not change since their flow was created
+            entry = manifest.get(project_path.name, file_hash) if manifest is not None else None
+            if entry is not None and entry["name"] in existing_flows:
+                project_names.add(entry["name"])
+                skipped_projects += 1
+                continue
+
+            project = await load_starter_project(project_path)
+            (
+                project_name,
+                project_description,
+                project_is_component,
+                updated_at_datetime,
+                project_data,
+                project_icon,
+                project_icon_bg_color,
+                project_gradient,
+                project_tags,
+            ) = get_project_data(project)
+            project_names.add(project_name)
+            if update_projects:
+                # Update the starter project with the latest component versions (this modifies the actual file data)
                 updated_project_data = update_projects_components_with_latest_component_versions(
                     project_data.copy(), all_types_dict
                 )
@@ -942,9 +1018,16 @@ async def create_or_update_starter_projects(all_types_dict: dict) -> None:
                 if updated_project_data != project_data:
                     project_data = updated_project_data
                     await update_project_file(project_path, project, updated_project_data)
+                    file_hash = content_hash(await project_path.read_bytes())
+                # Replace the existing flow of the starter project
+                for existing_flow in existing_flows.pop(project_name, []):
+                    await session.delete(existing_flow)
+                create_project = True
+            else:
+                create_project = project_name not in existing_flows
 
+            if create_project:
                 try:
-                    # Create the updated starter project
                     create_new_project(
                         session=session,
                         project_name=project_name,
@@ -960,46 +1043,25 @@ async def create_or_update_starter_projects(all_types_dict: dict) -> None:
                     )
                 except Exception:  # noqa: BLE001
                     logger.exception(f"Error while creating starter project {project_name}")
+                processed_projects += 1
+            if manifest is not None:
+                manifest.set(project_path.name, file_hash, name=project_name)
 
-                successfully_updated_projects += 1
-            logger.debug(f"Successfully updated {successfully_updated_projects} starter projects")
-        else:
-            # Even if we're not updating starter projects, we still need to create any that don't exist
-            logger.debug("Creating new starter projects")
-            successfully_created_projects = 0
-            existing_flows = await get_all_flows_similar_to_project(session, new_folder.id)
-            existing_flow_names = [existing_flow.name for existing_flow in existing_flows]
-            for _, project in starter_projects:
-                (
-                    project_name,
-                    project_description,
-                    project_is_component,
-                    updated_at_datetime,
-                    project_data,
-                    project_icon,
-                    project_icon_bg_color,
-                    project_gradient,
-                    project_tags,
-                ) = get_project_data(project)
-                if project_name not in existing_flow_names:
-                    try:
-                        create_new_project(
-                            session=session,
-                            project_name=project_name,
-                            project_description=project_description,
-                            project_is_component=project_is_component,
-                            updated_at_datetime=updated_at_datetime,
-                            project_data=project_data,
-                            project_icon=project_icon,
-                            project_icon_bg_color=project_icon_bg_color,
-                            project_gradient=project_gradient,
-                            project_tags=project_tags,
-                            new_folder_id=new_folder.id,
-                        )
-                    except Exception:  # noqa: BLE001
-                        logger.exception(f"Error while creating starter project {project_name}")
-                    successfully_created_projects += 1
-                logger.debug(f"Successfully created {successfully_created_projects} starter projects")
+        if update_projects:
+            # Remove the starter projects whose file no longer exists
+            for project_name, flows in existing_flows.items():
+                if project_name not in project_names:
+                    for existing_flow in flows:
+                        await session.delete(existing_flow)
+
+        await session.commit()
+        if manifest is not None:
+            manifest.prune(file_names)
+            await asyncio.to_thread(manifest.save)
+        logger.debug(
+            f"Successfully {'updated' if update_projects else 'created'} {processed_projects} starter projects, "
+            f"skipped {skipped_projects} unchanged ones"
+        )
 
 
 async def initialize_super_user_if_needed() -> None:
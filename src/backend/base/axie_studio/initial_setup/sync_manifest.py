@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from loguru import logger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+MANIFEST_FORMAT_VERSION = 1
+STARTER_PROJECTS_MANIFEST_FILENAME = "starter_projects_manifest.json"
+FLOWS_MANIFEST_FILENAME = "flows_manifest.json"
+
+
+def content_hash(content: bytes) -> str:
+    """Returns the hash a file is recorded with in a manifest."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def compute_catalog_version(all_types_dict: dict) -> str:
+    """Hashes the component templates the starter projects are updated with.
+
+    Starter projects are rewritten with the latest templates of their components, so they have to be
+    processed again whenever any template changes, even if their own file did not.
+    """
+    body = orjson.dumps(all_types_dict, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return hashlib.sha256(body).hexdigest()
+
+
+def compute_manifest_version(*parts: Any) -> str:
+    digest = hashlib.sha256()
+    digest.update(str(MANIFEST_FORMAT_VERSION).encode())
+    for part in parts:
+        digest.update(f"\n{part}".encode())
+    return digest.hexdigest()
+
+
+class SyncManifest:
+    """An on-disk record of the files that were already loaded into the database, with their content hashes.
+
+    At startup, the files whose hash matches their entry, and whose flow is still in the database, are skipped
+    instead of being parsed, updated and written again. The whole manifest is discarded when its version
+    changes, for instance when the component catalog or the database changes.
+
+    Args:
+        path: The file the manifest is stored in.
+        version: The version of everything besides the files themselves the entries depend on.
+    """
+
+    def __init__(self, path: Path, version: str) -> None:
+        self.path = path
+        self.version = version
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.changed = False
+
+    @classmethod
+    def load(cls, path: Path, version: str) -> SyncManifest:
+        """Reads the manifest from `path`, starting with an empty one if it is missing, invalid or outdated."""
+        manifest = cls(path, version)
+        try:
+            data = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return manifest
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring invalid manifest {path}: {e}")
+            return manifest
+        if isinstance(data, dict) and data.get("version") == version:
+            manifest.entries = data.get("entries", {})
+        else:
+            logger.debug(f"Manifest {path.name} is outdated, processing every file")
+        return manifest
+
+    def get(self, file_name: str, file_hash: str) -> dict[str, Any] | None:
+        """Returns the entry of a file if its content did not change since it was recorded."""
+        entry = self.entries.get(file_name)
+        if entry is None or entry.get("hash") != file_hash:
+            return None
+        return entry
+
+    def set(self, file_name: str, file_hash: str, **values: Any) -> None:
+        self.entries[file_name] = {"hash": file_hash, **values}
+        self.changed = True
+
+    def prune(self, file_names: set[str]) -> None:
+        """Removes the files that no longer exist."""
+        for file_name in set(self.entries) - file_names:
+            del self.entries[file_name]
+            self.changed = True
+
+    def save(self) -> None:
+        """Writes the manifest if it changed, replacing the file atomically."""
+        if not self.changed:
+            return
+        data = {"version": self.version, "entries": self.entries}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(orjson.dumps(data))
+            tmp_path.replace(self.path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not write manifest {self.path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        self.changed = False
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+import orjson
+from loguru import logger
+
+from axie_studio.utils.version import get_version_info
+
+INDEX_FORMAT_VERSION = 1
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+
+def discover_component_modules(package_name: str, package_path: str | Path) -> dict[str, Path]:
+    """Lists the modules of a package and its subpackages without importing them.
+
+    Modules are listed in the same order as `pkgutil.walk_packages`: each package comes right before its
+    own modules. Packages are mapped to their `__init__.py` file.
+
+    Args:
+        package_name: The full name of the package, e.g. "axie_studio.components".
+        package_path: The directory of the package.
+
+    Returns:
+        A dictionary mapping the full name of each module to its source file.
+    """
+    modules: dict[str, Path] = {}
+
+    def _walk(prefix: str, directory: Path) -> None:
+        for entry in sorted(directory.iterdir(), key=lambda path: path.name):
+            if entry.is_dir():
+                init_file = entry / "__init__.py"
+                if entry.name.isidentifier() and init_file.is_file():
+                    modules[f"{prefix}.{entry.name}"] = init_file
+                    _walk(f"{prefix}.{entry.name}", entry)
+            elif entry.suffix == ".py" and entry.stem != "__init__" and entry.stem.isidentifier():
+                modules[f"{prefix}.{entry.stem}"] = entry
+
+    _walk(package_name, Path(package_path))
+    return modules
+
+
+def file_stamp(path: Path) -> list[int]:
+    """Returns the modification time and size of a file, used to tell whether it changed."""
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def compute_fingerprint(exclude: Path) -> str:
+    """Hashes the package version and the stamps of the package source files outside `exclude`.
+
+    Component templates are built from the component modules but also from the base classes, inputs and
+    template code they import, so any change to those invalidates the whole index.
+    """
+    digest = hashlib.sha256()
+    digest.update(str(INDEX_FORMAT_VERSION).encode())
+    digest.update(str(get_version_info().get("version")).encode())
+    for root, dirs, files in os.walk(PACKAGE_DIR):
+        root_path = Path(root)
+        dirs[:] = sorted(
+            name for name in dirs if name != "__pycache__" and (root_path / name).resolve() != exclude.resolve()
+        )
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = root_path / name
+                digest.update(f"{path.relative_to(PACKAGE_DIR)}:{file_stamp(path)}".encode())
+    return digest.hexdigest()
+
+
+class ComponentIndex:
+    """An on-disk index of the component templates built from each module of a package.
+
+    Each module entry is stored with the stamp of its source file, so at startup only the modules that
+    changed since the index was written have to be imported. The whole index is discarded when the
+    fingerprint changes, that is when the package is upgraded or any of its other source files changes.
+
+    Args:
+        path: The file the index is stored in.
+        fingerprint: The fingerprint of the code the templates were built with.
+    """
+
+    def __init__(self, path: Path, fingerprint: str) -> None:
+        self.path = path
+        self.fingerprint = fingerprint
+        self.modules: dict[str, dict[str, Any]] = {}
+        self.changed = False
+
+    @classmethod
+    def load(cls, path: Path, fingerprint: str) -> ComponentIndex:
+        """Reads the index from `path`, starting with an empty one if it is missing, invalid or outdated."""
+        index = cls(path, fingerprint)
+        try:
+            data = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return index
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring invalid component index {path}: {e}")
+            return index
+        if isinstance(data, dict) and data.get("fingerprint") == fingerprint:
+            index.modules = data.get("modules", {})
+        else:
+            logger.debug("Component index is outdated, rebuilding it")
+        return index
+
+    def get(self, modname: str, stamp: list[int]) -> tuple[str, dict] | None:
+        """Returns the indexed (top level package, components) of a module if its file did not change."""
+        entry = self.modules.get(modname)
+        if entry is None or entry["stamp"] != stamp:
+            return None
+        return entry["top_level"], entry["components"]
+
+    def set(self, modname: str, stamp: list[int], result: tuple[str, dict]) -> None:
+        top_level, components = result
+        self.modules[modname] = {"stamp": stamp, "top_level": top_level, "components": components}
+        self.changed = True
+
+    def prune(self, modnames: set[str]) -> None:
+        """Removes the modules that no longer exist."""
+        for modname in set(self.modules) - modnames:
+            del self.modules[modname]
+            self.changed = True
+
+    def save(self) -> None:
+        """Writes the index if it changed, replacing the file atomically."""
+        if not self.changed:
+            return
+        data = {"fingerprint": self.fingerprint, "modules": self.modules}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(orjson.dumps(data))
+            tmp_path.replace(self.path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not write component index {self.path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        self.changed = False
@@ -4,13 +4,21 @@ import asyncio
 import importlib
 import json
 import pkgutil
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
 from axie_studio.custom.utils import abuild_custom_components, create_component_template, get_all_types_dict
+from axie_studio.interface.component_index import (
+    ComponentIndex,
+    compute_fingerprint,
+    discover_component_modules,
+    file_stamp,
+)
 from axie_studio.services.settings.base import BASE_COMPONENTS_PATH
+from axie_studio.utils.compression import PrecompressedJSON
 
 if TYPE_CHECKING:
     from axie_studio.services.settings.service import SettingsService
@@ -18,6 +26,7 @@ if TYPE_CHECKING:
 
 MIN_MODULE_PARTS = 2
 EXPECTED_RESULT_LENGTH = 2  # Expected length of the tuple returned by _process_single_module
+COMPONENT_INDEX_FILENAME = "component_index.json"
 
 
 # Create a class to manage component cache instead of using globals
@@ -29,19 +38,52 @@ class ComponentCache:
         """
         self.all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        self.version = 0
+        self._payload: PrecompressedJSON | None = None
+        self._payload_version = -1
+        self._payload_lock = threading.Lock()
+
+    def set_all_types_dict(self, all_types_dict: dict[str, Any] | None) -> None:
+        """Replaces the cached component types, invalidating the serialized catalog."""
+        self.all_types_dict = all_types_dict
+        self.mark_changed()
+
+    def mark_changed(self) -> None:
+        """Invalidates the serialized catalog after `all_types_dict` was modified in place."""
+        self.version += 1
+
+    def _get_payload(self) -> PrecompressedJSON:
+        with self._payload_lock:
+            if self._payload is None or self._payload_version != self.version:
+                version = self.version
+                self._payload = PrecompressedJSON(self.all_types_dict)
+                self._payload_version = version
+            return self._payload
+
+    async def aget_payload(self) -> PrecompressedJSON:
+        """Returns the serialized and compressed component catalog, building it once per version."""
+        if self._payload is not None and self._payload_version == self.version:
+            return self._payload
+        return await asyncio.to_thread(self._get_payload)
 
 
 # Singleton instance
 component_cache = ComponentCache()
 
 
-async def import_langflow_components():
+async def import_langflow_components(index_path: Path | None = None):
     """Asynchronously discovers and loads all built-in Axie Studio components with module-level parallelization.
 
     Scans the `axie_studio.components` package and its submodules in parallel, instantiates classes that are subclasses
     of `Component` or `CustomComponent`, and generates their templates. Components are grouped by their
     top-level subpackage name.
 
+    If `index_path` is given, the templates are also stored in an on-disk `ComponentIndex` and only the modules
+    whose source file changed since the index was written are imported.
+
+    Args:
+        index_path: The file of the component index. If None, every module is imported.
+
     Returns:
         A dictionary with a "components" key mapping top-level package names to their component templates.
     """
@@ -52,25 +94,51 @@ async def import_langflow_components():
         logger.error(f"Failed to import axie_studio.components package: {e}", exc_info=True)
         return {"components": modules_dict}
 
-    # Collect all module names to process
-    module_names = []
-    for _, modname, _ in pkgutil.walk_packages(components_pkg.__path__, prefix=components_pkg.__name__ + "."):
-        # Skip if the module is in the deactivated folder
-        if "deactivated" not in modname:
-            module_names.append(modname)
+    if index_path is not None:
+        index = await asyncio.to_thread(_load_component_index, index_path, Path(components_pkg.__path__[0]))
+        module_files = await asyncio.to_thread(
+            discover_component_modules, components_pkg.__name__, components_pkg.__path__[0]
+        )
+        # Skip the modules in the deactivated folder
+        module_names = [modname for modname in module_files if "deactivated" not in modname]
+    else:
+        index = None
+        module_files = {}
+        # Collect all module names to process
+        module_names = []
+        for _, modname, _ in pkgutil.walk_packages(components_pkg.__path__, prefix=components_pkg.__name__ + "."):
+            # Skip if the module is in the deactivated folder
+            if "deactivated" not in modname:
+                module_names.append(modname)
 
     if not module_names:
         return {"components": modules_dict}
 
-    # Create tasks for parallel module processing
-    tasks = [asyncio.to_thread(_process_single_module, modname) for modname in module_names]
-
-    # Wait for all modules to be processed
-    try:
-        module_results = await asyncio.gather(*tasks, return_exceptions=True)
-    except Exception as e:  # noqa: BLE001
-        logger.error(f"Error during parallel module processing: {e}", exc_info=True)
+    results: dict[str, Any] = {}
+    if index is not None:
+        stamps = {modname: file_stamp(module_files[modname]) for modname in module_names}
+        for modname in module_names:
+            if (indexed := index.get(modname, stamps[modname])) is not None:
+                results[modname] = indexed
+        logger.debug(f"Loaded {len(results)} component modules from the component index")
+
+        # Like pkgutil.walk_packages, skip the modules of packages that cannot be imported
+        packages = [
+            modname
+            for modname in module_names
+            if modname not in results and module_files[modname].name == "__init__.py"
+        ]
+        if not await _process_modules(packages, results, index, stamps):
+            return {"components": modules_dict}
+        failed_prefixes = tuple(f"{modname}." for modname in packages if results[modname] is None)
+        module_names = [modname for modname in module_names if not modname.startswith(failed_prefixes)]
+        if not await _process_modules([m for m in module_names if m not in results], results, index, stamps):
+            return {"components": modules_dict}
+        index.prune(set(module_names))
+        await asyncio.to_thread(index.save)
+    elif not await _process_modules(module_names, results):
         return {"components": modules_dict}
+    module_results = [results[modname] for modname in module_names]
 
     # Merge results from all modules
     for result in module_results:
@@ -88,6 +156,35 @@ async def import_langflow_components():
     return {"components": modules_dict}
 
 
+async def _process_modules(
+    module_names: list[str],
+    results: dict[str, Any],
+    index: ComponentIndex | None = None,
+    stamps: dict[str, list[int]] | None = None,
+) -> bool:
+    """Processes modules in parallel, storing their results in `results` and in the component index.
+
+    Returns:
+        False if the modules could not be processed.
+    """
+    # Create tasks for parallel module processing
+    tasks = [asyncio.to_thread(_process_single_module, modname) for modname in module_names]
+
+    # Wait for all modules to be processed
+    try:
+        module_results = await asyncio.gather(*tasks, return_exceptions=True)
+    except Exception as e:  # noqa: BLE001
+        logger.error(f"Error during parallel module processing: {e}", exc_info=True)
+        return False
+
+    for modname, result in zip(module_names, module_results, strict=True):
+        results[modname] = result
+        # Modules that failed to import are not indexed so they are retried on the next start
+        if index is not None and stamps is not None and isinstance(result, tuple):
+            index.set(modname, stamps[modname], result)
+    return True
+
+
 def _process_single_module(modname: str) -> tuple[str, dict] | None:
     """Process a single module and return its components.
 
@@ -153,6 +250,17 @@ def _process_single_module(modname: str) -> tuple[str, dict] | None:
     return (top_level, module_components)
 
 
+def _load_component_index(index_path: Path, components_path: Path) -> ComponentIndex:
+    return ComponentIndex.load(index_path, compute_fingerprint(exclude=components_path))
+
+
+def _get_component_index_path(settings_service: SettingsService) -> Path | None:
+    settings = settings_service.settings
+    if not settings.component_index_enabled or not settings.config_dir:
+        return None
+    return Path(settings.config_dir) / COMPONENT_INDEX_FILENAME
+
+
 async def _determine_loading_strategy(settings_service: SettingsService) -> dict:
     """Determines and executes the appropriate component loading strategy.
 
@@ -189,7 +297,7 @@ async def get_and_cache_all_types_dict(
     if component_cache.all_types_dict is None:
         logger.debug("Building components cache")
 
-        langflow_components = await import_langflow_components()
+        langflow_components = await import_langflow_components(_get_component_index_path(settings_service))
         custom_components_dict = await _determine_loading_strategy(settings_service)
 
         # Log custom component loading stats
@@ -198,10 +306,12 @@ async def get_and_cache_all_types_dict(
             logger.debug(f"Built {component_count} custom components from {settings_service.settings.components_path}")
 
         # merge the dicts
-        component_cache.all_types_dict = {
-            **langflow_components["components"],
-            **custom_components_dict,
-        }
+        component_cache.set_all_types_dict(
+            {
+                **langflow_components["components"],
+                **custom_components_dict,
+            }
+        )
         component_count = sum(len(comps) for comps in component_cache.all_types_dict.values())
         logger.debug(f"Loaded {component_count} components")
     return component_cache.all_types_dict
@@ -380,6 +490,7 @@ async def ensure_component_loaded(component_type: str, component_name: str, sett
 
             # Mark as fully loaded
             component_cache.fully_loaded_components[component_key] = True
+            component_cache.mark_changed()
             logger.debug(f"Component {component_type}:{component_name} fully loaded")
         else:
             logger.warning(f"Failed to fully load component {component_type}:{component_name}")
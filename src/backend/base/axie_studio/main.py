@@ -31,6 +31,7 @@ from pydantic_core import PydanticSerializationError
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 
 from axie_studio.api import health_check_router, log_router, router
+from axie_studio.api.utils import persist_is_component
 from axie_studio.api.v1.mcp_projects import init_mcp_servers
 from axie_studio.initial_setup.setup import (
     create_or_update_starter_projects,
@@ -47,6 +48,7 @@ from axie_studio.services.deps import (
     get_queue_service,
     get_settings_service,
     get_telemetry_service,
+    session_scope,
 )
 from axie_studio.services.utils import initialize_services, teardown_services
 
@@ -201,6 +203,13 @@ def get_lifespan(*, fix_migration=False, version=None):
                 queue_service.start()
             logger.debug(f"Flows loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
+            # Flow header listings rely on the stored is_component flag, store it for the flows saved without it
+            current_time = asyncio.get_event_loop().time()
+            logger.debug("Storing the is_component flag of flows")
+            async with session_scope() as session:
+                await persist_is_component(session)
+            logger.debug(f"is_component flags stored in {asyncio.get_event_loop().time() - current_time:.2f}s")
+
             current_time = asyncio.get_event_loop().time()
             logger.debug("Loading mcp servers for projects")
             await init_mcp_servers()
@@ -1,12 +1,14 @@
 import asyncio
 import json
 from collections.abc import Sequence
+from datetime import datetime
+from typing import NamedTuple
 from uuid import UUID
 
 from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.messages import BaseMessage
 from loguru import logger
-from sqlalchemy import delete
+from sqlalchemy import and_, delete, or_
 from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -99,6 +101,92 @@ async def aget_messages(
         return [await Message.create(**d.model_dump()) for d in messages]
 
 
+class MessageCursor(NamedTuple):
+    """Position in a message history, used to fetch the messages older than a given one."""
+
+    timestamp: datetime
+    id: UUID
+
+
+class MessageHistoryPage(NamedTuple):
+    messages: list[Message]
+    """The messages of the page, from the oldest to the newest."""
+    next_cursor: MessageCursor | None
+    """The cursor of the next (older) page, or None if there are no older messages."""
+
+
+async def aget_message_history(
+    session_id: str | UUID | None = None,
+    *,
+    limit: int,
+    sender: str | None = None,
+    sender_name: str | None = None,
+    flow_id: UUID | None = None,
+    before: MessageCursor | None = None,
+) -> MessageHistoryPage:
+    """Retrieves the most recent messages of a session, for building prompts.
+
+    The selection of the `limit` most recent messages and the filters are done in the database, using the
+    (session_id, timestamp) index. Older messages are fetched by passing the `next_cursor` of a page as
+    `before`. Only the columns used by prompts are loaded and the messages are created without the files,
+    properties and content blocks of the stored messages.
+
+    Args:
+        session_id (Optional[str]): The session ID associated with the messages.
+        limit (int): The maximum number of messages to retrieve.
+        sender (Optional[str]): The sender of the messages (e.g., "Machine" or "User")
+        sender_name (Optional[str]): The name of the sender.
+        flow_id (Optional[UUID]): The flow ID associated with the messages.
+        before (Optional[MessageCursor]): Only retrieve the messages older than this cursor.
+
+    Returns:
+        MessageHistoryPage: The messages, from the oldest to the newest, and the cursor of the next page.
+    """
+    stmt = select(
+        MessageTable.id,
+        MessageTable.timestamp,
+        MessageTable.sender,
+        MessageTable.sender_name,
+        MessageTable.session_id,
+        MessageTable.text,
+        MessageTable.flow_id,
+    ).where(MessageTable.error == False)  # noqa: E712
+    if session_id:
+        stmt = stmt.where(MessageTable.session_id == session_id)
+    if sender:
+        stmt = stmt.where(MessageTable.sender == sender)
+    if sender_name:
+        stmt = stmt.where(MessageTable.sender_name == sender_name)
+    if flow_id:
+        stmt = stmt.where(MessageTable.flow_id == flow_id)
+    if before is not None:
+        stmt = stmt.where(
+            or_(
+                MessageTable.timestamp < before.timestamp,
+                and_(MessageTable.timestamp == before.timestamp, MessageTable.id < before.id),
+            )
+        )
+    stmt = stmt.order_by(col(MessageTable.timestamp).desc(), col(MessageTable.id).desc()).limit(limit)
+
+    async with session_scope() as session:
+        rows = list(await session.exec(stmt))
+    rows.reverse()
+    messages = [
+        Message(
+            id=row.id,
+            timestamp=row.timestamp,
+            sender=row.sender,
+            sender_name=row.sender_name,
+            session_id=row.session_id,
+            text=row.text,
+            flow_id=row.flow_id,
+        )
+        for row in rows
+    ]
+    next_cursor = MessageCursor(timestamp=rows[0].timestamp, id=rows[0].id) if len(rows) == limit else None
+    return MessageHistoryPage(messages=messages, next_cursor=next_cursor)
+
+
 def add_messages(messages: Message | list[Message], flow_id: str | UUID | None = None):
     """DEPRECATED - Add a message to the monitor service.
 
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import orjson
+from loguru import logger
+
+from axie_studio.graph.graph.base import Graph
+from axie_studio.processing.process import process_tweaks
+from axie_studio.schema.graph import Tweaks
+from axie_studio.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from axie_studio.services.database.models.flow.model import Flow
+
+BYTES_PER_MB = 1024 * 1024
+
+
+class GraphTemplateKey(NamedTuple):
+    flow_id: str
+    updated_at: str | None
+    tweaks_hash: str
+    stream: bool
+    user_id: str | None
+
+
+class GraphTemplate(NamedTuple):
+    graph: Graph
+    size: int
+
+
+def hash_tweaks(tweaks: Tweaks | dict[str, Any] | None) -> str:
+    """Returns a stable hash of the tweaks, independent of the order of their keys."""
+    if isinstance(tweaks, Tweaks):
+        tweaks = tweaks.model_dump()
+    if not tweaks:
+        return ""
+    serialized = orjson.dumps(tweaks, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+    return hashlib.sha256(serialized).hexdigest()
+
+
+class GraphTemplateCache:
+    """A per-worker LRU cache of graphs built from flows, used as templates for API runs.
+
+    Building a graph from a flow payload creates every vertex, edge and component from scratch. Templates
+    are built once per flow version (flow id, `updated_at`, tweaks, stream flag and user) and every run
+    gets a `Graph.clone` of them with fresh run state. Templates are never run themselves.
+
+    The cache is bounded by the approximate size of the flow data it holds (the length of the serialized
+    payload), evicting the least recently used templates first. The bound is read from the
+    `graph_template_cache_max_size` setting, in MB; 0 disables the cache.
+    """
+
+    def __init__(self, max_size: int | None = None) -> None:
+        self._templates: OrderedDict[GraphTemplateKey, GraphTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self.total_size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        """The maximum size of the cached flow data, in bytes."""
+        if self._max_size is not None:
+            return self._max_size
+        return get_settings_service().settings.graph_template_cache_max_size * BYTES_PER_MB
+
+    def get_graph(
+        self,
+        flow: Flow,
+        *,
+        tweaks: Tweaks | dict[str, Any] | None = None,
+        stream: bool = False,
+        user_id: str | None = None,
+    ) -> Graph:
+        """Returns a graph ready to run for the given flow, building its template if needed."""
+        if self.max_size <= 0:
+            return self.build_graph(flow, tweaks=tweaks, stream=stream, user_id=user_id)
+
+        key = GraphTemplateKey(
+            flow_id=str(flow.id),
+            updated_at=flow.updated_at.isoformat() if flow.updated_at else None,
+            tweaks_hash=hash_tweaks(tweaks),
+            stream=stream,
+            user_id=user_id,
+        )
+        template = self._get(key)
+        if template is None:
+            size = len(orjson.dumps(flow.data))
+            template = self.build_graph(flow, tweaks=tweaks, stream=stream, user_id=user_id)
+            self._set(key, GraphTemplate(graph=template, size=size))
+        try:
+            return template.clone()
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug(f"Could not clone graph template for flow {flow.id}")
+            self.invalidate(str(flow.id))
+            return self.build_graph(flow, tweaks=tweaks, stream=stream, user_id=user_id)
+
+    @staticmethod
+    def build_graph(
+        flow: Flow,
+        *,
+        tweaks: Tweaks | dict[str, Any] | None = None,
+        stream: bool = False,
+        user_id: str | None = None,
+    ) -> Graph:
+        """Builds a graph from the flow payload without using the cache."""
+        if flow.data is None:
+            msg = f"Flow {flow.id} has no data"
+            raise ValueError(msg)
+        graph_data = flow.data.copy()
+        graph_data = process_tweaks(graph_data, tweaks or {}, stream=stream)
+        return Graph.from_payload(graph_data, flow_id=str(flow.id), user_id=user_id, flow_name=flow.name)
+
+    def _get(self, key: GraphTemplateKey) -> Graph | None:
+        with self._lock:
+            template = self._templates.get(key)
+            if template is None:
+                self.misses += 1
+                return None
+            self._templates.move_to_end(key)
+            self.hits += 1
+            return template.graph
+
+    def _set(self, key: GraphTemplateKey, template: GraphTemplate) -> None:
+        max_size = self.max_size
+        if template.size > max_size:
+            return
+        with self._lock:
+            if (previous := self._templates.pop(key, None)) is not None:
+                self.total_size -= previous.size
+            # Drop the templates of older versions of the same flow, they can't be hit anymore
+            stale_keys = [k for k in self._templates if k.flow_id == key.flow_id and k.updated_at != key.updated_at]
+            for stale_key in stale_keys:
+                self.total_size -= self._templates.pop(stale_key).size
+            while self._templates and self.total_size + template.size > max_size:
+                _, evicted = self._templates.popitem(last=False)
+                self.total_size -= evicted.size
+            self._templates[key] = template
+            self.total_size += template.size
+
+    def invalidate(self, flow_id: str) -> None:
+        """Removes every template built from the given flow."""
+        with self._lock:
+            for key in [k for k in self._templates if k.flow_id == flow_id]:
+                self.total_size -= self._templates.pop(key).size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+            self.total_size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+
+graph_template_cache = GraphTemplateCache()
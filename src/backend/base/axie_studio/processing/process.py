@@ -32,8 +32,12 @@ async def run_graph_internal(
     inputs: list[InputValueRequest] | None = None,
     outputs: list[str] | None = None,
     event_manager: EventManager | None = None,
+    max_parallel_runs: int = 1,
 ) -> tuple[list[RunOutputs], str]:
-    """Run the graph and generate the result."""
+    """Run the graph and generate the result.
+
+    When `max_parallel_runs` is greater than 1, the inputs run concurrently on clones of the graph.
+    """
     inputs = inputs or []
     effective_session_id = session_id or flow_id
     components = []
@@ -47,7 +51,7 @@ async def run_graph_internal(
         inputs_list.append({INPUT_FIELD_NAME: input_value_request.input_value})
         types.append(input_value_request.type)
 
-    fallback_to_env_vars = get_settings_service().settings.fallback_to_env_var
+    settings = get_settings_service().settings
     graph.session_id = effective_session_id
     run_outputs = await graph.arun(
         inputs=inputs_list,
@@ -56,8 +60,11 @@ async def run_graph_internal(
         outputs=outputs or [],
         stream=stream,
         session_id=effective_session_id or "",
-        fallback_to_env_vars=fallback_to_env_vars,
+        fallback_to_env_vars=settings.fallback_to_env_var,
         event_manager=event_manager,
+        execution_mode=settings.graph_execution_mode,
+        max_concurrency=settings.graph_max_concurrency,
+        max_parallel_runs=max_parallel_runs,
     )
     return run_outputs, effective_session_id
 
@@ -1,11 +1,21 @@
 import asyncio
 from collections import defaultdict
 from threading import RLock
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import orjson
+
+from axie_studio.serialization import serialize
 from axie_studio.services.base import Service
 from axie_studio.services.cache.base import AsyncBaseCacheService, CacheService
-from axie_studio.services.deps import get_cache_service
+from axie_studio.services.cache.service import AsyncInMemoryCache
+from axie_studio.services.cache.utils import CacheMiss
+from axie_studio.services.deps import get_cache_service, get_settings_service
+
+if TYPE_CHECKING:
+    from axie_studio.graph.graph.base import Graph
+
+RUN_STATE_PREFIX = "run_state"
 
 
 class ChatService(Service):
@@ -17,6 +27,9 @@ class ChatService(Service):
         self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
+        # Live graphs of interactive builds hold built objects, so they stay in this worker instead of being
+        # pickled into the cache service. Only their compact run state is shared.
+        self.graph_cache = AsyncInMemoryCache(expiration_time=get_settings_service().settings.cache_expire)
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
         """Set the cache for a client.
@@ -33,12 +46,11 @@ class ChatService(Service):
             "result": data,
             "type": type(data),
         }
+        # The entry is always replaced as a whole, so a plain set avoids the get-then-set round trip of upsert
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            await self.cache_service.upsert(str(key), result_dict, lock=lock or self.async_cache_locks[key])
+            await self.cache_service.set(str(key), result_dict, lock=lock or self.async_cache_locks[key])
             return await self.cache_service.contains(key)
-        await asyncio.to_thread(
-            self.cache_service.upsert, str(key), result_dict, lock=lock or self._sync_cache_locks[key]
-        )
+        await asyncio.to_thread(self.cache_service.set, str(key), result_dict, lock=lock or self._sync_cache_locks[key])
         return key in self.cache_service
 
     async def get_cache(self, key: str, lock: asyncio.Lock | None = None) -> Any:
@@ -65,3 +77,97 @@ class ChatService(Service):
         if isinstance(self.cache_service, AsyncBaseCacheService):
             return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
         return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
+
+    async def set_graph(self, flow_id: str, graph: "Graph") -> None:
+        """Keep the live graph of an interactive build of a flow in this worker.
+
+        The graph is not serialized. The ID of its run is stored in the cache service, so a worker that does
+        not have the graph can rebuild it and restore the state of the run with `get_graph_run_id`.
+
+        Args:
+            flow_id (str): The ID of the flow.
+            graph (Graph): The graph being built.
+        """
+        await self.graph_cache.set(flow_id, graph)
+        await self._cache_set(self._run_state_key("flow", flow_id), graph.run_id)
+
+    async def get_graph(self, flow_id: str) -> "Graph | CacheMiss":
+        """Get the live graph of an interactive build of a flow, or a CacheMiss if this worker does not have it.
+
+        Args:
+            flow_id (str): The ID of the flow.
+        """
+        return await self.graph_cache.get(flow_id)
+
+    async def clear_graph(self, flow_id: str) -> None:
+        """Forget the live graph of an interactive build of a flow and the run it belongs to.
+
+        Args:
+            flow_id (str): The ID of the flow.
+        """
+        await self.graph_cache.delete(flow_id)
+        await self._cache_delete(self._run_state_key("flow", flow_id))
+
+    async def get_graph_run_id(self, flow_id: str) -> str | None:
+        """Get the ID of the run of the latest interactive build of a flow.
+
+        Args:
+            flow_id (str): The ID of the flow.
+
+        Returns:
+            str | None: The run ID, or None if there is no build of the flow.
+        """
+        value = await self._cache_get(self._run_state_key("flow", flow_id))
+        return None if isinstance(value, CacheMiss) else value
+
+    async def set_run_state(self, run_id: str, records: dict[str, Any]) -> None:
+        """Store records of the state of a run.
+
+        Each record is stored under its own key, so a run only writes the records that changed, and
+        concurrent runs of the same flow never overwrite each other. Records are serialized to compact
+        JSON strings instead of pickling the objects they come from.
+
+        Args:
+            run_id (str): The ID of the run.
+            records (dict[str, Any]): The records to store, by name.
+        """
+        for name, record in records.items():
+            await self._cache_set(self._run_state_key(run_id, name), orjson.dumps(serialize(record)).decode())
+
+    async def get_run_state(self, run_id: str, names: list[str]) -> dict[str, Any]:
+        """Get records of the state of a run.
+
+        Args:
+            run_id (str): The ID of the run.
+            names (list[str]): The names of the records to get.
+
+        Returns:
+            dict[str, Any]: The records that were found, by name.
+        """
+        records: dict[str, Any] = {}
+        for name in names:
+            value = await self._cache_get(self._run_state_key(run_id, name))
+            if not isinstance(value, CacheMiss) and value is not None:
+                records[name] = orjson.loads(value)
+        return records
+
+    async def _cache_set(self, key: str, value: str) -> None:
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            await self.cache_service.set(key, value)
+        else:
+            await asyncio.to_thread(self.cache_service.set, key, value)
+
+    async def _cache_get(self, key: str) -> Any:
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            return await self.cache_service.get(key)
+        return await asyncio.to_thread(self.cache_service.get, key)
+
+    async def _cache_delete(self, key: str) -> None:
+        if isinstance(self.cache_service, AsyncBaseCacheService):
+            await self.cache_service.delete(key)
+        else:
+            await asyncio.to_thread(self.cache_service.delete, key)
+
+    @staticmethod
+    def _run_state_key(run_id: str, name: str) -> str:
+        return f"{RUN_STATE_PREFIX}:{run_id}:{name}"
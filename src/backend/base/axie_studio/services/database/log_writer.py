@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from axie_studio.services.database.models.transactions.crud import log_transactions, trim_transactions
+from axie_studio.services.database.models.transactions.model import TransactionBase
+from axie_studio.services.database.models.vertex_builds.crud import log_vertex_builds, trim_vertex_builds
+from axie_studio.services.database.models.vertex_builds.model import VertexBuildBase
+from axie_studio.services.database.utils import session_getter
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from axie_studio.services.database.service import DatabaseService
+    from axie_studio.services.settings.base import Settings
+
+BuildLogRecord = TransactionBase | VertexBuildBase
+
+
+class BuildLogWriter:
+    """Writes transaction and vertex build records to the database in the background, in batches.
+
+    Records are put in a bounded queue and a worker task inserts them in batches of up to
+    `build_log_batch_size` records, waiting at most `build_log_flush_interval` seconds for a batch to
+    fill up. When the queue is full, `put` waits for the worker to catch up.
+
+    The history limits (`max_transactions_to_keep`, `max_vertex_builds_to_keep` and
+    `max_vertex_builds_per_vertex`) are enforced at most once every `build_log_trim_interval` seconds,
+    only for the flows and vertices written since the last trim, so the tables can briefly hold more
+    records than the limits allow.
+
+    If a batch can't be written, its records are written again one at a time, so only the records that
+    fail themselves are dropped.
+    """
+
+    def __init__(self, database_service: DatabaseService) -> None:
+        self.database_service = database_service
+        self._queue: asyncio.Queue[BuildLogRecord] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._worker_task: asyncio.Task | None = None
+        self._transaction_flows: set[UUID] = set()
+        self._vertex_builds: set[tuple[UUID, str]] = set()
+        self._last_trim = time.monotonic()
+
+    @property
+    def settings(self) -> Settings:
+        return self.database_service.settings_service.settings
+
+    def _ensure_started(self) -> asyncio.Queue[BuildLogRecord]:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop or self._worker_task is None or self._worker_task.done():
+            if self._loop is not loop:
+                self._queue = asyncio.Queue(maxsize=self.settings.build_log_queue_size)
+                self._loop = loop
+            self._worker_task = asyncio.create_task(self._worker(), name="build-log-writer")
+        return self._queue
+
+    async def put(self, record: BuildLogRecord) -> None:
+        """Queues a record to be written, waiting if the queue is full."""
+        await self._ensure_started().put(record)
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            deadline = time.monotonic() + self.settings.build_log_flush_interval
+            while len(batch) < self.settings.build_log_batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._write_batch(batch)
+                await self._trim_if_due()
+            except Exception:  # noqa: BLE001
+                logger.exception("Error trimming build logs")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write_batch(self, batch: list[BuildLogRecord]) -> None:
+        try:
+            await self._write(batch)
+        except Exception:  # noqa: BLE001
+            if len(batch) == 1:
+                logger.exception("Error writing build log, dropping it")
+                return
+            logger.opt(exception=True).warning(f"Error writing {len(batch)} build logs, writing them one at a time")
+            for record in batch:
+                await self._write_batch([record])
+
+    async def _write(self, batch: list[BuildLogRecord]) -> None:
+        transactions = [record for record in batch if isinstance(record, TransactionBase)]
+        vertex_builds = [record for record in batch if isinstance(record, VertexBuildBase)]
+        async with session_getter(self.database_service) as session:
+            if transactions:
+                with session.no_autoflush:
+                    await log_transactions(session, transactions)
+                self._transaction_flows.update(transaction.flow_id for transaction in transactions)
+            if vertex_builds:
+                await log_vertex_builds(session, vertex_builds)
+                self._vertex_builds.update((vertex_build.flow_id, vertex_build.id) for vertex_build in vertex_builds)
+        logger.debug(f"Logged {len(transactions)} transactions and {len(vertex_builds)} vertex builds")
+
+    async def _trim_if_due(self) -> None:
+        if time.monotonic() - self._last_trim >= self.settings.build_log_trim_interval:
+            await self._trim()
+
+    async def _trim(self) -> None:
+        self._last_trim = time.monotonic()
+        transaction_flows, self._transaction_flows = self._transaction_flows, set()
+        vertex_builds, self._vertex_builds = self._vertex_builds, set()
+        async with session_getter(self.database_service) as session:
+            if transaction_flows:
+                await trim_transactions(session, transaction_flows)
+            if vertex_builds:
+                await trim_vertex_builds(session, vertex_builds)
+
+    async def flush(self) -> None:
+        """Waits until every queued record is written and enforces the history limits if they are due."""
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return
+        if self._worker_task is not None and not self._worker_task.done():
+            await self._queue.join()
+        await self._trim_if_due()
+
+    async def stop(self) -> None:
+        """Writes every queued record and stops the worker."""
+        try:
+            await self.flush()
+            if self._loop is asyncio.get_running_loop():
+                await self._trim()
+        except Exception:  # noqa: BLE001
+            logger.exception("Error flushing build logs")
+        if self._worker_task is not None and self._loop is asyncio.get_running_loop():
+            self._worker_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker_task
+        self._worker_task = None
@@ -1,10 +1,16 @@
+import asyncio
 import datetime
+import hashlib
 import secrets
-from typing import TYPE_CHECKING
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, NamedTuple
 from uuid import UUID
 
+from loguru import logger
 from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlmodel import select, update
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from axie_studio.services.database.models.api_key.model import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
@@ -15,6 +21,110 @@ if TYPE_CHECKING:
     from sqlmodel.sql.expression import SelectOfScalar
 
 
+class CachedApiKey(NamedTuple):
+    api_key_id: UUID
+    user: User
+    expires_at: float
+
+
+class ApiKeyCache:
+    """A TTL cache of verified API keys, mapping the SHA-256 hash of each key to its ID and user.
+
+    Keys are only kept as hashes. Entries expire `ttl` seconds after they are cached and the least
+    recently used entries are evicted once `max_size` entries are cached.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[str, CachedApiKey] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _hash(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+    def get(self, api_key: str) -> CachedApiKey | None:
+        key = self._hash(api_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, api_key: str, api_key_id: UUID, user: User, ttl: float) -> None:
+        key = self._hash(api_key)
+        # Keep a copy that is not attached to the caller's session
+        user = User(**user.model_dump())
+        with self._lock:
+            self._entries[key] = CachedApiKey(api_key_id, user, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *, api_key_id: UUID | None = None, user_id: UUID | None = None) -> None:
+        """Removes the entries of an API key or of all the API keys of a user."""
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry.api_key_id == api_key_id or entry.user.id == user_id:
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class ApiKeyUsageTracker:
+    """Counts API key uses in memory and adds them to the database in bulk.
+
+    Uses are written at most once every `flush_interval` seconds, in a background task, so the
+    `total_uses` and `last_used_at` columns can lag behind by that long.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[UUID, tuple[int, datetime.datetime]] = {}
+        self._last_flush = time.monotonic()
+        self._flush_task: asyncio.Task | None = None
+
+    async def record(self, api_key_id: UUID, flush_interval: float) -> None:
+        uses, _ = self._pending.get(api_key_id, (0, None))
+        self._pending[api_key_id] = (uses + 1, datetime.datetime.now(datetime.timezone.utc))
+        if flush_interval <= 0:
+            await self.flush()
+        elif time.monotonic() - self._last_flush >= flush_interval and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self.flush(), name="api-key-usage-flush")
+
+    async def flush(self) -> None:
+        """Adds the pending uses to the database."""
+        self._last_flush = time.monotonic()
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            async with session_scope() as session:
+                for api_key_id, (uses, last_used_at) in pending.items():
+                    await session.exec(
+                        update(ApiKey)
+                        .where(ApiKey.id == api_key_id)
+                        .values(total_uses=ApiKey.total_uses + uses, last_used_at=last_used_at)
+                    )
+        except Exception:  # noqa: BLE001
+            logger.exception("Error updating API key usage")
+            # Keep the uses so they are written with the next flush
+            for api_key_id, (uses, last_used_at) in pending.items():
+                pending_uses, _ = self._pending.get(api_key_id, (0, None))
+                self._pending[api_key_id] = (pending_uses + uses, last_used_at)
+
+
+api_key_cache = ApiKeyCache()
+api_key_usage = ApiKeyUsageTracker()
+
+
 async def get_api_keys(session: AsyncSession, user_id: UUID) -> list[ApiKeyRead]:
     query: SelectOfScalar = select(ApiKey).where(ApiKey.user_id == user_id)
     api_keys = (await session.exec(query)).all()
@@ -47,18 +157,30 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
         raise ValueError(msg)
     await session.delete(api_key)
     await session.commit()
+    api_key_cache.invalidate(api_key_id=api_key_id)
 
 
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
-    """Check if the API key is valid."""
-    query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
-    api_key_object: ApiKey | None = (await session.exec(query)).first()
-    if api_key_object is not None:
-        settings_service = get_settings_service()
-        if settings_service.settings.disable_track_apikey_usage is not True:
-            await update_total_uses(api_key_object.id)
-        return api_key_object.user
-    return None
+    """Check if the API key is valid.
+
+    Verified keys are cached for `api_key_cache_ttl` seconds, if set, and their uses are counted in memory and
+    written to the database every `api_key_usage_flush_interval` seconds.
+    """
+    settings = get_settings_service().settings
+    cached = api_key_cache.get(api_key)
+    if cached is not None:
+        api_key_id, user = cached.api_key_id, cached.user
+    else:
+        query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
+        api_key_object: ApiKey | None = (await session.exec(query)).first()
+        if api_key_object is None:
+            return None
+        api_key_id, user = api_key_object.id, api_key_object.user
+        if settings.api_key_cache_ttl > 0:
+            api_key_cache.set(api_key, api_key_id, user, settings.api_key_cache_ttl)
+    if settings.disable_track_apikey_usage is not True:
+        await api_key_usage.record(api_key_id, settings.api_key_usage_flush_interval)
+    return user
 
 
 async def update_total_uses(api_key_id: UUID):
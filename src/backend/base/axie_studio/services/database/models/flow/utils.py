@@ -3,6 +3,24 @@ from axie_studio.utils.version import get_version_info
 from .model import Flow
 
 
+def infer_is_component(data: dict) -> bool:
+    """Returns True if the data is a component, falling back to whether it has a single node."""
+    is_component = data.get("is_component")
+    if is_component is not None:
+        return is_component
+    return len(data.get("nodes", [])) == 1
+
+
+def set_is_component(flow: Flow) -> Flow:
+    """Sets the `is_component` flag of a flow that doesn't have one from its data.
+
+    Flow header listings filter on the stored flag without loading the data, so every new flow must have it.
+    """
+    if flow.is_component is None and flow.data:
+        flow.is_component = infer_is_component(flow.data)
+    return flow
+
+
 def get_webhook_component_in_flow(flow_data: dict):
     """Get webhook component in flow data."""
     if "nodes" in flow_data:
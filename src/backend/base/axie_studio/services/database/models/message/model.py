@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Annotated
 from uuid import UUID, uuid4
 
 from pydantic import ConfigDict, field_serializer, field_validator
-from sqlalchemy import Text
+from sqlalchemy import Index, Text
 from sqlmodel import JSON, Column, Field, SQLModel
 
 from axie_studio.schema.content_block import ContentBlock
@@ -117,6 +117,7 @@ class MessageBase(SQLModel):
 class MessageTable(MessageBase, table=True):  # type: ignore[call-arg]
     model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
     __tablename__ = "message"
+    __table_args__ = (Index("ix_message_session_id_timestamp", "session_id", "timestamp"),)
     id: UUID = Field(default_factory=uuid4, primary_key=True)
 
     flow_id: UUID | None = Field(default=None)
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from uuid import UUID
 
 from loguru import logger
@@ -74,6 +75,56 @@ async def log_transaction(db: AsyncSession, transaction: TransactionBase) -> Tra
     return table
 
 
+async def log_transactions(db: AsyncSession, transactions: list[TransactionBase]) -> list[TransactionTable]:
+    """Insert several transactions in a single transaction, without enforcing the maximum number kept.
+
+    The maximum is enforced separately by `trim_transactions`, so it can be enforced once for a whole batch.
+    Transactions without a flow_id are skipped.
+
+    Args:
+        db: Database session
+        transactions: Transaction data to log
+
+    Returns:
+        The created TransactionTable entries
+    """
+    tables = [TransactionTable(**transaction.model_dump()) for transaction in transactions if transaction.flow_id]
+    try:
+        db.add_all(tables)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return tables
+
+
+async def trim_transactions(db: AsyncSession, flow_ids: Iterable[UUID], max_entries: int | None = None) -> None:
+    """Delete the oldest transactions of the given flows, keeping the newest `max_entries` of each.
+
+    Args:
+        db: Database session
+        flow_ids: The flows whose transactions to trim
+        max_entries: The number of transactions to keep per flow. If None, uses system settings.
+    """
+    max_entries = max_entries or get_settings_service().settings.max_transactions_to_keep
+    try:
+        for flow_id in flow_ids:
+            delete_older = delete(TransactionTable).where(
+                TransactionTable.flow_id == flow_id,
+                col(TransactionTable.id).in_(
+                    select(TransactionTable.id)
+                    .where(TransactionTable.flow_id == flow_id)
+                    .order_by(col(TransactionTable.timestamp).desc())
+                    .offset(max_entries)
+                ),
+            )
+            await db.exec(delete_older)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 def transform_transaction_table(
     transaction: list[TransactionTable] | TransactionTable,
 ) -> list[TransactionReadResponse]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import re
 import sqlite3
 import time
@@ -13,6 +14,7 @@ import anyio
 import sqlalchemy as sa
 from alembic import command, util
 from alembic.config import Config
+from alembic.script import ScriptDirectory
 from loguru import logger
 from sqlalchemy import event, exc, inspect
 from sqlalchemy.dialects import sqlite as dialect_sqlite
@@ -26,6 +28,8 @@ from tenacity import retry, stop_after_attempt, wait_fixed
 from axie_studio.initial_setup.constants import STARTER_FOLDER_NAME
 from axie_studio.services.base import Service
 from axie_studio.services.database import models
+from axie_studio.services.database.log_writer import BuildLogWriter
+from axie_studio.services.database.models.api_key.crud import api_key_usage
 from axie_studio.services.database.models.user.crud import get_user_by_username
 from axie_studio.services.database.session import NoopSession
 from axie_studio.services.database.utils import Result, TableResults
@@ -33,8 +37,17 @@ from axie_studio.services.deps import get_settings_service
 from axie_studio.services.utils import teardown_superuser
 
 if TYPE_CHECKING:
+    from typing import TextIO
+
     from axie_studio.services.settings.service import SettingsService
 
+# Keeps the fingerprint of the models the schema of the database was last checked against
+SCHEMA_FINGERPRINT_TABLE = "schema_fingerprint"
+# Not part of the models' metadata, so it is left out of the fingerprint and of the migrations
+schema_fingerprint_table = sa.Table(
+    SCHEMA_FINGERPRINT_TABLE, sa.MetaData(), sa.Column("fingerprint", sa.String(64), nullable=False)
+)
+
 
 class DatabaseService(Service):
     name = "database_service"
@@ -42,6 +55,7 @@ class DatabaseService(Service):
     def __init__(self, settings_service: SettingsService):
         self._logged_pragma = False
         self.settings_service = settings_service
+        self.log_writer = BuildLogWriter(self)
         if settings_service.settings.database_url is None:
             msg = "No database URL provided"
             raise ValueError(msg)
@@ -308,6 +322,81 @@ class DatabaseService(Service):
         async with self.with_session() as session, session.bind.connect() as conn:
             await conn.run_sync(self._check_schema_health)
 
+    def _alembic_config(self, stdout: TextIO) -> Config:
+        alembic_cfg = Config(stdout=stdout)
+        alembic_cfg.set_main_option("script_location", str(self.script_location))
+        alembic_cfg.set_main_option("sqlalchemy.url", self.database_url.replace("%", "%%"))
+        return alembic_cfg
+
+    def get_script_heads(self) -> set[str]:
+        """Returns the head revisions of the migration scripts."""
+        return set(ScriptDirectory(str(self.script_location)).get_heads())
+
+    @staticmethod
+    def get_schema_fingerprint(heads: set[str]) -> str:
+        """Returns a hash of the tables, columns and indexes of the models and of the head revisions.
+
+        It changes whenever a model changes, even without a new migration, so a stored fingerprint tells
+        whether the schema of the database was checked against the current models.
+        """
+        digest = hashlib.sha256()
+        for head in sorted(heads):
+            digest.update(f"head:{head}\n".encode())
+        for table in sorted(SQLModel.metadata.tables.values(), key=lambda table: table.name):
+            digest.update(f"table:{table.name}\n".encode())
+            for column in table.columns:
+                digest.update(f"column:{column.name}:{column.type!r}:{column.nullable}:{column.primary_key}\n".encode())
+            for index in sorted(table.indexes, key=lambda index: index.name or ""):
+                columns = ",".join(column.name for column in index.columns)
+                digest.update(f"index:{index.name}:{columns}:{index.unique}\n".encode())
+        return digest.hexdigest()
+
+    async def is_schema_current(self) -> bool:
+        """Tells whether the database is at the head revision and was checked against the current models.
+
+        This only reads the `alembic_version` and `schema_fingerprint` tables, so it is much cheaper than
+        reflecting the schema and comparing it with the models like `run_migrations` does.
+        """
+        heads = await asyncio.to_thread(self.get_script_heads)
+        fingerprint = self.get_schema_fingerprint(heads)
+        try:
+            async with self.with_session() as session:
+                rows = (await session.exec(text("SELECT version_num FROM alembic_version"))).all()
+                revisions = {row[0] for row in rows}
+                stored = (await session.exec(select(schema_fingerprint_table.c.fingerprint))).first()
+        except Exception as exc:  # noqa: BLE001
+            # Databases that were never checked don't have the tables yet
+            logger.debug(f"Could not read the schema revision: {exc}")
+            return False
+        if revisions != heads:
+            logger.debug(f"Database revision {revisions} is not the head revision {heads}")
+            return False
+        return stored == fingerprint
+
+    async def save_schema_fingerprint(self) -> None:
+        """Records that the schema of the database was checked against the current models."""
+        heads = await asyncio.to_thread(self.get_script_heads)
+        fingerprint = self.get_schema_fingerprint(heads)
+        async with self.with_session() as session:
+            connection = await session.connection()
+            await connection.run_sync(schema_fingerprint_table.create, checkfirst=True)
+            await session.exec(sa.delete(schema_fingerprint_table))
+            await session.exec(sa.insert(schema_fingerprint_table).values(fingerprint=fingerprint))
+            await session.commit()
+
+    def _check_migrations(self) -> None:
+        with self.alembic_log_path.open("a", encoding="utf-8") as buffer:
+            buffer.write(f"{datetime.now(tz=timezone.utc).astimezone().isoformat()}: Checking migrations\n")
+            command.check(self._alembic_config(buffer))
+
+    async def check_migrations(self) -> None:
+        """Runs the full migration check, comparing the schema of the database with the models.
+
+        Raises:
+            AutogenerateDiffsDetected: If the schema differs from the models.
+        """
+        await asyncio.to_thread(self._check_migrations)
+
     @staticmethod
     def init_alembic(alembic_cfg) -> None:
         logger.info("Initializing alembic")
@@ -315,7 +404,8 @@ class DatabaseService(Service):
         # alembic_cfg.attributes["connection"].commit()
         command.upgrade(alembic_cfg, "head")
 
-    def _run_migrations(self, should_initialize_alembic, fix) -> None:
+    def _run_migrations(self, should_initialize_alembic, fix) -> bool:
+        """Upgrades the database and returns whether `command.check` found it matching the models."""
         # First we need to check if alembic has been initialized
         # If not, we need to initialize it
         # if not self.script_location.exists(): # this is not the correct way to check if alembic has been initialized
@@ -326,10 +416,7 @@ class DatabaseService(Service):
         # I don't want to output anything
         # subprocess.DEVNULL is an int
         with self.alembic_log_path.open("w", encoding="utf-8") as buffer:
-            alembic_cfg = Config(stdout=buffer)
-            # alembic_cfg.attributes["connection"] = session
-            alembic_cfg.set_main_option("script_location", str(self.script_location))
-            alembic_cfg.set_main_option("sqlalchemy.url", self.database_url.replace("%", "%%"))
+            alembic_cfg = self._alembic_config(buffer)
 
             if should_initialize_alembic:
                 try:
@@ -341,10 +428,12 @@ class DatabaseService(Service):
             else:
                 logger.debug("Alembic initialized")
 
+            checked = True
             try:
                 buffer.write(f"{datetime.now(tz=timezone.utc).astimezone().isoformat()}: Checking migrations\n")
                 command.check(alembic_cfg)
             except Exception as exc:  # noqa: BLE001
+                checked = False
                 logger.debug(f"Error checking migrations: {exc}")
                 if isinstance(exc, util.exc.CommandError | util.exc.AutogenerateDiffsDetected):
                     command.upgrade(alembic_cfg, "head")
@@ -362,7 +451,8 @@ class DatabaseService(Service):
                     raise RuntimeError(msg) from exc
 
             if fix:
-                self.try_downgrade_upgrade_until_success(alembic_cfg)
+                checked = self.try_downgrade_upgrade_until_success(alembic_cfg)
+        return checked
 
     async def run_migrations(self, *, fix=False) -> None:
         should_initialize_alembic = False
@@ -374,16 +464,18 @@ class DatabaseService(Service):
             except Exception:  # noqa: BLE001
                 logger.debug("Alembic not initialized")
                 should_initialize_alembic = True
-        await asyncio.to_thread(self._run_migrations, should_initialize_alembic, fix)
+        checked = await asyncio.to_thread(self._run_migrations, should_initialize_alembic, fix)
+        # Like `migration --check`, only a schema that passed the check is recorded as current
+        if checked:
+            await self.save_schema_fingerprint()
 
     @staticmethod
-    def try_downgrade_upgrade_until_success(alembic_cfg, retries=5) -> None:
+    def try_downgrade_upgrade_until_success(alembic_cfg, retries=5) -> bool:
         # Try -1 then head, if it fails, try -2 then head, etc.
         # until we reach the number of retries
         for i in range(1, retries + 1):
             try:
                 command.check(alembic_cfg)
-                break
             except util.exc.AutogenerateDiffsDetected:
                 # downgrade to base and upgrade again
                 logger.warning("AutogenerateDiffsDetected")
@@ -391,6 +483,9 @@ class DatabaseService(Service):
                 # wait for the database to be ready
                 time.sleep(3)
                 command.upgrade(alembic_cfg, "head")
+            else:
+                return True
+        return False
 
     async def run_migrations_test(self):
         # This method is used for testing purposes only
@@ -474,6 +569,8 @@ class DatabaseService(Service):
 
     async def teardown(self) -> None:
         logger.debug("Tearing down database")
+        await self.log_writer.stop()
+        await api_key_usage.flush()
         try:
             settings_service = get_settings_service()
             # remove the default superuser if auto_login is enabled
@@ -18,6 +18,13 @@ async def initialize_database(*, fix_migration: bool = False) -> None:
     from axie_studio.services.deps import get_db_service
 
     database_service: DatabaseService = get_db_service()
+    if (
+        database_service.settings_service.settings.fast_migration_check
+        and not fix_migration
+        and await database_service.is_schema_current()
+    ):
+        logger.debug("Database schema is at the head revision and was already checked, skipping migrations")
+        return
     try:
         if database_service.settings_service.settings.database_connection_retry:
             await database_service.create_db_and_tables_with_retry()
@@ -18,6 +18,7 @@ from axie_studio.services.auth.utils import (
 )
 from axie_studio.services.cache.service import AsyncBaseCacheService
 from axie_studio.services.database.models import Flow, User, Variable
+from axie_studio.services.database.models.flow.utils import set_is_component
 from axie_studio.services.database.utils import initialize_database
 from axie_studio.services.deps import get_cache_service, get_storage_service, session_scope
 from axie_studio.utils.util import update_settings
@@ -175,9 +176,13 @@ class AxieStudioRunnerExperimental:
     async def add_flow_to_db(flow_dict: dict, user_id: str | None):
         async with session_scope() as session:
             flow_db = Flow(
-                name=flow_dict.get("name"), id=UUID(flow_dict["id"]), data=flow_dict.get("data", {}), user_id=user_id
+                name=flow_dict.get("name"),
+                id=UUID(flow_dict["id"]),
+                data=flow_dict.get("data", {}),
+                user_id=user_id,
+                is_component=flow_dict.get("is_component"),
             )
-            session.add(flow_db)
+            session.add(set_is_component(flow_db))
             await session.commit()
 
     @staticmethod
@@ -82,6 +82,10 @@ class Settings(BaseSettings):
     `postgresql+psycopg` respectively)."""
     database_connection_retry: bool = False
     """If True, Axie Studio will retry to connect to the database if it fails."""
+    fast_migration_check: bool = True
+    """If True, the full migration check at startup, which reflects the database schema and compares it with the
+    models, is skipped when the database is at the head revision and its schema was already checked against the
+    current models. Run `axie-studio migration --check` to run the full check explicitly."""
     pool_size: int = 20
     """The number of connections to keep open in the connection pool.
     For high load scenarios, this should be increased based on expected concurrent users."""
@@ -144,6 +148,14 @@ class Settings(BaseSettings):
     """The port on which Langflow will expose Prometheus metrics. 9090 is the default port."""
 
     disable_track_apikey_usage: bool = False
+    api_key_cache_ttl: float = Field(default=0.0, ge=0)
+    """The number of seconds a verified API key is cached for. 0 (the default) checks every API key against the
+    database. The cache is per worker and deleting a key or deactivating a user only clears the cache of the
+    worker handling that request, so with a TTL a revoked key stays valid on the other workers for up to that
+    many seconds. Only set it if that delay is acceptable."""
+    api_key_usage_flush_interval: float = Field(default=10.0, ge=0)
+    """The interval in seconds at which API key uses are written to the database. Set to 0 to write every use
+    right away."""
     remove_api_keys: bool = False
     components_path: list[str] = []
     langchain_cache: str = "InMemoryCache"
@@ -224,12 +236,30 @@ class Settings(BaseSettings):
     """The maximum file size for the upload in MB."""
     deactivate_tracing: bool = False
     """If set to True, tracing will be deactivated."""
+    tracing_max_workers: int = Field(default=4, ge=1)
+    """The number of threads the tracers run on, so they do not block component builds."""
+    tracing_queue_size: int = Field(default=10000, ge=1)
+    """The maximum number of trace events waiting to be sent to each tracer of a run. When it is reached, the
+    oldest component trace that has not been sent yet is dropped, together with its end."""
+    tracing_callback_timeout: float = Field(default=5.0, gt=0)
+    """How long, in seconds, to wait for a tracer to catch up before handing out its LangChain callback. A tracer
+    that is still behind gives no callback."""
     max_transactions_to_keep: int = 3000
     """The maximum number of transactions to keep in the database."""
     max_vertex_builds_to_keep: int = 3000
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    build_log_batch_size: int = Field(default=100, ge=1)
+    """The maximum number of transactions and vertex builds written to the database in a single batch."""
+    build_log_flush_interval: float = Field(default=1.0, ge=0)
+    """The maximum time in seconds transactions and vertex builds wait to be written to the database."""
+    build_log_queue_size: int = Field(default=10000, ge=1)
+    """The maximum number of transactions and vertex builds waiting to be written to the database. When it is
+    reached, builds wait for the pending records to be written."""
+    build_log_trim_interval: float = Field(default=30.0, ge=0)
+    """The interval in seconds at which old transactions and vertex builds are deleted to enforce
+    max_transactions_to_keep, max_vertex_builds_to_keep and max_vertex_builds_per_vertex."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
@@ -260,6 +290,51 @@ class Settings(BaseSettings):
     Default is 24 hours (86400 seconds). Minimum is 600 seconds (10 minutes)."""
     event_delivery: Literal["polling", "streaming", "direct"] = "streaming"
     """How to deliver build events to the frontend. Can be 'polling', 'streaming' or 'direct'."""
+    stream_token_batch_interval: int = Field(default=20, ge=0)
+    """The maximum time in milliseconds a streamed token is held back so it can be sent together with the
+    next ones in a single token event. Set to 0 to send every token in its own event."""
+    stream_token_batch_size: int = Field(default=256, ge=0)
+    """The number of bytes of held back tokens that triggers sending them in a single token event.
+    Set to 0 to send every token in its own event."""
+    graph_execution_mode: Literal["layered", "eager"] = "layered"
+    """How flows run through the API schedule their components. 'layered' runs the graph layer by layer,
+    'eager' starts each component as soon as all of its inputs are ready."""
+    graph_max_concurrency: int = Field(default=16, ge=1)
+    """The maximum number of components built at the same time when graph_execution_mode is 'eager'."""
+    graph_batch_max_concurrency: int = Field(default=4, ge=1)
+    """The maximum number of inputs of a batch sent to the run endpoint with `input_values` that run at the
+    same time, each on its own copy of the flow."""
+    graph_template_cache_max_size: int = Field(default=256, ge=0)
+    """The maximum size in MB of the flow data kept in the per-worker graph template cache used by the run
+    and webhook endpoints. Set to 0 to build the graph from scratch on every request."""
+    vector_index_cache_max_size: int = Field(default=512, ge=0)
+    """The maximum size in MB of the vector indexes (such as FAISS indexes) kept in memory by the per-worker
+    vector index cache, so searches don't read them from disk every time. Set to 0 to disable the cache."""
+    embedding_cache_enabled: bool = False
+    """If set to True, the vectors computed by the embedding model components are cached in the config
+    directory, keyed by the model settings and a hash of the text, so texts embedded before are not sent to the
+    model again."""
+    embedding_cache_memory_size: int = Field(default=10000, ge=0)
+    """The maximum number of cached embedding vectors also kept in memory by each worker."""
+    http_client_max_connections: int = Field(default=100, ge=1)
+    """The maximum number of connections of the HTTP client shared by the components of each worker."""
+    http_client_max_keepalive_connections: int = Field(default=20, ge=0)
+    """The maximum number of idle connections the shared HTTP client keeps alive for later requests."""
+    http_client_max_connections_per_host: int = Field(default=6, ge=1)
+    """The maximum number of requests components send to the same host at once when fetching several URLs."""
+    http_client_http2: bool = True
+    """If set to True, the shared HTTP client uses HTTP/2 with the servers that support it (requires `h2`)."""
+    http_response_cache_max_size: int = Field(default=64, ge=0)
+    """The maximum size, in MB, of the GET responses cached by each worker for the components that opt in."""
+    sql_engine_pool_size: int = Field(default=5, ge=1)
+    """The number of connections kept open by each database engine shared by the SQL components."""
+    sql_engine_max_overflow: int = Field(default=10, ge=0)
+    """The number of connections a shared database engine may open beyond its pool size under load."""
+    sql_schema_cache_ttl: int = Field(default=300, ge=0)
+    """The number of seconds the reflected schema of a database is reused by the SQL components."""
+    component_index_enabled: bool = True
+    """If set to True, the templates of the built-in components are stored in an index in the config directory,
+    and at startup only the component modules that changed since the index was written are imported."""
     lazy_load_components: bool = False
     """If set to True, Axie Studio will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
@@ -271,6 +346,10 @@ class Settings(BaseSettings):
     this is intended to be used to skip all startup project logic."""
     update_starter_projects: bool = True
     """If set to True, Axie Studio will update starter projects."""
+    sync_manifest_enabled: bool = True
+    """If set to True, the content hashes of the starter projects and of the flows in `load_flows_path` are stored
+    in manifests in the config directory, and at startup only the files that changed since they were last loaded
+    are processed again."""
 
     @field_validator("use_noop_database", mode="before")
     @classmethod
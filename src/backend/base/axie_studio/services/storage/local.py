@@ -1,8 +1,16 @@
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
 import anyio
 from aiofile import async_open
 from loguru import logger
 
-from .service import StorageService
+from .service import STREAM_CHUNK_SIZE, StorageService, StoredFile, StreamDigest
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
 
 
 class LocalStorageService(StorageService):
@@ -42,6 +50,50 @@ class LocalStorageService(StorageService):
             logger.exception(f"Error saving file {file_name} in flow {flow_id}")
             raise
 
+    async def save_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        stream: AsyncIterable[bytes],
+        *,
+        max_size: int | None = None,
+    ) -> StoredFile:
+        """Save a file in the local storage from a stream of chunks.
+
+        The chunks are written to a temporary file next to the destination as they arrive, and the temporary
+        file replaces the destination once the stream is complete, so readers never see a partial file.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be saved.
+            stream: The content of the file.
+            max_size: The maximum size of the file in bytes.
+
+        Returns:
+            The size and checksum of the saved file.
+
+        Raises:
+            FileSizeLimitExceededError: If the file is larger than `max_size`.
+        """
+        folder_path = self.data_dir / flow_id
+        await folder_path.mkdir(parents=True, exist_ok=True)
+        file_path = folder_path / file_name
+        temp_path = folder_path / f".{file_name}.{uuid.uuid4().hex}.part"
+        digest = StreamDigest(max_size)
+
+        try:
+            async with async_open(str(temp_path), "wb") as f:
+                async for chunk in stream:
+                    digest.update(chunk)
+                    await f.write(chunk)
+            await temp_path.replace(file_path)
+        except Exception:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            await temp_path.unlink(missing_ok=True)
+            raise
+        logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
+        return digest.result()
+
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         """Retrieve a file from the local storage.
 
@@ -67,6 +119,35 @@ class LocalStorageService(StorageService):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def get_file_stream(
+        self, flow_id: str, file_name: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Retrieve a file from the local storage in chunks.
+
+        Args:
+            flow_id: The identifier for the flow.
+            file_name: The name of the file to be retrieved.
+            chunk_size: The maximum size of each chunk in bytes.
+
+        Returns:
+            An iterator over the content of the file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            logger.warning(f"File {file_name} not found in flow {flow_id}.")
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        async def _iter_chunks() -> AsyncIterator[bytes]:
+            async with async_open(str(file_path), "rb") as f:
+                while chunk := await f.read(chunk_size):
+                    yield chunk
+
+        return _iter_chunks()
+
     async def list_files(self, flow_id: str):
         """List all files in a specified flow.
 
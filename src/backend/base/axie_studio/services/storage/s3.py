@@ -1,8 +1,20 @@
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+import anyio
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
 
-from .service import StorageService
+from .service import STREAM_CHUNK_SIZE, StorageService, StoredFile, StreamDigest
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+# Every part of a multipart upload but the last must be at least 5 MB
+S3_PART_SIZE = 8 * 1024 * 1024
 
 
 class S3StorageService(StorageService):
@@ -36,6 +48,90 @@ class S3StorageService(StorageService):
             logger.exception(f"Error saving file {file_name} in folder {folder}")
             raise
 
+    async def save_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        stream: AsyncIterable[bytes],
+        *,
+        max_size: int | None = None,
+    ) -> StoredFile:
+        """Save a file to the S3 bucket from a stream of chunks.
+
+        Files larger than one part are sent with a multipart upload, one part at a time, so at most one part
+        is held in memory. The upload is aborted if the stream fails or exceeds `max_size`.
+
+        Args:
+            flow_id: The folder in the bucket to save the file.
+            file_name: The name of the file to be saved.
+            stream: The content of the file.
+            max_size: The maximum size of the file in bytes.
+
+        Returns:
+            The size and checksum of the saved file.
+
+        Raises:
+            FileSizeLimitExceededError: If the file is larger than `max_size`.
+        """
+        key = f"{flow_id}/{file_name}"
+        digest = StreamDigest(max_size)
+        buffer = bytearray()
+        upload_id: str | None = None
+        parts: list[dict] = []
+
+        async def _upload_part(data: bytes) -> None:
+            nonlocal upload_id
+            if upload_id is None:
+                response = await anyio.to_thread.run_sync(
+                    partial(self.s3_client.create_multipart_upload, Bucket=self.bucket, Key=key)
+                )
+                upload_id = response["UploadId"]
+            part_number = len(parts) + 1
+            response = await anyio.to_thread.run_sync(
+                partial(
+                    self.s3_client.upload_part,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=data,
+                )
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+
+        try:
+            async for chunk in stream:
+                digest.update(chunk)
+                buffer.extend(chunk)
+                if len(buffer) >= S3_PART_SIZE:
+                    await _upload_part(bytes(buffer))
+                    buffer.clear()
+            if upload_id is None:
+                await anyio.to_thread.run_sync(
+                    partial(self.s3_client.put_object, Bucket=self.bucket, Key=key, Body=bytes(buffer))
+                )
+            else:
+                if buffer:
+                    await _upload_part(bytes(buffer))
+                await anyio.to_thread.run_sync(
+                    partial(
+                        self.s3_client.complete_multipart_upload,
+                        Bucket=self.bucket,
+                        Key=key,
+                        UploadId=upload_id,
+                        MultipartUpload={"Parts": parts},
+                    )
+                )
+        except Exception:
+            logger.exception(f"Error saving file {file_name} in folder {flow_id}")
+            if upload_id is not None:
+                await anyio.to_thread.run_sync(
+                    partial(self.s3_client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id)
+                )
+            raise
+        logger.info(f"File {file_name} saved successfully in folder {flow_id}.")
+        return digest.result()
+
     async def get_file(self, folder: str, file_name: str):
         """Retrieve a file from the S3 bucket.
 
@@ -57,6 +153,39 @@ class S3StorageService(StorageService):
             logger.exception(f"Error retrieving file {file_name} from folder {folder}")
             raise
 
+    async def get_file_stream(
+        self, flow_id: str, file_name: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Retrieve a file from the S3 bucket with ranged GET requests of `chunk_size` bytes.
+
+        Args:
+            flow_id: The folder in the bucket where the file is stored.
+            file_name: The name of the file to be retrieved.
+            chunk_size: The maximum size of each chunk in bytes.
+
+        Returns:
+            An iterator over the content of the file.
+
+        Raises:
+            Exception: If the file does not exist or can't be accessed.
+        """
+        key = f"{flow_id}/{file_name}"
+        size = await self.get_file_size(flow_id, file_name)
+
+        async def _iter_chunks() -> AsyncIterator[bytes]:
+            for start in range(0, size, chunk_size):
+                end = min(start + chunk_size, size) - 1
+                try:
+                    response = await anyio.to_thread.run_sync(
+                        partial(self.s3_client.get_object, Bucket=self.bucket, Key=key, Range=f"bytes={start}-{end}")
+                    )
+                    yield await anyio.to_thread.run_sync(response["Body"].read)
+                except ClientError:
+                    logger.exception(f"Error retrieving file {file_name} from folder {flow_id}")
+                    raise
+
+        return _iter_chunks()
+
     async def list_files(self, folder: str):
         """List all files in a specified folder of the S3 bucket.
 
@@ -100,5 +229,17 @@ class S3StorageService(StorageService):
         """Perform any cleanup operations when the service is being torn down."""
         # No specific teardown actions required for S3 storage at the moment.
 
-    async def get_file_size(self, flow_id: str, file_name: str):
-        raise NotImplementedError
+    async def get_file_size(self, flow_id: str, file_name: str) -> int:
+        """Get the size of a file in the S3 bucket.
+
+        Raises:
+            Exception: If the file does not exist or can't be accessed.
+        """
+        try:
+            response = await anyio.to_thread.run_sync(
+                partial(self.s3_client.head_object, Bucket=self.bucket, Key=f"{flow_id}/{file_name}")
+            )
+        except ClientError:
+            logger.exception(f"Error retrieving the size of file {file_name} from folder {flow_id}")
+            raise
+        return response["ContentLength"]
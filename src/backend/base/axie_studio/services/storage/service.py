@@ -1,16 +1,51 @@
 from __future__ import annotations
 
+import hashlib
 from abc import abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 import anyio
 
 from axie_studio.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from axie_studio.services.session.service import SessionService
     from axie_studio.services.settings.service import SettingsService
 
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+class StoredFile(NamedTuple):
+    """The size and SHA-256 checksum of a saved file, computed while it was written."""
+
+    size: int
+    sha256: str
+
+
+class FileSizeLimitExceededError(ValueError):
+    """Raised when a streamed file is larger than the size allowed by the caller."""
+
+
+class StreamDigest:
+    """Tracks the size and checksum of a stream chunk by chunk, enforcing an optional size limit."""
+
+    def __init__(self, max_size: int | None = None) -> None:
+        self.max_size = max_size
+        self.size = 0
+        self._hash = hashlib.sha256()
+
+    def update(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.max_size is not None and self.size > self.max_size:
+            msg = f"File size is larger than the maximum file size {self.max_size / 1024 / 1024:g}MB."
+            raise FileSizeLimitExceededError(msg)
+        self._hash.update(chunk)
+
+    def result(self) -> StoredFile:
+        return StoredFile(size=self.size, sha256=self._hash.hexdigest())
+
 
 class StorageService(Service):
     name = "storage_service"
@@ -35,6 +70,47 @@ class StorageService(Service):
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    async def save_file_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        stream: AsyncIterable[bytes],
+        *,
+        max_size: int | None = None,
+    ) -> StoredFile:
+        """Saves a file from a stream of chunks, returning its size and checksum.
+
+        Storage backends override this method to write the chunks as they arrive; this default buffers the
+        whole stream and calls `save_file`.
+
+        Raises:
+            FileSizeLimitExceededError: If the stream is larger than `max_size` bytes. Nothing is saved.
+        """
+        digest = StreamDigest(max_size)
+        chunks = []
+        async for chunk in stream:
+            digest.update(chunk)
+            chunks.append(chunk)
+        await self.save_file(flow_id, file_name, b"".join(chunks))
+        return digest.result()
+
+    async def get_file_stream(
+        self, flow_id: str, file_name: str, chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """Returns an iterator over the content of a file, in chunks of at most `chunk_size` bytes.
+
+        Errors such as a missing file are raised by this call rather than while iterating, so callers can
+        handle them before they start streaming a response. Storage backends override this method to read
+        the file chunk by chunk; this default reads the whole file with `get_file`.
+        """
+        content = await self.get_file(flow_id, file_name)
+
+        async def _iter_chunks() -> AsyncIterator[bytes]:
+            for start in range(0, len(content), chunk_size):
+                yield content[start : start + chunk_size]
+
+        return _iter_chunks()
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
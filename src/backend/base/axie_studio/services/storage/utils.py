@@ -1,5 +1,21 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from axie_studio.services.storage.constants import EXTENSION_TO_CONTENT_TYPE
+from axie_studio.services.storage.service import STREAM_CHUNK_SIZE
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from fastapi import UploadFile
 
 
 def build_content_type_from_extension(extension: str):
     return EXTENSION_TO_CONTENT_TYPE.get(extension.lower(), "application/octet-stream")
+
+
+async def iter_upload_file(file: UploadFile, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Reads an uploaded file in chunks of at most `chunk_size` bytes."""
+    while chunk := await file.read(chunk_size):
+        yield chunk
@@ -190,6 +190,7 @@ class ArizePhoenixTracer(BaseTracer):
         inputs: dict[str, Any],
         metadata: dict[str, Any] | None = None,
         vertex: Vertex | None = None,
+        start_time: datetime | None = None,
     ) -> None:
         """Adds a trace span, attaching inputs and metadata as attributes."""
         if not self._ready:
@@ -199,7 +200,7 @@ class ArizePhoenixTracer(BaseTracer):
         child_span = self.tracer.start_span(
             name=trace_name,
             context=span_context,
-            start_time=self._get_current_timestamp(),
+            start_time=self._get_current_timestamp(start_time),
         )
 
         if trace_type == "prompt":
@@ -233,6 +234,7 @@ class ArizePhoenixTracer(BaseTracer):
         outputs: dict[str, Any] | None = None,
         error: Exception | None = None,
         logs: Sequence[Log | dict] = (),
+        end_time: datetime | None = None,
     ) -> None:
         """Ends a trace span, attaching outputs, errors, and logs as attributes."""
         if not self._ready or trace_id not in self.child_spans:
@@ -253,7 +255,7 @@ class ArizePhoenixTracer(BaseTracer):
             child_span.set_attribute("logs", self._safe_json_dumps(processed_logs))
 
         self._set_span_status(child_span, error)
-        child_span.end(end_time=self._get_current_timestamp())
+        child_span.end(end_time=self._get_current_timestamp(end_time))
         self.child_spans.pop(trace_id)
 
     @override
@@ -336,9 +338,9 @@ class ArizePhoenixTracer(BaseTracer):
         return error_message
 
     @staticmethod
-    def _get_current_timestamp() -> int:
-        """Gets the current UTC timestamp in nanoseconds."""
-        return int(datetime.now(timezone.utc).timestamp() * 1_000_000_000)
+    def _get_current_timestamp(moment: datetime | None = None) -> int:
+        """Gets the UTC timestamp of `moment`, or of now, in nanoseconds."""
+        return int((moment or datetime.now(timezone.utc)).timestamp() * 1_000_000_000)
 
     @staticmethod
     def _safe_json_dumps(obj: Any, **kwargs: Any) -> str:
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from datetime import datetime
     from uuid import UUID
 
     from langchain.callbacks.base import BaseCallbackHandler
@@ -42,6 +43,7 @@ class BaseTracer(ABC):
         inputs: dict[str, Any],
         metadata: dict[str, Any] | None = None,
         vertex: Vertex | None = None,
+        start_time: datetime | None = None,
     ) -> None:
         raise NotImplementedError
 
@@ -53,6 +55,7 @@ class BaseTracer(ABC):
         outputs: dict[str, Any] | None = None,
         error: Exception | None = None,
         logs: Sequence[Log | dict] = (),
+        end_time: datetime | None = None,
     ) -> None:
         raise NotImplementedError
 
@@ -87,8 +87,9 @@ class LangFuseTracer(BaseTracer):
         inputs: dict[str, Any],
         metadata: dict[str, Any] | None = None,
         vertex: Vertex | None = None,
+        start_time: datetime | None = None,
     ) -> None:
-        start_time = datetime.now(tz=timezone.utc)
+        start_time = start_time or datetime.now(tz=timezone.utc)
         if not self._ready:
             return
 
@@ -121,8 +122,9 @@ class LangFuseTracer(BaseTracer):
         outputs: dict[str, Any] | None = None,
         error: Exception | None = None,
         logs: Sequence[Log | dict] = (),
+        end_time: datetime | None = None,
     ) -> None:
-        end_time = datetime.now(tz=timezone.utc)
+        end_time = end_time or datetime.now(tz=timezone.utc)
         if not self._ready:
             return
 
@@ -96,6 +96,7 @@ class LangSmithTracer(BaseTracer):
         inputs: dict[str, Any],
         metadata: dict[str, Any] | None = None,
         vertex: Vertex | None = None,  # noqa: ARG002
+        start_time: datetime | None = None,
     ) -> None:
         if not self._ready or not self._run_tree:
             return
@@ -113,6 +114,8 @@ class LangSmithTracer(BaseTracer):
             metadata=self._convert_to_langchain_types(metadata) if metadata else None,
         )
         child = child_trace.__enter__()
+        if start_time:
+            child.start_time = start_time
         child.post()
         self._children[trace_id] = child
         self._children_traces[trace_id] = child_trace
@@ -151,6 +154,7 @@ class LangSmithTracer(BaseTracer):
         outputs: dict[str, Any] | None = None,
         error: Exception | None = None,
         logs: Sequence[Log | dict] = (),
+        end_time: datetime | None = None,
     ):
         if not self._ready or not self._run_tree:
             return
@@ -167,7 +171,7 @@ class LangSmithTracer(BaseTracer):
             logs_dicts = [log if isinstance(log, dict) else log.model_dump() for log in logs]
             child.add_metadata(self._convert_to_langchain_types({"logs": {log.get("name"): log for log in logs_dicts}}))
         child.add_metadata(self._convert_to_langchain_types({"outputs": raw_outputs}))
-        child.end(outputs=processed_outputs, error=self._error_to_string(error))
+        child.end(outputs=processed_outputs, error=self._error_to_string(error), end_time=end_time)
         self._children_traces[trace_id].__exit__(None, None, None)
         self._child_link[trace_id] = child.get_url()
 
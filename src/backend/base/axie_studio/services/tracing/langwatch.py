@@ -12,6 +12,7 @@ from axie_studio.services.tracing.base import BaseTracer
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from datetime import datetime
     from uuid import UUID
 
     from langchain.callbacks.base import BaseCallbackHandler
@@ -79,6 +80,7 @@ class LangWatchTracer(BaseTracer):
         inputs: dict[str, Any],
         metadata: dict[str, Any] | None = None,
         vertex: Vertex | None = None,
+        start_time: datetime | None = None,
     ) -> None:
         if not self._ready:
             return
@@ -114,6 +116,7 @@ class LangWatchTracer(BaseTracer):
         outputs: dict[str, Any] | None = None,
         error: Exception | None = None,
         logs: Sequence[Log | dict] = (),
+        end_time: datetime | None = None,
     ) -> None:
         if not self._ready:
             return
@@ -15,6 +15,7 @@ from axie_studio.services.tracing.base import BaseTracer
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from datetime import datetime
     from uuid import UUID
 
     from langchain.callbacks.base import BaseCallbackHandler
@@ -113,6 +114,7 @@ class OpikTracer(BaseTracer):
         inputs: dict[str, Any],
         metadata: dict[str, Any] | None = None,
         vertex: Vertex | None = None,
+        start_time: datetime | None = None,
     ) -> None:
         if not self._ready:
             return
@@ -129,7 +131,7 @@ class OpikTracer(BaseTracer):
             input=processed_inputs,
             metadata=processed_metadata,
             type="general",  # The LLM span will comes from the langchain callback
-        )
+        ).update(start_time=start_time)
 
         self.spans[trace_id] = span
         self._distributed_headers = get_distributed_trace_headers(self.opik_trace_id, span.id)
@@ -142,6 +144,7 @@ class OpikTracer(BaseTracer):
         outputs: dict[str, Any] | None = None,
         error: Exception | None = None,
         logs: Sequence[Log | dict] = (),
+        end_time: datetime | None = None,
     ) -> None:
         if not self._ready:
             return
@@ -156,7 +159,7 @@ class OpikTracer(BaseTracer):
             output |= {"logs": list(logs)} if logs else {}
             content = {"output": output, "error_info": collect(error) if error else None}
 
-            span.init_end_time().update(**content)
+            span.init_end_time().update(end_time=end_time, **content)
 
             self._client.span(**span.__dict__)
         else:
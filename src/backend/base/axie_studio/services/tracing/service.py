@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import os
-from collections import defaultdict
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
-from typing import TYPE_CHECKING, Any
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from loguru import logger
 
 from axie_studio.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from uuid import UUID
 
     from langchain.callbacks.base import BaseCallbackHandler
@@ -75,9 +81,177 @@ class TraceContext:
         self.all_inputs: dict[str, dict] = defaultdict(dict)
         self.all_outputs: dict[str, dict] = defaultdict(dict)
 
-        self.traces_queue: asyncio.Queue = asyncio.Queue()
+        self.lanes: dict[str, TracerLane] = {}
         self.running = False
-        self.worker_task: asyncio.Task | None = None
+
+
+class TracerStats:
+    """Dispatch statistics of a tracer, accumulated over every run.
+
+    Attributes:
+        pending: The number of calls waiting to run.
+        processed: The number of calls run.
+        dropped: The number of calls dropped because the tracer fell too far behind.
+        lag: The time in seconds the first call of the last batch waited before it ran.
+        max_lag: The largest lag seen.
+    """
+
+    def __init__(self) -> None:
+        self.pending = 0
+        self.processed = 0
+        self.dropped = 0
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.lock = threading.Lock()
+
+    def to_dict(self) -> dict[str, int | float]:
+        with self.lock:
+            return {
+                "pending": self.pending,
+                "processed": self.processed,
+                "dropped": self.dropped,
+                "lag": self.lag,
+                "max_lag": self.max_lag,
+            }
+
+
+class _LaneCall(NamedTuple):
+    queued_at: float
+    span_id: str | None
+    ends_span: bool
+    context: contextvars.Context
+    func: Callable[..., Any]
+    args: tuple
+
+
+class TracerLane:
+    """Runs the calls made to one tracer of a run on the tracing executor, in order and in batches.
+
+    Calls are queued without blocking and every call queued while a batch runs is run in the next batch, so
+    a slow tracer never delays the component builds or the other tracers. Each call runs in a copy of the
+    context it was queued from.
+
+    Calls that start and end a span share its `span_id`. When `max_size` calls are waiting, the oldest span
+    that has not started yet is dropped together with all of its calls, including the ones queued later, so
+    a tracer never sees the end of a span it did not start. Calls outside of a span are never dropped.
+
+    Args:
+        name: The name of the tracer.
+        executor: The executor the calls run on.
+        max_size: The maximum number of calls waiting to run.
+        stats: The statistics of the tracer.
+    """
+
+    def __init__(self, name: str, executor: ThreadPoolExecutor, max_size: int, stats: TracerStats) -> None:
+        self.name = name
+        self.executor = executor
+        self.max_size = max_size
+        self.stats = stats
+        self._pending: deque[_LaneCall] = deque()
+        self._started: set[str] = set()
+        self._dropped: set[str] = set()
+        self._lock = threading.Lock()
+        self._future: Future | None = None
+
+    def put(self, func: Callable[..., Any], *args: Any, span_id: str | None = None, ends_span: bool = False) -> None:
+        """Queues a call to the tracer.
+
+        Args:
+            func: The function to call.
+            *args: The arguments of the call.
+            span_id: The span the call starts or ends, if any.
+            ends_span: Whether the call ends the span.
+        """
+        context = contextvars.copy_context()
+        with self._lock:
+            if span_id is not None and span_id in self._dropped:
+                if ends_span:
+                    self._dropped.discard(span_id)
+                self._count_dropped(1)
+                return
+            if len(self._pending) >= self.max_size:
+                self._drop_oldest_span()
+            self._pending.append(_LaneCall(time.monotonic(), span_id, ends_span, context, func, args))
+            with self.stats.lock:
+                self.stats.pending += 1
+            if self._future is None:
+                self._future = self.executor.submit(self._drain)
+
+    def call(self, func: Callable[..., Any], *args: Any, timeout: float | None = None) -> Any:
+        """Queues a call to the tracer and blocks until it has run, after every call queued before it.
+
+        Raises:
+            TimeoutError: If the call has not run within `timeout` seconds.
+        """
+        result: Future = Future()
+
+        def run() -> None:
+            try:
+                result.set_result(func(*args))
+            except Exception as e:  # noqa: BLE001
+                result.set_exception(e)
+
+        self.put(run)
+        return result.result(timeout)
+
+    def _drop_oldest_span(self) -> None:
+        span_id = next(
+            (call.span_id for call in self._pending if call.span_id is not None and call.span_id not in self._started),
+            None,
+        )
+        if span_id is None:
+            return
+        dropped = [call for call in self._pending if call.span_id == span_id]
+        self._pending = deque(call for call in self._pending if call.span_id != span_id)
+        if not dropped[-1].ends_span:
+            self._dropped.add(span_id)
+        with self.stats.lock:
+            self.stats.pending -= len(dropped)
+        self._count_dropped(len(dropped))
+
+    def _count_dropped(self, count: int) -> None:
+        with self.stats.lock:
+            first = self.stats.dropped == 0
+            self.stats.dropped += count
+        if first:
+            logger.warning(f"Tracer {self.name} is falling behind, dropping its oldest trace events")
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._future = None
+                    return
+                batch = list(self._pending)
+                self._pending.clear()
+                for call in batch:
+                    if call.span_id is None:
+                        continue
+                    if call.ends_span:
+                        self._started.discard(call.span_id)
+                    else:
+                        self._started.add(call.span_id)
+            lag = time.monotonic() - batch[0].queued_at
+            with self.stats.lock:
+                self.stats.lag = lag
+                self.stats.max_lag = max(self.stats.max_lag, lag)
+            for call in batch:
+                try:
+                    call.context.run(call.func, *call.args)
+                except Exception:  # noqa: BLE001
+                    logger.exception(f"Error processing trace_func for tracer {self.name}")
+            with self.stats.lock:
+                self.stats.processed += len(batch)
+                self.stats.pending -= len(batch)
+
+    async def join(self) -> None:
+        """Waits until every queued call has run."""
+        while True:
+            with self._lock:
+                future = self._future
+            if future is None:
+                return
+            await asyncio.wrap_future(future)
 
 
 class ComponentTraceContext:
@@ -120,25 +294,48 @@ class TracingService(Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
         self.deactivated = self.settings_service.settings.deactivate_tracing
+        self._executor: ThreadPoolExecutor | None = None
+        self.tracer_stats: dict[str, TracerStats] = defaultdict(TracerStats)
 
-    async def _trace_worker(self, trace_context: TraceContext) -> None:
-        while trace_context.running or not trace_context.traces_queue.empty():
-            trace_func, args = await trace_context.traces_queue.get()
-            try:
-                trace_func(*args)
-            except Exception:  # noqa: BLE001
-                logger.exception("Error processing trace_func")
-            finally:
-                trace_context.traces_queue.task_done()
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.settings_service.settings.tracing_max_workers, thread_name_prefix="tracing"
+            )
+        return self._executor
+
+    def _get_lane(self, trace_context: TraceContext, tracer_name: str) -> TracerLane:
+        lane = trace_context.lanes.get(tracer_name)
+        if lane is None:
+            lane = TracerLane(
+                tracer_name,
+                self._get_executor(),
+                self.settings_service.settings.tracing_queue_size,
+                self.tracer_stats[tracer_name],
+            )
+            trace_context.lanes[tracer_name] = lane
+        return lane
+
+    def _dispatch(
+        self,
+        trace_context: TraceContext,
+        tracer_name: str,
+        func: Callable[..., Any],
+        *args: Any,
+        span_id: str | None = None,
+        ends_span: bool = False,
+    ) -> None:
+        """Queues a call to a tracer, to be run off the event loop."""
+        self._get_lane(trace_context, tracer_name).put(func, *args, span_id=span_id, ends_span=ends_span)
+
+    def get_tracer_stats(self) -> dict[str, dict[str, int | float]]:
+        """Returns the dispatch statistics of each tracer: pending, processed and dropped calls, and lag."""
+        return {name: stats.to_dict() for name, stats in self.tracer_stats.items()}
 
     async def _start(self, trace_context: TraceContext) -> None:
         if trace_context.running or self.deactivated:
             return
-        try:
-            trace_context.running = True
-            trace_context.worker_task = asyncio.create_task(self._trace_worker(trace_context))
-        except Exception:  # noqa: BLE001
-            logger.exception("Error starting tracing service")
+        trace_context.running = True
 
     def _initialize_langsmith_tracer(self, trace_context: TraceContext) -> None:
         langsmith_tracer = _get_langsmith_tracer()
@@ -230,32 +427,36 @@ class TracingService(Service):
         except Exception as e:  # noqa: BLE001
             logger.debug(f"Error initializing tracers: {e}")
 
-    async def _stop(self, trace_context: TraceContext) -> None:
+    async def _join(self, trace_context: TraceContext) -> None:
         try:
-            trace_context.running = False
-            # check the qeue is empty
-            if not trace_context.traces_queue.empty():
-                await trace_context.traces_queue.join()
-            if trace_context.worker_task:
-                trace_context.worker_task.cancel()
-                trace_context.worker_task = None
+            await asyncio.gather(*(lane.join() for lane in trace_context.lanes.values()))
+        except Exception:  # noqa: BLE001
+            logger.exception("Error waiting for the tracers")
+
+    async def _stop(self, trace_context: TraceContext) -> None:
+        trace_context.running = False
+        await self._join(trace_context)
 
+    @staticmethod
+    def _end_tracer(tracer: BaseTracer, trace_context: TraceContext, outputs: dict, error: Exception | None) -> None:
+        try:
+            # why all_inputs and all_outputs? why metadata=outputs?
+            tracer.end(
+                trace_context.all_inputs,
+                outputs=trace_context.all_outputs,
+                error=error,
+                metadata=outputs,
+            )
         except Exception:  # noqa: BLE001
-            logger.exception("Error stopping tracing service")
+            logger.error("Error ending all traces")
 
-    def _end_all_tracers(self, trace_context: TraceContext, outputs: dict, error: Exception | None = None) -> None:
-        for tracer in trace_context.tracers.values():
+    async def _end_all_tracers(
+        self, trace_context: TraceContext, outputs: dict, error: Exception | None = None
+    ) -> None:
+        for name, tracer in trace_context.tracers.items():
             if tracer.ready:
-                try:
-                    # why all_inputs and all_outputs? why metadata=outputs?
-                    tracer.end(
-                        trace_context.all_inputs,
-                        outputs=trace_context.all_outputs,
-                        error=error,
-                        metadata=outputs,
-                    )
-                except Exception:  # noqa: BLE001
-                    logger.error("Error ending all traces")
+                self._dispatch(trace_context, name, self._end_tracer, tracer, trace_context, outputs, error)
+        await self._join(trace_context)
 
     async def end_tracers(self, outputs: dict, error: Exception | None = None) -> None:
         """End the trace for a graph run.
@@ -270,7 +471,7 @@ class TracingService(Service):
             msg = "called end_tracers but no trace context found"
             raise RuntimeError(msg)
         await self._stop(trace_context)
-        self._end_all_tracers(trace_context, outputs, error)
+        await self._end_all_tracers(trace_context, outputs, error)
 
     @staticmethod
     def _cleanup_inputs(inputs: dict[str, Any]):
@@ -280,28 +481,63 @@ class TracingService(Service):
                 inputs[key] = "*****"  # avoid logging api_keys for security reasons
         return inputs
 
+    @staticmethod
+    def _start_component_trace(
+        tracer: BaseTracer, component_trace_context: ComponentTraceContext, start_time: datetime
+    ) -> None:
+        try:
+            tracer.add_trace(
+                component_trace_context.trace_id,
+                component_trace_context.trace_name,
+                component_trace_context.trace_type,
+                component_trace_context.inputs,
+                component_trace_context.inputs_metadata,
+                component_trace_context.vertex,
+                start_time=start_time,
+            )
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Error starting trace {component_trace_context.trace_name}")
+
+    @staticmethod
+    def _end_component_trace(
+        tracer: BaseTracer,
+        component_trace_context: ComponentTraceContext,
+        trace_context: TraceContext,
+        error: Exception | None,
+        end_time: datetime,
+    ) -> None:
+        try:
+            tracer.end_trace(
+                trace_id=component_trace_context.trace_id,
+                trace_name=component_trace_context.trace_name,
+                outputs=trace_context.all_outputs[component_trace_context.trace_name],
+                error=error,
+                logs=component_trace_context.logs[component_trace_context.trace_name],
+                end_time=end_time,
+            )
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Error ending trace {component_trace_context.trace_name}")
+
     def _start_component_traces(
         self,
         component_trace_context: ComponentTraceContext,
         trace_context: TraceContext,
     ) -> None:
-        inputs = self._cleanup_inputs(component_trace_context.inputs)
-        component_trace_context.inputs = inputs
+        component_trace_context.inputs = self._cleanup_inputs(component_trace_context.inputs)
         component_trace_context.inputs_metadata = component_trace_context.inputs_metadata or {}
-        for tracer in trace_context.tracers.values():
-            if not tracer.ready:
-                continue
-            try:
-                tracer.add_trace(
-                    component_trace_context.trace_id,
-                    component_trace_context.trace_name,
-                    component_trace_context.trace_type,
-                    inputs,
-                    component_trace_context.inputs_metadata,
-                    component_trace_context.vertex,
+        # The tracers run later, so they are given the time the component started instead of stamping their own
+        start_time = datetime.now(timezone.utc)
+        for name, tracer in trace_context.tracers.items():
+            if tracer.ready:
+                self._dispatch(
+                    trace_context,
+                    name,
+                    self._start_component_trace,
+                    tracer,
+                    component_trace_context,
+                    start_time,
+                    span_id=component_trace_context.trace_id,
                 )
-            except Exception:  # noqa: BLE001
-                logger.exception(f"Error starting trace {component_trace_context.trace_name}")
 
     def _end_component_traces(
         self,
@@ -309,18 +545,21 @@ class TracingService(Service):
         trace_context: TraceContext,
         error: Exception | None = None,
     ) -> None:
-        for tracer in trace_context.tracers.values():
+        end_time = datetime.now(timezone.utc)
+        for name, tracer in trace_context.tracers.items():
             if tracer.ready:
-                try:
-                    tracer.end_trace(
-                        trace_id=component_trace_context.trace_id,
-                        trace_name=component_trace_context.trace_name,
-                        outputs=trace_context.all_outputs[component_trace_context.trace_name],
-                        error=error,
-                        logs=component_trace_context.logs[component_trace_context.trace_name],
-                    )
-                except Exception:  # noqa: BLE001
-                    logger.exception(f"Error ending trace {component_trace_context.trace_name}")
+                self._dispatch(
+                    trace_context,
+                    name,
+                    self._end_component_trace,
+                    tracer,
+                    component_trace_context,
+                    trace_context,
+                    error,
+                    end_time,
+                    span_id=component_trace_context.trace_id,
+                    ends_span=True,
+                )
 
     @asynccontextmanager
     async def trace_component(
@@ -353,18 +592,19 @@ class TracingService(Service):
             msg = "called trace_component but no trace context found"
             raise RuntimeError(msg)
         trace_context.all_inputs[trace_name] |= inputs or {}
-        await trace_context.traces_queue.put((self._start_component_traces, (component_trace_context, trace_context)))
+        self._start_component_traces(component_trace_context, trace_context)
         try:
             yield self
         except Exception as e:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, e))
-            )
+            self._end_component_traces(component_trace_context, trace_context, e)
             raise
         else:
-            await trace_context.traces_queue.put(
-                (self._end_component_traces, (component_trace_context, trace_context, None))
-            )
+            self._end_component_traces(component_trace_context, trace_context, None)
+
+    async def teardown(self) -> None:
+        if self._executor is not None:
+            await asyncio.to_thread(self._executor.shutdown)
+            self._executor = None
 
     @property
     def project_name(self):
@@ -422,10 +662,21 @@ class TracingService(Service):
         if trace_context is None:
             msg = "called get_langchain_callbacks but no trace context found"
             raise RuntimeError(msg)
-        for tracer in trace_context.tracers.values():
+        timeout = self.settings_service.settings.tracing_callback_timeout
+        for name, tracer in trace_context.tracers.items():
             if not tracer.ready:  # type: ignore[truthy-function]
                 continue
-            langchain_callback = tracer.get_langchain_callback()
+            # Ask on the tracer's lane, so the callback sees the spans of every trace event queued so far
+            try:
+                langchain_callback = self._get_lane(trace_context, name).call(
+                    tracer.get_langchain_callback, timeout=timeout
+                )
+            except TimeoutError:
+                logger.warning(f"Tracer {name} is falling behind, its LangChain callback is left out")
+                continue
+            except Exception:  # noqa: BLE001
+                logger.exception(f"Error getting the LangChain callback of tracer {name}")
+                continue
             if langchain_callback:
                 callbacks.append(langchain_callback)
         return callbacks
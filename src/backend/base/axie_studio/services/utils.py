@@ -127,9 +127,13 @@ async def teardown_services() -> None:
     async with get_db_service().with_session() as session:
         await teardown_superuser(get_settings_service(), session)
 
+    from axie_studio.base.data.sql_engines import sql_engine_registry
     from axie_studio.services.manager import service_manager
+    from axie_studio.utils.http_client import close_http_client
 
     await service_manager.teardown()
+    await close_http_client()
+    sql_engine_registry.dispose()
 
 
 def initialize_settings_service() -> None:
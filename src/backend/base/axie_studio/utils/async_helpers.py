@@ -1,4 +1,6 @@
 import asyncio
+import threading
+from collections.abc import AsyncIterator, Iterator
 from contextlib import asynccontextmanager
 
 if hasattr(asyncio, "timeout"):
@@ -40,3 +42,48 @@ def run_until_complete(coro):
     with concurrent.futures.ThreadPoolExecutor() as executor:
         future = executor.submit(run_in_new_loop)
         return future.result()
+
+
+async def iterate_in_thread(iterator: Iterator) -> AsyncIterator[list]:
+    """Iterates a blocking iterator in a worker thread, yielding its items in batches.
+
+    A single thread pulls the items for the whole iteration. The items it pulls while the event loop is busy are
+    handed over together, so there is one event loop wakeup per batch instead of one thread hop per item, and no
+    item is held back waiting for the next ones. Errors raised by the iterator are raised to the caller.
+
+    The thread stops pulling once the generator is closed, after the item it is waiting for, if any.
+    """
+    loop = asyncio.get_running_loop()
+    pending: list = []
+    lock = threading.Lock()
+    stopped = threading.Event()
+    wakeup = asyncio.Event()
+
+    def pull() -> None:
+        for item in iterator:
+            if stopped.is_set():
+                return
+            with lock:
+                pending.append(item)
+                notify = len(pending) == 1
+            if notify:
+                loop.call_soon_threadsafe(wakeup.set)
+
+    puller = asyncio.ensure_future(asyncio.to_thread(pull))
+    puller.add_done_callback(lambda _: wakeup.set())
+    try:
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            with lock:
+                batch = pending.copy()
+                pending.clear()
+            if batch:
+                yield batch
+            elif puller.done():
+                await puller
+                return
+    finally:
+        stopped.set()
+        # Retrieve the error of a stream that is no longer read, so it is not reported as never retrieved
+        puller.add_done_callback(lambda future: future.cancelled() or future.exception())
@@ -1,10 +1,23 @@
 import gzip
+import hashlib
 import json
+import threading
+from collections import OrderedDict
 from typing import Any
 
-from fastapi import Response
+from fastapi import Request, Response
 from fastapi.encoders import jsonable_encoder
 
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
 
 def compress_response(data: Any) -> Response:
     """Compress data and return it as a FastAPI Response with appropriate headers."""
@@ -17,3 +30,100 @@ def compress_response(data: Any) -> Response:
         media_type="application/json",
         headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding", "Content-Length": str(len(compressed_data))},
     )
+
+
+class PrecompressedJSON:
+    """A JSON payload serialized and compressed once, to be sent many times.
+
+    The payload is compressed with gzip and, when the `zstandard` or `brotli` packages are installed, with
+    zstd and brotli too. `response` picks the best encoding the client accepts and answers conditional
+    requests whose `If-None-Match` header matches the strong ETag of the payload with a 304. Each encoding
+    has its own ETag, derived from the hash of the uncompressed payload.
+
+    Args:
+        data: The data to serialize.
+        body: The data already serialized to JSON, instead of `data`.
+    """
+
+    def __init__(self, data: Any = None, *, body: bytes | None = None) -> None:
+        if body is None:
+            body = json.dumps(jsonable_encoder(data)).encode("utf-8")
+        self.digest = hashlib.sha256(body).hexdigest()[:32]
+        # Ordered by preference
+        self.encodings: dict[str, bytes] = {}
+        if zstandard is not None:
+            self.encodings["zstd"] = zstandard.ZstdCompressor(level=10).compress(body)
+        if brotli is not None:
+            self.encodings["br"] = brotli.compress(body, quality=9)
+        self.encodings["gzip"] = gzip.compress(body, compresslevel=6)
+        self.encodings["identity"] = body
+
+    def etag(self, encoding: str) -> str:
+        return f'"{self.digest}"' if encoding == "identity" else f'"{self.digest}-{encoding}"'
+
+    def _select_encoding(self, accept_encoding: str) -> str:
+        accepted = set()
+        for part in accept_encoding.split(","):
+            coding, _, params = part.partition(";")
+            quality = params.strip().removeprefix("q=")
+            try:
+                if quality and float(quality) <= 0:
+                    continue
+            except ValueError:
+                continue
+            accepted.add(coding.strip().lower())
+        return next(
+            (encoding for encoding in self.encodings if encoding in accepted or "*" in accepted),
+            "identity",
+        )
+
+    def _etag_matches(self, if_none_match: str) -> bool:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or any(self.etag(encoding) in tags for encoding in self.encodings)
+
+    def response(self, request: Request) -> Response:
+        """Returns the payload in the best encoding `request` accepts, or a 304 if the client has it already."""
+        encoding = self._select_encoding(request.headers.get("accept-encoding", ""))
+        headers = {"ETag": self.etag(encoding), "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self._etag_matches(if_none_match):
+            return Response(status_code=304, headers=headers)
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(content=self.encodings[encoding], media_type="application/json", headers=headers)
+
+
+class PrecompressedJSONCache:
+    """An LRU cache of `PrecompressedJSON` payloads, keyed by the hash of their serialized data.
+
+    Endpoints whose data is cheap to query but often unchanged between requests, like the flow headers of
+    the sidebar, serialize the data on each request and reuse the compressed encodings (and ETags) of the
+    last payloads with the same content, instead of compressing them again.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._payloads: OrderedDict[str, PrecompressedJSON] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+
+    def get(self, data: Any) -> PrecompressedJSON:
+        body = json.dumps(jsonable_encoder(data)).encode("utf-8")
+        key = hashlib.sha256(body).hexdigest()
+        with self._lock:
+            payload = self._payloads.get(key)
+            if payload is not None:
+                self._payloads.move_to_end(key)
+                return payload
+        payload = PrecompressedJSON(body=body)
+        with self._lock:
+            self._payloads[key] = payload
+            while len(self._payloads) > self.max_entries:
+                self._payloads.popitem(last=False)
+        return payload
+
+    def clear(self) -> None:
+        with self._lock:
+            self._payloads.clear()
+
+
+precompressed_json_cache = PrecompressedJSONCache()
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import http.cookiejar
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
+from typing import NamedTuple
+
+import httpx
+import orjson
+
+from axie_studio.services.deps import get_settings_service
+
+BYTES_PER_MB = 1024 * 1024
+# Status codes whose responses can be stored without explicit freshness information (RFC 9110, section 15.1)
+HEURISTICALLY_CACHEABLE_STATUS_CODES = {200, 203, 204, 206, 300, 301, 308, 404, 405, 410, 414, 501}
+HEURISTIC_FRESHNESS_FRACTION = 0.1
+MAX_HEURISTIC_FRESHNESS = 24 * 60 * 60
+# Headers describing the encoding of the body on the wire, not of the decoded content that is cached
+WIRE_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Returns the HTTP client shared by the components running in the current event loop.
+
+    Reusing one client keeps connections alive across requests and runs, instead of paying for TCP and TLS
+    setup on every call: the client keeps a pool of connections per origin, bounded by the
+    `http_client_max_connections` and `http_client_max_keepalive_connections` settings. HTTP/2 is used with
+    the servers that support it when `http_client_http2` is on and the `h2` package is installed.
+
+    The client has no default timeout, headers or redirect policy: pass them with each request. Its cookie jar
+    rejects every cookie, so the cookies a server sets for one flow or user are never sent with the requests
+    of another; pass cookies as headers. A client is created per event loop, since connections can't be
+    shared between loops.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        settings = get_settings_service().settings
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.http_client_max_connections,
+                max_keepalive_connections=settings.http_client_max_keepalive_connections,
+            ),
+            http2=settings.http_client_http2 and find_spec("h2") is not None,
+            cookies=http.cookiejar.CookieJar(policy=http.cookiejar.DefaultCookiePolicy(allowed_domains=[])),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Closes the client shared in the current event loop."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """Parses a `Cache-Control` header into a dictionary of lowercased directives and their values."""
+    directives: dict[str, str | None] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') if argument else None
+    return directives
+
+
+def _parse_seconds(value: str | None) -> float | None:
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _parse_date(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(response: httpx.Response) -> float | None:
+    """Returns how long a response stays fresh for a shared cache, or None if it must not be stored."""
+    cache_control = parse_cache_control(response.headers.get("Cache-Control"))
+    if "no-store" in cache_control or "private" in cache_control or response.headers.get("Vary") == "*":
+        return None
+    if "no-cache" in cache_control:
+        return 0.0
+    for directive in ("s-maxage", "max-age"):
+        if (seconds := _parse_seconds(cache_control.get(directive, ""))) is not None:
+            return seconds
+    date = _parse_date(response.headers.get("Date")) or time.time()
+    if "Expires" in response.headers:
+        expires = _parse_date(response.headers["Expires"])
+        # An invalid Expires date means the response is already expired
+        return max(0.0, expires - date) if expires is not None else 0.0
+    if response.status_code not in HEURISTICALLY_CACHEABLE_STATUS_CODES and "public" not in cache_control:
+        return None
+    if (last_modified := _parse_date(response.headers.get("Last-Modified"))) is not None:
+        return min(MAX_HEURISTIC_FRESHNESS, max(0.0, date - last_modified) * HEURISTIC_FRESHNESS_FRACTION)
+    return 0.0 if "ETag" in response.headers else None
+
+
+class CachedResponse(NamedTuple):
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    stored_at: float
+    freshness: float
+
+    @property
+    def etag(self) -> str | None:
+        return next((value for name, value in self.headers if name.lower() == "etag"), None)
+
+    @property
+    def last_modified(self) -> str | None:
+        return next((value for name, value in self.headers if name.lower() == "last-modified"), None)
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        age = int(time.monotonic() - self.stored_at)
+        headers = [(name, value) for name, value in self.headers if name.lower() != "age"]
+        return httpx.Response(
+            self.status_code, headers=[*headers, ("Age", str(age))], content=self.content, request=request
+        )
+
+
+class HttpResponseCache:
+    """A per-worker LRU cache of GET responses, following the HTTP caching rules for shared caches (RFC 9111).
+
+    Responses are stored when their headers allow it: `no-store`, `private` and `Vary: *` responses are
+    never stored, and responses to requests with an `Authorization` header only if they are marked `public`,
+    `s-maxage` or `must-revalidate`. Fresh responses are served from the cache; stale ones are revalidated
+    with `If-None-Match` / `If-Modified-Since` and served from the cache again on 304 Not Modified.
+    A request with `Cache-Control: no-cache` always revalidates, and one with `no-store` bypasses the cache.
+
+    Responses are keyed by URL and by all the request headers, so requests made with different credentials
+    never share a response. The cache is bounded by the total size of the cached bodies, set by the
+    `http_response_cache_max_size` setting in MB.
+    """
+
+    def __init__(self, max_size: int | None = None) -> None:
+        self._responses: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self.total_size = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return get_settings_service().settings.http_response_cache_max_size * BYTES_PER_MB
+
+    @staticmethod
+    def cache_key(url: str, headers: dict[str, str] | None, *, follow_redirects: bool) -> str:
+        request_headers = sorted((name.lower(), str(value)) for name, value in (headers or {}).items())
+        payload = orjson.dumps([url, request_headers, follow_redirects])
+        return hashlib.sha256(payload).hexdigest()
+
+    def _get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._responses.get(key)
+            if entry is not None:
+                self._responses.move_to_end(key)
+            return entry
+
+    def _set(self, key: str, entry: CachedResponse) -> None:
+        max_size = self.max_size
+        size = len(entry.content)
+        with self._lock:
+            if (previous := self._responses.pop(key, None)) is not None:
+                self.total_size -= len(previous.content)
+            if size > max_size:
+                return
+            while self._responses and self.total_size + size > max_size:
+                _, evicted = self._responses.popitem(last=False)
+                self.total_size -= len(evicted.content)
+            self._responses[key] = entry
+            self.total_size += size
+
+    def _store(self, key: str, response: httpx.Response, *, authorized: bool) -> None:
+        freshness = freshness_lifetime(response)
+        if freshness is None:
+            return
+        cache_control = parse_cache_control(response.headers.get("Cache-Control"))
+        if authorized and not {"public", "s-maxage", "must-revalidate"} & cache_control.keys():
+            return
+        headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in WIRE_HEADERS]
+        self._set(key, CachedResponse(response.status_code, headers, response.content, time.monotonic(), freshness))
+
+    async def get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        follow_redirects: bool = True,
+    ) -> httpx.Response:
+        """Sends a GET request through the cache."""
+        request_cache_control = parse_cache_control((headers or {}).get("Cache-Control"))
+        if "no-store" in request_cache_control:
+            return await client.get(url, headers=headers, timeout=timeout, follow_redirects=follow_redirects)
+
+        key = self.cache_key(url, headers, follow_redirects=follow_redirects)
+        cached = self._get(key)
+        if (
+            cached is not None
+            and "no-cache" not in request_cache_control
+            and time.monotonic() - cached.stored_at < cached.freshness
+        ):
+            self.hits += 1
+            return cached.to_response(httpx.Request("GET", url, headers=headers))
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+        response = await client.get(url, headers=request_headers, timeout=timeout, follow_redirects=follow_redirects)
+        authorized = any(name.lower() == "authorization" for name in request_headers)
+
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            self.hits += 1
+            # The 304 response replaces the stored headers it has, and with them the freshness of the response.
+            # Headers are kept as pairs, so that repeated ones like Set-Cookie are not merged.
+            updates = [
+                (name, value) for name, value in response.headers.multi_items() if name.lower() not in WIRE_HEADERS
+            ]
+            updated_names = {name.lower() for name, _ in updates}
+            headers = [(name, value) for name, value in cached.headers if name.lower() not in updated_names]
+            headers.extend(updates)
+            revalidated = httpx.Response(cached.status_code, headers=headers, content=cached.content)
+            self._store(key, revalidated, authorized=authorized)
+            return cached._replace(headers=headers).to_response(response.request)
+
+        self.misses += 1
+        await response.aread()
+        self._store(key, response, authorized=authorized)
+        return response
+
+    def clear(self) -> None:
+        with self._lock:
+            self._responses.clear()
+            self.total_size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+
+http_response_cache = HttpResponseCache()
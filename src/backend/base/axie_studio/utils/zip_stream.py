@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import zipfile
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+    ZipMember = tuple[str, bytes | AsyncIterable[bytes]]
+
+
+class _ZipSink:
+    """A write-only, unseekable file collecting the bytes written by `ZipFile` until they are drained.
+
+    Since it can't seek, `ZipFile` writes the sizes and checksums of the members after their data (in data
+    descriptors) instead of going back to their headers, so the archive can be sent as it is written.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def stream_zip(
+    members: AsyncIterable[ZipMember],
+    *,
+    compression: int = zipfile.ZIP_STORED,
+) -> AsyncIterator[bytes]:
+    """Builds a zip archive on the fly, yielding its bytes as the members are written.
+
+    Each member is a name and its content, either bytes or an async iterable of chunks. Members are pulled
+    one at a time and their chunks are written to the archive as they come, so the archive is never held
+    in memory and its first bytes are sent right away.
+    """
+    sink = _ZipSink()
+    with zipfile.ZipFile(sink, "w", compression=compression) as zip_file:
+        async for name, content in members:
+            if isinstance(content, bytes):
+                zip_file.writestr(name, content)
+            else:
+                # The size of a streamed member is unknown until it ends, allow it to exceed 4 GB
+                with zip_file.open(name, "w", force_zip64=True) as member:
+                    async for chunk in content:
+                        member.write(chunk)
+                        if data := sink.drain():
+                            yield data
+            if data := sink.drain():
+                yield data
+    # The central directory, written when the archive is closed
+    if data := sink.drain():
+        yield data
@@ -0,0 +1,39 @@
+import pytest
+from langflow.components.input_output import ChatInput, ChatOutput, TextOutputComponent
+from langflow.graph import Graph
+
+NUM_VERTICES = 500
+
+
+def _build_chain(num_vertices: int) -> tuple[ChatInput, ChatOutput]:
+    chat_input = ChatInput(_id="chat_input")
+    previous = chat_input.message_response
+    for index in range(num_vertices):
+        text_output = TextOutputComponent(_id=f"text_output_{index}")
+        text_output.set(input_value=previous)
+        previous = text_output.text_response
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=previous)
+    return chat_input, chat_output
+
+
+@pytest.mark.benchmark
+def test_build_large_graph():
+    """Benchmark building and preparing a graph with more than 500 vertices."""
+    chat_input, chat_output = _build_chain(NUM_VERTICES)
+    graph = Graph(chat_input, chat_output)
+
+    assert len(graph.vertices) == NUM_VERTICES + 2
+    assert len(graph.edges) == NUM_VERTICES + 1
+
+
+@pytest.mark.benchmark
+def test_large_graph_payload_round_trip():
+    """Benchmark rebuilding a graph with more than 500 vertices from its payload."""
+    chat_input, chat_output = _build_chain(NUM_VERTICES)
+    payload = Graph(chat_input, chat_output).dump()
+
+    graph = Graph.from_payload(payload["data"])
+
+    assert len(graph.vertices) == NUM_VERTICES + 2
+    assert len(graph.get_vertex("text_output_0").edges) == 2
@@ -66,6 +66,66 @@ async def test_read_flows(client: AsyncClient, logged_in_headers):
     assert isinstance(result, list), "The result must be a list"
 
 
+async def test_read_flow_headers_with_keyset_pagination(client: AsyncClient, logged_in_headers):
+    component_data = {"nodes": [{"id": "node"}], "edges": []}
+    flows = [
+        {"name": "header_flow_a", "data": {"nodes": [], "edges": []}, "is_component": False},
+        {"name": "header_component", "data": component_data, "is_component": True},
+    ]
+    for flow in flows:
+        response = await client.post("api/v1/flows/", json=flow, headers=logged_in_headers)
+        assert response.status_code == status.HTTP_201_CREATED
+    params = {"header_flows": True, "get_all": True, "limit": 1}
+
+    pages = []
+    cursor = None
+    while True:
+        response = await client.get(
+            "api/v1/flows/", params={**params, **({"cursor": cursor} if cursor else {})}, headers=logged_in_headers
+        )
+        assert response.status_code == status.HTTP_200_OK
+        pages.append(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert all(len(page) == 1 for page in pages)
+    headers = {page[0]["name"]: page[0] for page in pages}
+    assert {"header_flow_a", "header_component"} <= headers.keys()
+    assert headers["header_flow_a"]["data"] is None
+    assert headers["header_component"]["is_component"] is True
+    assert headers["header_component"]["data"] == component_data
+
+    # The same listing is answered with a 304 when the client already has it
+    response = await client.get("api/v1/flows/", params={**params, "limit": 100}, headers=logged_in_headers)
+    etag = response.headers["ETag"]
+    response = await client.get(
+        "api/v1/flows/", params={**params, "limit": 100}, headers={**logged_in_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    # Pagination is only supported for flow headers
+    response = await client.get("api/v1/flows/", params={"limit": 1}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def test_create_flow_stores_the_inferred_is_component_flag(client: AsyncClient, logged_in_headers):
+    flow = {"name": "inferred_component", "data": {"nodes": [{"id": "node"}], "edges": []}, "is_component": None}
+    response = await client.post("api/v1/flows/", json=flow, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["is_component"] is True
+
+
+async def test_create_flows_stores_the_inferred_is_component_flag(client: AsyncClient, logged_in_headers):
+    flows = [
+        {"name": "inferred_batch_component", "data": {"nodes": [{"id": "node"}], "edges": []}, "is_component": None},
+        {"name": "inferred_batch_flow", "data": {"nodes": [], "edges": []}, "is_component": None},
+    ]
+    response = await client.post("api/v1/flows/batch/", json={"flows": flows}, headers=logged_in_headers)
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [flow["is_component"] for flow in response.json()] == [True, False]
+
+
 async def test_read_flow(client: AsyncClient, logged_in_headers):
     basic_case = {
         "name": "string",
@@ -1,5 +1,7 @@
 import asyncio
+import io
 import tempfile
+import zipfile
 from contextlib import suppress
 from pathlib import Path
 
@@ -13,7 +15,7 @@ from langflow.services.auth.utils import get_password_hash
 from langflow.services.database.models.api_key.model import ApiKey
 from langflow.services.database.models.user.model import User, UserRead
 from langflow.services.database.utils import session_getter
-from langflow.services.deps import get_db_service
+from langflow.services.deps import get_db_service, get_storage_service
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
@@ -156,6 +158,28 @@ async def test_download_file(files_client, files_created_api_key):
     assert response.content == b"test content"
 
 
+async def test_download_files_batch(files_client, files_created_api_key):
+    headers = {"x-api-key": files_created_api_key.api_key}
+    uploaded = []
+    for name in ("first.txt", "second.txt"):
+        response = await files_client.post("api/v2/files", files={"file": (name, name.encode())}, headers=headers)
+        assert response.status_code == 201
+        uploaded.append(response.json())
+
+    response = await files_client.post("api/v2/files/batch/", json=[file["id"] for file in uploaded], headers=headers)
+    assert response.status_code == 200
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert sorted(archive.namelist()) == ["first.txt", "second.txt"]
+        assert archive.read("second.txt") == b"second.txt"
+
+    # A file missing from the storage fails the request before the archive is sent
+    await get_storage_service().delete_file(
+        flow_id=str(files_created_api_key.user_id), file_name=Path(uploaded[1]["path"]).name
+    )
+    response = await files_client.post("api/v2/files/batch/", json=[file["id"] for file in uploaded], headers=headers)
+    assert response.status_code == 500
+
+
 async def test_list_files(files_client, files_created_api_key):
     headers = {"x-api-key": files_created_api_key.api_key}
 
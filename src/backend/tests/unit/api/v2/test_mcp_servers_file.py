@@ -1,3 +1,4 @@
+import hashlib
 import io
 import uuid
 from types import SimpleNamespace
@@ -8,6 +9,7 @@ from fastapi import UploadFile
 
 # Module under test
 from langflow.api.v2.files import MCP_SERVERS_FILE, upload_user_file
+from langflow.services.storage.service import StoredFile
 
 if TYPE_CHECKING:
     from langflow.services.database.models.file.model import File as UserFile
@@ -21,6 +23,11 @@ class FakeStorageService:  # Minimal stub for storage interactions
     async def save_file(self, flow_id: str, file_name: str, data: bytes):
         self._store[f"{flow_id}/{file_name}"] = data
 
+    async def save_file_stream(self, flow_id: str, file_name: str, stream, *, max_size=None):  # noqa: ARG002
+        data = b"".join([chunk async for chunk in stream])
+        self._store[f"{flow_id}/{file_name}"] = data
+        return StoredFile(size=len(data), sha256=hashlib.sha256(data).hexdigest())
+
     async def get_file_size(self, flow_id: str, file_name: str):
         return len(self._store.get(f"{flow_id}/{file_name}", b""))
 
@@ -0,0 +1,54 @@
+from langchain_core.embeddings import Embeddings
+from langflow.base.embeddings.cache import CachedEmbeddings, EmbeddingStore
+
+
+class CountingEmbeddings(Embeddings):
+    def __init__(self, model: str = "model", api_key: str = "key"):
+        self.model = model
+        self.api_key = api_key
+        self.embedded: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return [[float(len(text)), 0.1] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.embedded.append(text)
+        return [float(len(text)), 0.2]
+
+
+def test_cached_embeddings_only_embed_new_texts(tmp_path):
+    model = CountingEmbeddings()
+    embeddings = CachedEmbeddings(model, EmbeddingStore(tmp_path / "cache.db", memory_size=2))
+
+    assert embeddings.embed_documents(["a", "bb", "a"]) == [[1.0, 0.1], [2.0, 0.1], [1.0, 0.1]]
+    assert embeddings.embed_documents(["bb", "ccc", "a"]) == [[2.0, 0.1], [3.0, 0.1], [1.0, 0.1]]
+    assert embeddings.embed_query("a") == [1.0, 0.2]
+    assert embeddings.embed_query("a") == [1.0, 0.2]
+    assert model.embedded == ["a", "bb", "ccc", "a"]
+    assert embeddings.model == "model"
+
+    # Vectors are read back from disk
+    same_model = CountingEmbeddings()
+    reopened = CachedEmbeddings(same_model, EmbeddingStore(tmp_path / "cache.db", memory_size=2))
+    assert reopened.embed_documents(["a", "bb", "ccc"]) == [[1.0, 0.1], [2.0, 0.1], [3.0, 0.1]]
+    assert same_model.embedded == []
+
+    # Models built with other API keys don't share vectors
+    other_key = CountingEmbeddings(api_key="other")
+    CachedEmbeddings(other_key, EmbeddingStore(tmp_path / "cache.db", memory_size=2)).embed_documents(["a"])
+    assert other_key.embedded == ["a"]
+
+    other_model = CountingEmbeddings(model="other")
+    CachedEmbeddings(other_model, EmbeddingStore(tmp_path / "cache.db", memory_size=2)).embed_documents(["a"])
+    assert other_model.embedded == ["a"]
+
+
+async def test_cached_embeddings_async():
+    model = CountingEmbeddings()
+    embeddings = CachedEmbeddings(model, EmbeddingStore(None, memory_size=10))
+
+    assert await embeddings.aembed_documents(["a", "bb"]) == [[1.0, 0.1], [2.0, 0.1]]
+    assert await embeddings.aembed_documents(["bb", "a"]) == [[2.0, 0.1], [1.0, 0.1]]
+    assert await embeddings.aembed_query("a") == await embeddings.aembed_query("a")
+    assert model.embedded == ["a", "bb", "a"]
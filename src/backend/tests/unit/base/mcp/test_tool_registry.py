@@ -0,0 +1,62 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+from langflow.base.mcp.tool_registry import MCPToolRegistry
+from langflow.services.database.models.flow.model import Flow
+from langflow.services.database.models.user.model import User
+
+
+async def test_tool_registry_caches_input_schemas(async_session):
+    user = User(id=uuid4(), username="user", password="password")  # noqa: S106
+    flows = [
+        Flow(id=uuid4(), name="My Flow ✨", data={}, user_id=user.id),
+        Flow(id=uuid4(), name="Other flow", action_name="Do Things", data={}, user_id=user.id),
+    ]
+    async_session.add(user)
+    async_session.add_all(flows)
+    await async_session.commit()
+    registry = MCPToolRegistry()
+
+    with patch(
+        "langflow.base.mcp.tool_registry.json_schema_from_flow", return_value={"type": "object"}
+    ) as json_schema_from_flow:
+        listed = await registry.list_flows(async_session)
+        assert [flow.tool_name for flow in listed] == ["my_flow", "other_flow"]
+        assert [flow.action_tool_name for flow in listed] == ["my_flow", "do_things"]
+        assert await registry.get_input_schemas(async_session, listed) == {
+            flow.id: {"type": "object"} for flow in flows
+        }
+        assert await registry.get_input_schemas(async_session, listed) == {
+            flow.id: {"type": "object"} for flow in flows
+        }
+        assert json_schema_from_flow.call_count == len(flows)
+
+        registry.invalidate(flows[0].id)
+        await registry.get_input_schemas(async_session, listed)
+        assert json_schema_from_flow.call_count == len(flows) + 1
+
+    assert (await registry.find_flow(async_session, "my_flow", user.id)).id == flows[0].id
+    assert (await registry.find_flow(async_session, "do_things", str(user.id), is_action=True)).id == flows[1].id
+    assert await registry.find_flow(async_session, "do_things", user.id) is None
+
+
+async def test_tool_registry_finds_renamed_and_new_flows(async_session):
+    user = User(id=uuid4(), username="user", password="password")  # noqa: S106
+    flow = Flow(id=uuid4(), name="First", data={}, user_id=user.id)
+    async_session.add(user)
+    async_session.add(flow)
+    await async_session.commit()
+    registry = MCPToolRegistry()
+
+    assert (await registry.find_flow(async_session, "first", user.id)).id == flow.id
+    assert await registry.find_flow(async_session, "second", user.id) is None
+
+    flow.name = "Second"
+    async_session.add(flow)
+    new_flow = Flow(id=uuid4(), name="First", data={}, user_id=user.id)
+    async_session.add(new_flow)
+    await async_session.commit()
+
+    assert (await registry.find_flow(async_session, "second", user.id)).id == flow.id
+    assert (await registry.find_flow(async_session, "first", user.id)).id == new_flow.id
+    assert await registry.find_flow(async_session, "first", uuid4()) is None
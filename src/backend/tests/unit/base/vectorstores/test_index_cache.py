@@ -0,0 +1,52 @@
+import os
+
+from langflow.base.vectorstores.index_cache import VectorIndexCache, files_stamp
+
+
+def test_vector_index_cache_reloads_changed_indexes(tmp_path):
+    index_file = tmp_path / "index.faiss"
+    index_file.write_bytes(b"index")
+    cache = VectorIndexCache(max_size=100)
+    loads = []
+
+    def load():
+        loads.append(index_file.read_bytes())
+        return object()
+
+    first = cache.get_or_load(("faiss", str(tmp_path), "index"), files_stamp(index_file), load, size=10)
+    assert cache.get_or_load(("faiss", str(tmp_path), "index"), files_stamp(index_file), load, size=10) is first
+    assert len(loads) == 1
+
+    index_file.write_bytes(b"new index")
+    stat = index_file.stat()
+    os.utime(index_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    second = cache.get_or_load(("faiss", str(tmp_path), "index"), files_stamp(index_file), load, size=10)
+    assert second is not first
+    assert loads == [b"index", b"new index"]
+    assert len(cache) == 1
+    assert cache.total_size == 10
+
+    cache.invalidate("faiss", str(tmp_path))
+    assert len(cache) == 0
+    assert cache.total_size == 0
+
+
+def test_vector_index_cache_evicts_least_recently_used_indexes():
+    cache = VectorIndexCache(max_size=100)
+    for name in ("a", "b", "c"):
+        cache.get_or_load(("faiss", name), (), object, size=40)
+
+    assert len(cache) == 2
+    assert cache.total_size == 80
+    cache.get_or_load(("faiss", "d"), (), object, size=200)
+    assert len(cache) == 2
+    assert cache.hits == 0
+    # The load locks go away with their indexes
+    assert set(cache._load_locks) == {("faiss", "b"), ("faiss", "c")}
+    cache.invalidate("faiss", "b")
+    assert set(cache._load_locks) == {("faiss", "c")}
+
+    disabled = VectorIndexCache(max_size=0)
+    assert disabled.get_or_load(("faiss", "a"), (), object, size=1) is not disabled.get_or_load(
+        ("faiss", "a"), (), object, size=1
+    )
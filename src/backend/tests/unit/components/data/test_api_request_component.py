@@ -9,6 +9,7 @@ from httpx import Response
 from langflow.components.data import APIRequestComponent
 from langflow.schema import Data
 from langflow.schema.dotdict import dotdict
+from langflow.utils.http_client import HttpResponseCache
 
 from tests.base import ComponentTestBaseWithoutClient
 
@@ -252,6 +253,50 @@ class TestAPIRequestComponent(ComponentTestBaseWithoutClient):
             assert result.data["source"] == url
             assert result.data["result"]["key"] == "value"
 
+    @respx.mock
+    async def test_make_request_with_cache(self, component):
+        # Fresh responses are served from the cache, stale ones are revalidated
+        url = "https://example.com/api/cached"
+        cache = HttpResponseCache(max_size=1024 * 1024)
+        route = respx.get(url).mock(
+            side_effect=[
+                Response(200, json={"key": "value"}, headers={"Cache-Control": "max-age=0", "ETag": '"v1"'}),
+                Response(304, headers={"ETag": '"v1"', "Cache-Control": "max-age=60"}),
+            ]
+        )
+
+        async with httpx.AsyncClient() as client:
+            first = await component.make_request(client=client, method="GET", url=url, cache=cache)
+            second = await component.make_request(client=client, method="GET", url=url, cache=cache)
+            third = await component.make_request(client=client, method="GET", url=url, cache=cache)
+
+        assert route.call_count == 2
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert first.data["result"] == second.data["result"] == third.data["result"] == {"key": "value"}
+        assert second.data["status_code"] == third.data["status_code"] == 200
+        assert cache.misses == 1
+        assert cache.hits == 2
+
+    @respx.mock
+    async def test_make_api_request_with_batch_urls(self, component):
+        # Batch requests run concurrently and keep the order of the URLs
+        component.batch_urls = ["https://example.com/api/one", "", "https://example.com/api/two"]
+        component.max_concurrency = 2
+        respx.get("https://example.com/api/test").mock(return_value=Response(200, json={"n": 0}))
+        respx.get("https://example.com/api/one").mock(return_value=Response(200, json={"n": 1}))
+        respx.get("https://example.com/api/two").mock(return_value=Response(200, json={"n": 2}))
+
+        result = await component.make_api_request()
+
+        assert isinstance(result, Data)
+        responses = result.data["responses"]
+        assert [response["source"] for response in responses] == [
+            "https://example.com/api/test",
+            "https://example.com/api/one",
+            "https://example.com/api/two",
+        ]
+        assert [response["result"]["n"] for response in responses] == [0, 1, 2]
+
     async def test_invalid_urls(self, component):
         # Test invalid URL handling
         component.url_input = "not_a_valid_url"
@@ -2,6 +2,7 @@ import sqlite3
 from pathlib import Path
 
 import pytest
+from langflow.base.data.sql_engines import is_select_query, limit_query, sql_engine_registry
 from langflow.components.data.sql_executor import SQLComponent
 from langflow.schema import DataFrame, Message
 
@@ -30,6 +31,7 @@ class TestSQLComponent(ComponentTestBaseWithoutClient):
         conn.close()
         yield str(db_path)
 
+        sql_engine_registry.invalidate(f"sqlite:///{db_path}")
         Path(db_path).unlink()
 
     @pytest.fixture
@@ -101,3 +103,84 @@ class TestSQLComponent(ComponentTestBaseWithoutClient):
         assert "name" in result.columns
         assert result.iloc[0]["id"] == 1
         assert result.iloc[0]["name"] == "name_test"
+
+    def test_run_sql_query_with_max_rows(self, component_class: type[SQLComponent], default_kwargs, test_db):
+        """Test that the row limit is applied and that components share the engine of a database."""
+        conn = sqlite3.connect(test_db)
+        conn.executemany("INSERT INTO test (id, name) VALUES (?, ?)", [(i, f"name_{i}") for i in range(2, 12)])
+        conn.commit()
+        conn.close()
+        default_kwargs["max_rows"] = 3
+        first = component_class(**default_kwargs)
+        second = component_class(**default_kwargs)
+
+        result = first.run_sql_query()
+
+        assert list(result["id"]) == [1, 2, 3]
+        assert len(second.run_sql_query()) == 3
+        assert sql_engine_registry.get_engine(default_kwargs["database_url"]) is first.db._engine
+        assert first.db is second.db
+        assert str(limit_query("SELECT * FROM test;", 3)).startswith("SELECT * \nFROM (SELECT * FROM test) AS")
+        assert limit_query("PRAGMA table_info(test)", 3) == "PRAGMA table_info(test)"
+        assert limit_query("SELECT * FROM test", 0) == "SELECT * FROM test"
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("SELECT * FROM test", True),
+            ("  (SELECT 1) UNION (SELECT 2)", True),
+            ("VALUES (1), (2)", True),
+            ("-- the ids\nSELECT id FROM test", True),
+            ("WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n) SELECT x FROM n", True),
+            ('WITH "a b" AS MATERIALIZED (SELECT \'delete\'), c AS (SELECT 1) SELECT * FROM "a b", c', True),
+            ("WITH x AS (SELECT id FROM test) DELETE FROM test WHERE id IN (SELECT id FROM x)", False),
+            ("WITH x AS (SELECT 1) INSERT INTO test (id) SELECT * FROM x", False),
+            ("WITH x AS (UPDATE test SET id = 1 RETURNING *) SELECT * FROM x", False),
+            ("WITH x AS (WITH y AS (DELETE FROM test RETURNING *) SELECT * FROM y) SELECT * FROM x", False),
+            ("/* SELECT */ UPDATE test SET id = 1", False),
+            ("PRAGMA table_info(test)", False),
+        ],
+    )
+    def test_is_select_query(self, query, expected):
+        """Only queries whose top-level statement and CTEs are all selects are wrapped with a row limit."""
+        assert is_select_query(query) is expected
+        if not expected:
+            assert limit_query(query, 3) == query
+
+    @pytest.mark.parametrize(
+        ("query", "wrapped"),
+        [
+            ("SELECT id FROM test WHERE id IN (SELECT id FROM test ORDER BY id)", True),
+            ("SELECT a.id FROM (SELECT id FROM test) AS a", True),
+            ("SELECT 1 UNION SELECT 2", True),
+            ("SELECT id FROM test ORDER BY id DESC", False),
+            ("(SELECT id FROM test ORDER BY id)", False),
+            ("SELECT * FROM test AS a JOIN test AS b ON a.id = b.id", False),
+            ("SELECT * FROM test AS a, test AS b", False),
+        ],
+    )
+    def test_limit_query_only_wraps_queries_it_keeps(self, query, wrapped):
+        """Queries that could return other rows once wrapped in a subquery are left for the client to cut."""
+        assert (limit_query(query, 3) != query) is wrapped
+
+    def test_read_dataframe_cuts_ordered_queries(self, default_kwargs, test_db):
+        """Test that a query the database can't limit keeps its order and is cut at the row limit."""
+        conn = sqlite3.connect(test_db)
+        conn.executemany("INSERT INTO test (id, name) VALUES (?, ?)", [(i, f"name_{i}") for i in range(2, 12)])
+        conn.commit()
+        conn.close()
+
+        result = sql_engine_registry.read_dataframe(
+            default_kwargs["database_url"], "SELECT id FROM test ORDER BY id DESC", max_rows=3, chunk_size=2
+        )
+
+        assert list(result["id"]) == [11, 10, 9]
+
+    def test_iter_dataframes_in_chunks(self, default_kwargs):
+        """Test streaming the rows of a query in chunks."""
+        query = "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 25) SELECT x FROM n"
+
+        chunks = list(sql_engine_registry.iter_dataframes(default_kwargs["database_url"], query, chunk_size=10))
+
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        assert all(isinstance(chunk, DataFrame) for chunk in chunks)
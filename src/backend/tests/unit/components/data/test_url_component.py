@@ -1,6 +1,8 @@
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
+from langflow.base.data.url_fetcher import page_cache
 from langflow.components.data import URLComponent
 from langflow.schema import DataFrame
 
@@ -40,7 +42,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         with patch("langchain_community.document_loaders.RecursiveUrlLoader.load") as mock:
             yield mock
 
-    def test_url_component_basic_functionality(self, mock_recursive_loader):
+    async def test_url_component_basic_functionality(self, mock_recursive_loader):
         """Test basic URLComponent functionality."""
         component = URLComponent()
         component.set_attributes({"urls": ["https://example.com"], "max_depth": 2})
@@ -57,7 +59,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         )
         mock_recursive_loader.return_value = [mock_doc]
 
-        data_frame = component.fetch_content()
+        data_frame = await component.fetch_content()
         assert isinstance(data_frame, DataFrame)
         assert len(data_frame) == 1
 
@@ -69,12 +71,12 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         assert row["content_type"] == "text/html"
         assert row["language"] == "en"
 
-    def test_url_component_multiple_urls(self, mock_recursive_loader):
+    async def test_url_component_multiple_urls(self, mock_recursive_loader):
         """Test URLComponent with multiple URL inputs."""
         # Setup component with multiple URLs
         component = URLComponent()
         urls = ["https://example1.com", "https://example2.com"]
-        component.set_attributes({"urls": urls})
+        component.set_attributes({"urls": urls, "max_depth": 2})
 
         # Create mock documents for each URL
         mock_docs = [
@@ -104,7 +106,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         mock_recursive_loader.return_value = mock_docs
 
         # Execute component
-        result = component.fetch_content()
+        result = await component.fetch_content()
 
         # Verify results
         assert isinstance(result, DataFrame)
@@ -124,12 +126,12 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         assert second_row["title"] == "Second Page"
         assert second_row["description"] == "Second Description"
 
-    def test_url_component_format_options(self, mock_recursive_loader):
+    async def test_url_component_format_options(self, mock_recursive_loader):
         """Test URLComponent with different format options."""
         component = URLComponent()
 
         # Test with Text format
-        component.set_attributes({"urls": ["https://example.com"], "format": "Text"})
+        component.set_attributes({"urls": ["https://example.com"], "format": "Text", "max_depth": 2})
         mock_recursive_loader.return_value = [
             Mock(
                 page_content="extracted text",
@@ -142,12 +144,12 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
                 },
             )
         ]
-        data_frame = component.fetch_content()
+        data_frame = await component.fetch_content()
         assert data_frame.iloc[0]["text"] == "extracted text"
         assert data_frame.iloc[0]["content_type"] == "text/html"
 
         # Test with HTML format
-        component.set_attributes({"urls": ["https://example.com"], "format": "HTML"})
+        component.set_attributes({"urls": ["https://example.com"], "format": "HTML", "max_depth": 2})
         mock_recursive_loader.return_value = [
             Mock(
                 page_content="<html>raw html</html>",
@@ -160,14 +162,14 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
                 },
             )
         ]
-        data_frame = component.fetch_content()
+        data_frame = await component.fetch_content()
         assert data_frame.iloc[0]["text"] == "<html>raw html</html>"
         assert data_frame.iloc[0]["content_type"] == "text/html"
 
-    def test_url_component_missing_metadata(self, mock_recursive_loader):
+    async def test_url_component_missing_metadata(self, mock_recursive_loader):
         """Test URLComponent with missing metadata fields."""
         component = URLComponent()
-        component.set_attributes({"urls": ["https://example.com"]})
+        component.set_attributes({"urls": ["https://example.com"], "max_depth": 2})
 
         mock_doc = Mock(
             page_content="test content",
@@ -175,7 +177,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         )
         mock_recursive_loader.return_value = [mock_doc]
 
-        data_frame = component.fetch_content()
+        data_frame = await component.fetch_content()
         row = data_frame.iloc[0]
         assert row["text"] == "test content"
         assert row["url"] == "https://example.com"
@@ -184,26 +186,84 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         assert row["content_type"] == ""  # Default empty string
         assert row["language"] == ""  # Default empty string
 
-    def test_url_component_error_handling(self, mock_recursive_loader):
+    async def test_url_component_error_handling(self, mock_recursive_loader):
         """Test error handling in URLComponent."""
         component = URLComponent()
 
         # Test empty URLs
         component.set_attributes({"urls": []})
         with pytest.raises(ValueError, match="Error loading documents:"):
-            component.fetch_content()
+            await component.fetch_content()
 
         # Test request exception
-        component.set_attributes({"urls": ["https://example.com"]})
+        component.set_attributes({"urls": ["https://example.com"], "max_depth": 2})
         mock_recursive_loader.side_effect = Exception("Connection error")
         with pytest.raises(ValueError, match="Error loading documents:"):
-            component.fetch_content()
+            await component.fetch_content()
 
         # Test no documents found
         mock_recursive_loader.side_effect = None
         mock_recursive_loader.return_value = []
         with pytest.raises(ValueError, match="Error loading documents:"):
-            component.fetch_content()
+            await component.fetch_content()
+
+    @pytest.fixture
+    def mock_http_client(self):
+        """Serve pages from a mock transport, counting the requests sent."""
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.host == "broken.example.com":
+                return httpx.Response(500)
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            html = (
+                f'<html lang="en"><head><title>{request.url.host}</title>'
+                '<meta name="description" content="A page"></head>'
+                f"<body><p>Content of {request.url.host}</p></body></html>"
+            )
+            return httpx.Response(200, html=html, headers={"ETag": '"v1"'})
+
+        page_cache.clear()
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        with patch("langflow.base.data.url_fetcher.get_http_client", return_value=client):
+            yield requests
+        page_cache.clear()
+
+    async def test_url_component_fetches_pages_concurrently(self, mock_http_client):
+        """Pages are fetched with the shared client, in the order of the URLs, and revalidated."""
+        component = URLComponent()
+        urls = ["https://one.example.com", "https://broken.example.com", "two.example.com"]
+        component.set_attributes({"urls": urls, "check_response_status": True})
+
+        data_frame = await component.fetch_content()
+        assert list(data_frame["url"]) == ["https://one.example.com", "https://two.example.com"]
+        assert data_frame.iloc[0]["text"] == "one.example.comContent of one.example.com"
+        assert data_frame.iloc[0]["title"] == "one.example.com"
+        assert data_frame.iloc[0]["description"] == "A page"
+        assert data_frame.iloc[0]["language"] == "en"
+        assert data_frame.iloc[0]["content_type"].startswith("text/html")
+
+        component.set_attributes({"urls": ["https://one.example.com"], "format": "HTML"})
+        data_frame = await component.fetch_content()
+        assert data_frame.iloc[0]["text"].startswith('<html lang="en">')
+        assert mock_http_client[-1].headers["If-None-Match"] == '"v1"'
+
+        component.set_attributes({"urls": urls, "continue_on_failure": False})
+        with pytest.raises(ValueError, match="500 Internal Server Error"):
+            await component.fetch_content()
+
+    async def test_url_component_does_not_share_pages_across_credentials(self, mock_http_client):
+        """A page cached for some credentials is not revalidated for, or served to, other ones."""
+        component = URLComponent()
+        component.set_attributes({"urls": ["https://one.example.com"]})
+
+        for token in ("first", "second", "first"):
+            component.set_attributes({"headers": [{"key": "Authorization", "value": f"Bearer {token}"}]})
+            await component.fetch_content()
+
+        assert [request.headers.get("If-None-Match") for request in mock_http_client] == [None, None, '"v1"']
 
     def test_url_component_ensure_url(self):
         """Test URLComponent's ensure_url method."""
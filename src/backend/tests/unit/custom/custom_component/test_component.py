@@ -7,6 +7,7 @@ from langflow.components.custom_component import CustomComponent
 from langflow.components.input_output import ChatInput, ChatOutput
 from langflow.custom.custom_component.component import Component
 from langflow.custom.utils import update_component_build_config
+from langflow.inputs import TableInput
 from langflow.schema import dotdict
 from langflow.schema.message import Message
 from langflow.services.database.session import NoopSession
@@ -28,6 +29,42 @@ def test_set_invalid_output():
         chatoutput.set(input_value=chatinput.build_config)
 
 
+def test_component_instances_do_not_share_inputs_and_outputs():
+    first = ChatInput()
+    second = ChatInput()
+
+    assert ChatInput._get_descriptor() is ChatInput._get_descriptor()
+    assert first._code == second._code
+    for name, input_ in first._inputs.items():
+        assert input_ is not second._inputs[name]
+        assert input_ is not ChatInput._get_descriptor().input_specs[name]
+    for name, output in first._outputs_map.items():
+        assert output is not second._outputs_map[name]
+        assert output.types == second._outputs_map[name].types
+        assert output.types
+
+    first._inputs["input_value"].value = "changed"
+    first._outputs_map["message"].types.append("Changed")
+    assert second._inputs["input_value"].value != "changed"
+    assert "Changed" not in second._outputs_map["message"].types
+    assert "Changed" not in ChatInput()._outputs_map["message"].types
+
+
+def test_component_instances_do_not_share_nested_values():
+    class TableComponent(Component):
+        inputs = [TableInput(name="rows", value=[{"name": "a"}])]
+        outputs = [Output(name="rows_output", method="build_rows")]
+
+        def build_rows(self) -> list:
+            return self.rows
+
+    first = TableComponent()
+    first._inputs["rows"].value[0]["name"] = "changed"
+
+    assert TableComponent()._inputs["rows"].value == [{"name": "a"}]
+    assert TableComponent._get_descriptor().input_specs["rows"].value == [{"name": "a"}]
+
+
 @pytest.mark.xfail(reason="CrewAI is not outdated")
 def test_set_component():
     crewai_agent = CrewAIAgentComponent()
@@ -1,4 +1,5 @@
 import asyncio
+import threading
 import time
 from typing import Any
 from unittest.mock import MagicMock
@@ -6,7 +7,7 @@ from uuid import uuid4
 
 import pytest
 from langflow.custom.custom_component.component import Component
-from langflow.events.event_manager import EventManager
+from langflow.events.event_manager import EventManager, create_default_event_manager
 from langflow.schema.content_block import ContentBlock
 from langflow.schema.content_types import TextContent, ToolContent
 from langflow.schema.message import Message
@@ -261,3 +262,35 @@ async def test_component_streaming_message():
             tokens.append(event)
 
     assert len(tokens) > 0
+
+
+async def test_sync_stream_sends_tokens_while_generating():
+    """Test that tokens of a sync stream are sent while the stream is still generating."""
+    queue = asyncio.Queue()
+    component = ComponentForTesting()
+    component.set_event_manager(create_default_event_manager(queue))
+    released = threading.Event()
+    waits: list[bool] = []
+
+    class StreamChunk:
+        def __init__(self, content: str):
+            self.content = content
+
+    def text_generator():
+        yield StreamChunk("Hello")
+        # Blocks until the first token is received, which can't happen if the event loop is blocked
+        waits.append(released.wait(timeout=2))
+        yield StreamChunk(" World")
+
+    message = Message(sender="test_sender", session_id="test_session", sender_name="test_sender_name")
+    message.id = str(uuid4())
+    stream_task = asyncio.create_task(component._stream_message(text_generator(), message))
+
+    while True:
+        _, event_data, _ = await asyncio.wait_for(queue.get(), timeout=2)
+        if b'"event": "token"' in event_data:
+            break
+    released.set()
+
+    assert await stream_task == "Hello World"
+    assert waits == [True]
@@ -0,0 +1,62 @@
+import pytest
+from langflow.custom.eval import ComponentClassCache, component_class_cache, eval_custom_component_code
+
+COMPONENT_CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class EchoComponent(Component):
+    inputs = [MessageTextInput(name="text", display_name="Text")]
+    outputs = [Output(display_name="Output", name="output", method="echo")]
+
+    def echo(self) -> Message:
+        return Message(text=self.text)
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_component_class_cache():
+    component_class_cache.clear()
+    yield
+    component_class_cache.clear()
+
+
+def test_eval_custom_component_code_reuses_class():
+    first = eval_custom_component_code(COMPONENT_CODE)
+    second = eval_custom_component_code(COMPONENT_CODE)
+
+    assert first is second
+    assert component_class_cache.stats() == {"size": 1, "max_size": 512, "hits": 1, "misses": 1}
+
+
+def test_eval_custom_component_code_rebuilds_on_code_change():
+    first = eval_custom_component_code(COMPONENT_CODE)
+    changed = eval_custom_component_code(COMPONENT_CODE.replace("EchoComponent", "ChangedComponent"))
+
+    assert first is not changed
+    assert changed.__name__ == "ChangedComponent"
+    assert len(component_class_cache) == 2
+
+
+def test_component_class_cache_evicts_least_recently_used():
+    cache = ComponentClassCache(max_size=2)
+    cache.set("a", "code a", int)
+    cache.set("b", "code b", str)
+    assert cache.get("a", "code a") is int
+    cache.set("c", "code c", float)
+
+    assert cache.get("b", "code b") is None
+    assert cache.get("a", "code a") is int
+    assert cache.get("c", "code c") is float
+
+
+def test_component_class_cache_checks_source_on_hash_collision():
+    cache = ComponentClassCache()
+    cache.set("same-hash", "code a", int)
+
+    assert cache.get("same-hash", "code b") is None
+    assert cache.misses == 1
+    cache.invalidate("same-hash")
+    assert cache.get("same-hash", "code a") is None
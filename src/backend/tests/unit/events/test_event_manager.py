@@ -4,7 +4,7 @@ import time
 import uuid
 
 import pytest
-from langflow.events.event_manager import EventManager
+from langflow.events.event_manager import EventManager, TokenBuffer
 from langflow.schema.log import LoggableType
 
 
@@ -210,3 +210,54 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+
+class TestTokenBuffer:
+    @staticmethod
+    def _token_events(queue: asyncio.Queue) -> list[dict]:
+        events = []
+        while not queue.empty():
+            _, str_data, _ = queue.get_nowait()
+            events.append(json.loads(str_data)["data"])
+        return events
+
+    # Coalescing tokens until the size budget is reached
+    async def test_flushes_when_size_budget_is_reached(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        token_buffer = TokenBuffer(manager, "message_id", max_delay=60, max_size=10)
+
+        for chunk in ["Hello", " ", "World", "!"]:
+            token_buffer.add(chunk)
+        events = self._token_events(queue)
+        assert [event["chunk"] for event in events] == ["Hello World"]
+
+        token_buffer.flush()
+        events = self._token_events(queue)
+        assert [event["chunk"] for event in events] == ["!"]
+        assert events[0]["id"] == "message_id"
+
+    # Coalescing tokens until the time budget is reached
+    async def test_flushes_when_time_budget_is_reached(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        token_buffer = TokenBuffer(manager, "message_id", max_delay=0.01, max_size=1024)
+
+        token_buffer.add("Hello")
+        token_buffer.add(" World")
+        assert queue.empty()
+        await asyncio.sleep(0.05)
+        assert [event["chunk"] for event in self._token_events(queue)] == ["Hello World"]
+
+    # Sending every token when coalescing is disabled
+    async def test_sends_every_token_when_disabled(self):
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+        manager.register_event("on_token", "token")
+        token_buffer = TokenBuffer(manager, "message_id", max_delay=0, max_size=256)
+
+        token_buffer.add("Hello")
+        token_buffer.add(" World")
+        assert [event["chunk"] for event in self._token_events(queue)] == ["Hello", " World"]
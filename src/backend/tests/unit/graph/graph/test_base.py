@@ -1,5 +1,8 @@
+import asyncio
+import json
 import logging
 from collections import deque
+from uuid import uuid4
 
 import pytest
 from langflow.components.input_output import ChatInput, ChatOutput, TextOutputComponent
@@ -7,6 +10,8 @@ from langflow.components.langchain_utilities import ToolCallingAgentComponent
 from langflow.components.tools import YfinanceToolComponent
 from langflow.graph import Graph
 from langflow.graph.graph.constants import Finish
+from langflow.services.cache.utils import CacheMiss
+from langflow.services.deps import get_chat_service
 
 
 async def test_graph_not_prepared():
@@ -130,6 +135,115 @@ def test_graph_functional_start_end():
     assert results[-1] == Finish()
 
 
+async def test_graph_process_eager_mode():
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(_id="chat_output", should_store_message=False)
+    chat_output.set(input_value=text_output.text_response)
+    graph = Graph(chat_input, chat_output)
+
+    await graph.process(fallback_to_env_vars=False, execution_mode="eager", max_concurrency=1)
+
+    assert all(vertex.built for vertex in graph.vertices)
+    assert graph.run_manager.ran_at_least_once == {"chat_input", "text_output", "chat_output"}
+
+
+async def test_graph_process_invalid_execution_mode():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+
+    with pytest.raises(ValueError, match="Invalid execution mode"):
+        await graph.process(fallback_to_env_vars=False, execution_mode="parallel")
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        await graph.process(fallback_to_env_vars=False, execution_mode="eager", max_concurrency=0)
+
+
+def test_graph_clone_from_payload(json_memory_chatbot_no_llm):
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm), flow_id="flow_id", user_id="user_id")
+    clone = graph.clone()
+
+    assert [vertex.id for vertex in clone.vertices] == [vertex.id for vertex in graph.vertices]
+    assert clone.flow_id == "flow_id"
+    assert clone.user_id == "user_id"
+    assert clone.predecessor_map == graph.predecessor_map
+    assert clone.predecessor_map is not graph.predecessor_map
+    for vertex, cloned_vertex in zip(graph.vertices, clone.vertices, strict=True):
+        assert cloned_vertex is not vertex
+        assert cloned_vertex.graph is clone
+        assert cloned_vertex.custom_component is not vertex.custom_component
+        assert cloned_vertex.custom_component._vertex is cloned_vertex
+    for edge in clone.edges:
+        assert clone.get_vertex(edge.source_id) is not graph.get_vertex(edge.source_id)
+
+
+def test_graph_edge_index(json_memory_chatbot_no_llm):
+    graph = Graph.from_payload(json.loads(json_memory_chatbot_no_llm), flow_id="flow_id")
+
+    for vertex in graph.vertices:
+        expected = [edge for edge in graph.edges if vertex.id in {edge.source_id, edge.target_id}]
+        assert graph.get_vertex_edges(vertex.id) == expected
+        assert vertex.outgoing_edges == [edge for edge in expected if edge.source_id == vertex.id]
+        assert vertex.incoming_edges == [edge for edge in expected if edge.target_id == vertex.id]
+    for edge in graph.edges:
+        assert graph.get_edge(edge.source_id, edge.target_id) is not None
+
+    for vertex in graph.clone().vertices:
+        assert [edge.target_id for edge in vertex.outgoing_edges] == [
+            edge.target_id for edge in graph.get_vertex(vertex.id).outgoing_edges
+        ]
+    restored = Graph.__new__(Graph)
+    restored.__setstate__(graph.__getstate__())
+    for vertex in graph.vertices:
+        assert restored.get_vertex_edges(vertex.id) == graph.get_vertex_edges(vertex.id)
+
+    removed = graph.edges[0].source_id
+    target = graph.edges[0].target_id
+    graph.remove_vertex(removed)
+    assert graph.get_vertex_edges(removed) == []
+    assert graph.get_edge(removed, target) is None
+    assert all(edge.source_id != removed for edge in graph.get_vertex(target).incoming_edges)
+
+
+async def test_graph_run_state_is_saved_by_run_id():
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    chat_output = ChatOutput(input_value="test", _id="chat_output", should_store_message=False)
+    chat_output.set(sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+    run_id = str(uuid4())
+    graph.set_run_id(run_id)
+
+    await graph.process(fallback_to_env_vars=False)
+    await graph.get_next_runnable_vertices(asyncio.Lock(), vertex=graph.get_vertex("chat_output"))
+
+    other = Graph(ChatInput(_id="chat_input"), ChatOutput(_id="chat_output"))
+    vertex_records = await other.load_run_state(run_id)
+    assert other.run_manager.ran_at_least_once == graph.run_manager.ran_at_least_once
+    assert other.run_manager.vertices_to_run == graph.run_manager.vertices_to_run
+    assert vertex_records["chat_output"]["built"] is True
+    assert await other.load_run_state(str(uuid4())) == {}
+
+
+async def test_chat_service_keeps_live_graphs_out_of_the_cache_service():
+    chat_service = get_chat_service()
+    graph = Graph(ChatInput(_id="chat_input"), ChatOutput(_id="chat_output"))
+    graph.set_run_id(uuid4())
+    flow_id = str(uuid4())
+
+    await chat_service.set_graph(flow_id, graph)
+    assert await chat_service.get_graph(flow_id) is graph
+    assert await chat_service.get_graph_run_id(flow_id) == graph.run_id
+    assert isinstance(await chat_service.get_cache(flow_id), CacheMiss)
+
+    await chat_service.clear_graph(flow_id)
+    assert isinstance(await chat_service.get_graph(flow_id), CacheMiss)
+    assert await chat_service.get_graph_run_id(flow_id) is None
+
+
 @pytest.mark.skip(reason="Temporarily disabled")
 def test_graph_set_with_valid_component():
     tool = YfinanceToolComponent()
@@ -0,0 +1,47 @@
+from langflow.initial_setup.sync_manifest import (
+    SyncManifest,
+    compute_catalog_version,
+    compute_manifest_version,
+    content_hash,
+)
+
+
+def test_sync_manifest_round_trip(tmp_path):
+    path = tmp_path / "manifest.json"
+    manifest = SyncManifest.load(path, "v1")
+    assert manifest.entries == {}
+
+    manifest.set("a.json", content_hash(b"a"), name="A")
+    manifest.set("b.json", content_hash(b"b"), name="B")
+    manifest.save()
+
+    manifest = SyncManifest.load(path, "v1")
+    assert manifest.get("a.json", content_hash(b"a")) == {"hash": content_hash(b"a"), "name": "A"}
+    # The content of the file changed
+    assert manifest.get("a.json", content_hash(b"changed")) is None
+
+    manifest.prune({"a.json"})
+    manifest.save()
+    assert set(SyncManifest.load(path, "v1").entries) == {"a.json"}
+
+
+def test_sync_manifest_is_discarded_when_outdated_or_invalid(tmp_path):
+    path = tmp_path / "manifest.json"
+    manifest = SyncManifest(path, "v1")
+    manifest.set("a.json", content_hash(b"a"), name="A")
+    manifest.save()
+
+    assert SyncManifest.load(path, "v2").entries == {}
+
+    path.write_text("{not json")
+    assert SyncManifest.load(path, "v1").entries == {}
+
+
+def test_manifest_version_depends_on_the_catalog():
+    catalog = {"inputs": {"ChatInput": {"template": {"code": {"value": "a"}}}}}
+    version = compute_manifest_version(compute_catalog_version(catalog), True)  # noqa: FBT003
+
+    assert version == compute_manifest_version(compute_catalog_version(catalog), True)  # noqa: FBT003
+    assert version != compute_manifest_version(compute_catalog_version(catalog), False)  # noqa: FBT003
+    catalog["inputs"]["ChatInput"]["template"]["code"]["value"] = "b"
+    assert version != compute_manifest_version(compute_catalog_version(catalog), True)  # noqa: FBT003
@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock
+
+import pytest
+import sqlalchemy as sa
+from langflow.services.database.service import DatabaseService, schema_fingerprint_table
+from langflow.services.settings.base import Settings
+from sqlmodel import text
+
+
+@pytest.fixture
+async def database_service(tmp_path, monkeypatch):
+    # The database URL of the settings comes from the environment
+    monkeypatch.setenv("LANGFLOW_DATABASE_URL", f"sqlite:///{tmp_path}/test.db")
+    settings = Settings(
+        database_url=f"sqlite:///{tmp_path}/test.db",
+        config_dir=str(tmp_path),
+        alembic_log_file=str(tmp_path / "alembic.log"),
+    )
+    service = DatabaseService(MagicMock(settings=settings))
+    yield service
+    await service.engine.dispose()
+
+
+async def set_revisions(database_service: DatabaseService, *revisions: str) -> None:
+    async with database_service.with_session() as session:
+        await session.exec(text("CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32) NOT NULL)"))
+        await session.exec(text("DELETE FROM alembic_version"))
+        for revision in revisions:
+            await session.exec(text("INSERT INTO alembic_version (version_num) VALUES (:rev)").bindparams(rev=revision))
+        await session.commit()
+
+
+async def test_schema_is_current_only_at_head_with_the_same_fingerprint(database_service: DatabaseService):
+    heads = database_service.get_script_heads()
+
+    # A database that was never checked
+    assert not await database_service.is_schema_current()
+
+    await set_revisions(database_service, *heads)
+    assert not await database_service.is_schema_current()
+
+    await database_service.save_schema_fingerprint()
+    assert await database_service.is_schema_current()
+
+    # Another revision was applied outside of the service
+    await set_revisions(database_service, "0123456789ab")
+    assert not await database_service.is_schema_current()
+
+    # The models changed since the schema was checked
+    await set_revisions(database_service, *heads)
+    async with database_service.with_session() as session:
+        await session.exec(sa.update(schema_fingerprint_table).values(fingerprint="outdated"))
+        await session.commit()
+    assert not await database_service.is_schema_current()
+
+
+def test_schema_fingerprint_depends_on_the_heads(database_service: DatabaseService):
+    heads = database_service.get_script_heads()
+
+    assert heads
+    assert DatabaseService.get_schema_fingerprint(heads) == DatabaseService.get_schema_fingerprint(set(heads))
+    assert DatabaseService.get_schema_fingerprint(heads) != DatabaseService.get_schema_fingerprint({"0123456789ab"})
+    assert DatabaseService.get_schema_fingerprint(heads) != DatabaseService.get_schema_fingerprint(
+        {*heads, "0123456789ab"}
+    )
+
+
+@pytest.mark.parametrize("checked", [True, False])
+async def test_run_migrations_saves_the_fingerprint_only_when_the_check_passed(
+    database_service: DatabaseService, monkeypatch, checked
+):
+    await set_revisions(database_service, *database_service.get_script_heads())
+    monkeypatch.setattr(database_service, "_run_migrations", lambda *_: checked)
+
+    await database_service.run_migrations()
+
+    assert await database_service.is_schema_current() is checked
@@ -3,7 +3,11 @@ from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
-from langflow.services.database.models.vertex_builds.crud import log_vertex_build
+from langflow.services.database.models.vertex_builds.crud import (
+    log_vertex_build,
+    log_vertex_builds,
+    trim_vertex_builds,
+)
 from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
 from langflow.services.settings.base import Settings
 from sqlalchemy import delete, func, select
@@ -314,3 +318,33 @@ async def test_concurrent_log_vertex_build(vertex_build_data, mock_settings):
         async with AsyncSession(engine) as session:
             count = await session.scalar(select(func.count()).select_from(VertexBuildTable))
             assert count <= mock_settings.max_vertex_builds_to_keep
+
+
+@pytest.mark.asyncio
+async def test_log_vertex_builds_trims_separately(async_session: AsyncSession, timestamp_generator):
+    """Test batch logging of vertex builds followed by a single trim."""
+    flow_id = uuid4()
+    vertex_ids = [str(uuid4()), str(uuid4())]
+    builds = [
+        VertexBuildBase(id=vertex_id, flow_id=flow_id, timestamp=timestamp_generator(i), artifacts={}, valid=True)
+        for i in range(4)
+        for vertex_id in vertex_ids
+    ]
+
+    await log_vertex_builds(async_session, builds)
+    count = await async_session.scalar(select(func.count()).select_from(VertexBuildTable))
+    assert count == len(builds)
+
+    await trim_vertex_builds(
+        async_session,
+        {(flow_id, vertex_id) for vertex_id in vertex_ids},
+        max_builds_to_keep=3,
+        max_builds_per_vertex=2,
+    )
+    count = await async_session.scalar(select(func.count()).select_from(VertexBuildTable))
+    assert count == 3
+    for vertex_id in vertex_ids:
+        vertex_count = await async_session.scalar(
+            select(func.count()).select_from(VertexBuildTable).where(VertexBuildTable.id == vertex_id)
+        )
+        assert vertex_count <= 2
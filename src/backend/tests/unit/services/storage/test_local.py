@@ -0,0 +1,44 @@
+import hashlib
+from types import SimpleNamespace
+
+import pytest
+from langflow.services.storage.local import LocalStorageService
+from langflow.services.storage.service import FileSizeLimitExceededError
+
+
+@pytest.fixture
+def storage_service(tmp_path):
+    settings_service = SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path)))
+    return LocalStorageService(session_service=None, settings_service=settings_service)
+
+
+async def _chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_save_and_get_file_stream(storage_service):
+    stored = await storage_service.save_file_stream("flow", "file.txt", _chunks(b"hello ", b"streaming ", b"world"))
+
+    assert stored.size == 21
+    assert stored.sha256 == hashlib.sha256(b"hello streaming world").hexdigest()
+    assert await storage_service.get_file("flow", "file.txt") == b"hello streaming world"
+    assert await storage_service.list_files("flow") == ["file.txt"]
+
+    stream = await storage_service.get_file_stream("flow", "file.txt", chunk_size=8)
+    assert [chunk async for chunk in stream] == [b"hello st", b"reaming ", b"world"]
+
+
+async def test_save_file_stream_over_max_size_keeps_previous_file(storage_service):
+    await storage_service.save_file("flow", "file.txt", b"previous")
+
+    with pytest.raises(FileSizeLimitExceededError):
+        await storage_service.save_file_stream("flow", "file.txt", _chunks(b"x" * 8, b"x" * 8), max_size=10)
+
+    assert await storage_service.get_file("flow", "file.txt") == b"previous"
+    assert await storage_service.list_files("flow") == ["file.txt"]
+
+
+async def test_get_file_stream_missing_file(storage_service):
+    with pytest.raises(FileNotFoundError):
+        await storage_service.get_file_stream("flow", "missing.txt")
@@ -1,5 +1,8 @@
 import asyncio
+import threading
 import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -47,6 +50,7 @@ class MockTracer(BaseTracer):
         inputs: dict[str, any],
         metadata: dict[str, any] | None = None,
         vertex=None,
+        start_time=None,
     ) -> None:
         self.add_trace_list.append(
             {
@@ -56,6 +60,7 @@ class MockTracer(BaseTracer):
                 "inputs": inputs,
                 "metadata": metadata,
                 "vertex": vertex,
+                "start_time": start_time,
             }
         )
 
@@ -66,6 +71,7 @@ class MockTracer(BaseTracer):
         outputs: dict[str, any] | None = None,
         error: Exception | None = None,
         logs=(),
+        end_time=None,
     ) -> None:
         self.end_trace_list.append(
             {
@@ -74,6 +80,7 @@ class MockTracer(BaseTracer):
                 "outputs": outputs,
                 "error": error,
                 "logs": logs,
+                "end_time": end_time,
             }
         )
 
@@ -179,9 +186,11 @@ async def test_start_end_tracers(tracing_service):
         assert tracer.metadata_param == outputs
         assert tracer.outputs_param == trace_context.all_outputs
 
-    # Verify worker_task is cancelled
-    assert trace_context.worker_task is None
+    # Verify every trace event was processed
     assert not trace_context.running
+    stats = tracing_service.get_tracer_stats()
+    assert set(stats) == set(trace_context.tracers)
+    assert all(tracer_stats["pending"] == 0 for tracer_stats in stats.values())
 
 
 @pytest.mark.asyncio
@@ -419,15 +428,15 @@ async def test_trace_worker_with_exception(tracing_service):
         # Remove incorrect context manager usage
         await tracing_service.start_tracers(run_id, run_name, user_id, session_id, project_name)
 
-        # Get trace_context and add failing trace function to queue
+        # Get trace_context and dispatch a failing trace function
         trace_context = trace_context_var.get()
-        await trace_context.traces_queue.put((failing_trace_func, ()))
+        tracing_service._dispatch(trace_context, "langsmith", failing_trace_func)
 
-        # Wait for async queue processing
-        await asyncio.sleep(0.1)
+        # Wait for the tracer calls to run
+        await tracing_service._join(trace_context)
 
         # Verify exception was logged
-        mock_logger.assert_called_with("Error processing trace_func")
+        mock_logger.assert_called_with("Error processing trace_func for tracer langsmith")
 
         # Cleanup
         await tracing_service.end_tracers({})
@@ -517,3 +526,96 @@ async def test_concurrent_tracing(tracing_service, mock_component):
     assert tracer2.session_id == "session_id2"
     assert dict(tracer2.outputs_param.get("run_id2 trace_name1")) == {"output_key": "task2_run_id2 component1_output"}
     assert dict(tracer2.outputs_param.get("run_id2 trace_name2")) == {"output_key": "task2_run_id2 component2_output"}
+
+
+@pytest.mark.asyncio
+async def test_tracer_lane_drops_oldest_spans():
+    """Test that a tracer lane runs its calls in order and drops the oldest unstarted spans when full."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from langflow.services.tracing.service import TracerLane, TracerStats
+
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_call():
+        started.set()
+        release.wait(5)
+
+    stats = TracerStats()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        lane = TracerLane("test", executor, max_size=3, stats=stats)
+        lane.put(blocking_call)
+        started.wait(5)
+        for span_id in ("a", "b", "c"):
+            lane.put(calls.append, f"start {span_id}", span_id=span_id)
+        # Full: span "a" is dropped, and so is its end when it comes
+        lane.put(calls.append, "end b", span_id="b", ends_span=True)
+        lane.put(calls.append, "end a", span_id="a", ends_span=True)
+        # Full again: span "b" is dropped together with its queued end
+        lane.put(calls.append, "run end")
+        release.set()
+        await lane.join()
+
+    assert calls == ["start c", "run end"]
+    assert stats.to_dict()["dropped"] == 4
+    assert stats.to_dict()["processed"] == 3
+    assert stats.to_dict()["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_tracer_lane_runs_calls_in_the_caller_context():
+    """Test that tracer calls see the context variables set where they were queued."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from langflow.services.tracing.service import TracerLane, TracerStats
+
+    var = ContextVar("var", default=None)
+    seen = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        lane = TracerLane("test", executor, max_size=10, stats=TracerStats())
+        var.set("first")
+        lane.put(lambda: seen.append(var.get()))
+        var.set("second")
+        lane.put(lambda: seen.append(var.get()))
+        await lane.join()
+
+    assert seen == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_tracer_lane_call_waits_for_queued_calls():
+    """Test that a blocking call on a lane runs after every call queued before it, or times out."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from langflow.services.tracing.service import TracerLane, TracerStats
+
+    spans = []
+    release = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        lane = TracerLane("test", executor, max_size=10, stats=TracerStats())
+        lane.put(lambda: release.wait(5) and spans.append("span"))
+        with pytest.raises(TimeoutError):
+            lane.call(list, spans, timeout=0.01)
+        release.set()
+        assert lane.call(list, spans, timeout=5) == ["span"]
+        await lane.join()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("mock_tracers")
+async def test_trace_component_passes_build_times(tracing_service, mock_component):
+    """Test that the tracers are given the times the component started and ended, not the times they ran."""
+    await tracing_service.start_tracers(uuid.uuid4(), "test_run", "test_user", "test_session")
+    before = datetime.now(timezone.utc)
+    async with tracing_service.trace_component(mock_component, "test_component", {}):
+        await asyncio.sleep(0.05)
+    after = datetime.now(timezone.utc)
+    await tracing_service.end_tracers({})
+
+    tracer = trace_context_var.get().tracers["langfuse"]
+    start_time = tracer.add_trace_list[0]["start_time"]
+    end_time = tracer.end_trace_list[0]["end_time"]
+    assert before <= start_time < end_time <= after
+    assert (end_time - start_time).total_seconds() >= 0.05
@@ -47,3 +47,38 @@ async def test_delete_api_key(client, logged_in_headers, api_key):
     data = response.json()
     assert data["detail"] == "API Key deleted"
     # Optionally, add a follow-up check to ensure that the key is actually removed from the database
+
+
+@pytest.mark.usefixtures("active_user")
+async def test_deleted_api_key_is_not_cached(client, logged_in_headers, api_key):
+    headers = {"x-api-key": api_key["api_key"]}
+    response = await client.get("api/v1/users/whoami", headers=headers)
+    assert response.status_code == 200, response.text
+
+    response = await client.delete(f"api/v1/api_key/{api_key['id']}", headers=logged_in_headers)
+    assert response.status_code == 200
+
+    response = await client.get("api/v1/users/whoami", headers=headers)
+    assert response.status_code == 403
+
+
+def test_api_key_cache():
+    from uuid import uuid4
+
+    from langflow.services.database.models.api_key.crud import ApiKeyCache
+    from langflow.services.database.models.user.model import User
+
+    cache = ApiKeyCache(max_size=2)
+    user = User(id=uuid4(), username="user", password="password")  # noqa: S106
+    first_key_id, second_key_id = uuid4(), uuid4()
+    cache.set("sk-first", first_key_id, user, ttl=60)
+    cache.set("sk-second", second_key_id, user, ttl=60)
+    cache.set("sk-expired", uuid4(), user, ttl=0)
+
+    assert cache.get("sk-first") is None  # evicted
+    assert cache.get("sk-expired") is None
+    assert cache.get("sk-second").api_key_id == second_key_id
+    assert cache.get("sk-second").user.id == user.id
+
+    cache.invalidate(user_id=user.id)
+    assert cache.get("sk-second") is None
@@ -3,10 +3,11 @@
 import asyncio
 import threading
 import time
+from contextlib import aclosing
 from unittest.mock import patch
 
 import pytest
-from langflow.utils.async_helpers import run_until_complete
+from langflow.utils.async_helpers import iterate_in_thread, run_until_complete
 
 
 class TestRunUntilComplete:
@@ -193,3 +194,56 @@ class TestRunUntilComplete:
             # Should have called asyncio.run (original behavior)
             mock_run.assert_called_once()
             assert result == "mocked_result"
+
+
+class TestIterateInThread:
+    """Test the iterate_in_thread function."""
+
+    async def test_iterate_in_thread_batches_items_pulled_while_the_loop_is_busy(self):
+        """Test that the items pulled while the event loop is blocked come in a single batch."""
+        pulled = threading.Event()
+
+        def items():
+            yield 0
+            yield from range(1, 100)
+            pulled.set()
+
+        batches = [batch async for batch in iterate_in_thread(items()) if pulled.wait(timeout=2)]
+
+        assert [item for batch in batches for item in batch] == list(range(100))
+        assert len(batches) < 100
+
+    async def test_iterate_in_thread_raises_the_error_of_the_iterator(self):
+        """Test that an error raised by the iterator is raised to the caller."""
+
+        def items():
+            yield 1
+            msg = "Stream failed"
+            raise ValueError(msg)
+
+        received = []
+
+        async def consume():
+            async for batch in iterate_in_thread(items()):
+                received.extend(batch)
+
+        with pytest.raises(ValueError, match="Stream failed"):
+            await consume()
+        assert received == [1]
+
+    async def test_iterate_in_thread_stops_pulling_when_closed(self):
+        """Test that the thread stops pulling items once the iteration is closed."""
+        pulled = []
+
+        def items():
+            for item in range(100):
+                pulled.append(item)
+                yield item
+                time.sleep(0.01)
+
+        async with aclosing(iterate_in_thread(items())) as batches:
+            async for _ in batches:
+                break
+        await asyncio.sleep(0.1)
+
+        assert len(pulled) <= 2
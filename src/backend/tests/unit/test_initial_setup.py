@@ -5,15 +5,19 @@ import uuid
 from datetime import datetime
 from unittest.mock import AsyncMock, patch
 
+import orjson
 import pytest
 from anyio import Path
 from httpx import AsyncClient
 from langflow.custom.directory_reader.utils import abuild_custom_component_list_from_path
+from langflow.initial_setup import setup
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.initial_setup.setup import (
+    create_or_update_starter_projects,
     detect_github_url,
     get_project_data,
     load_bundles_from_urls,
+    load_flows_from_directory,
     load_starter_projects,
     update_projects_components_with_latest_component_versions,
 )
@@ -76,6 +80,68 @@ async def test_create_or_update_starter_projects():
         assert num_db_projects == num_projects
 
 
+async def _starter_flows(names: set[str]) -> dict[str, Flow]:
+    async with session_scope() as session:
+        stmt = select(Folder).options(selectinload(Folder.flows)).where(Folder.name == STARTER_FOLDER_NAME)
+        folder = (await session.exec(stmt)).first()
+        return {flow.name: flow for flow in folder.flows if flow.name in names}
+
+
+@pytest.mark.usefixtures("client")
+async def test_create_or_update_starter_projects_skips_unchanged_files(tmp_path, monkeypatch):
+    settings = get_settings_service().settings
+    monkeypatch.setattr(settings, "config_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "update_starter_projects", True)
+    starter_projects_path = tmp_path / "starter_projects"
+    starter_projects_path.mkdir()
+    monkeypatch.setattr(setup, "STARTER_PROJECTS_PATH", Path(starter_projects_path))
+    names = {"Sync Project A", "Sync Project B"}
+    for name in names:
+        project = {"name": name, "description": "First", "data": {"nodes": [], "edges": []}}
+        (starter_projects_path / f"{name}.json").write_bytes(orjson.dumps(project))
+
+    await create_or_update_starter_projects({})
+    created = await _starter_flows(names)
+    assert created.keys() == names
+
+    # Unchanged files are not loaded again and their flows are kept
+    with patch.object(setup, "load_starter_project", wraps=setup.load_starter_project) as load_starter_project:
+        await create_or_update_starter_projects({})
+    load_starter_project.assert_not_called()
+    assert {name: flow.id for name, flow in (await _starter_flows(names)).items()} == {
+        name: flow.id for name, flow in created.items()
+    }
+
+    # The flow of a changed file is replaced, the flow of a removed file is deleted
+    project = {"name": "Sync Project A", "description": "Second", "data": {"nodes": [], "edges": []}}
+    (starter_projects_path / "Sync Project A.json").write_bytes(orjson.dumps(project))
+    (starter_projects_path / "Sync Project B.json").unlink()
+    await create_or_update_starter_projects({})
+    updated = await _starter_flows(names)
+    assert updated.keys() == {"Sync Project A"}
+    assert updated["Sync Project A"].id != created["Sync Project A"].id
+    assert updated["Sync Project A"].description == "Second"
+
+
+@pytest.mark.load_flows
+@pytest.mark.usefixtures("client")
+async def test_load_flows_from_directory_skips_unchanged_files(tmp_path, monkeypatch):
+    settings = get_settings_service().settings
+    monkeypatch.setattr(settings, "config_dir", str(tmp_path))
+    flow_file = next(Path(settings.load_flows_path).glob("*.json"))
+
+    with patch.object(setup, "upsert_flow_from_file", wraps=setup.upsert_flow_from_file) as upsert_flow_from_file:
+        await load_flows_from_directory()
+        assert upsert_flow_from_file.call_count == 1
+
+        await load_flows_from_directory()
+        assert upsert_flow_from_file.call_count == 1
+
+        await flow_file.write_bytes(await flow_file.read_bytes() + b"\n")
+        await load_flows_from_directory()
+        assert upsert_flow_from_file.call_count == 2
+
+
 # Some starter projects require integration
 # async def test_starter_projects_can_run_successfully(client):
 #     with session_scope() as session:
@@ -1,9 +1,11 @@
 # ruff: noqa: T201
 import asyncio
+import json
 import time
+from unittest.mock import patch
 
 import pytest
-from langflow.interface.components import aget_all_types_dict, import_langflow_components
+from langflow.interface.components import _process_single_module, aget_all_types_dict, import_langflow_components
 from langflow.services.settings.base import BASE_COMPONENTS_PATH
 
 
@@ -29,6 +31,24 @@ class TestComponentLoading:
         total_components = sum(len(comps) for comps in result["components"].values())
         assert total_components > 0, "Should have loaded some components"
 
+    @pytest.mark.no_blockbuster
+    @pytest.mark.asyncio
+    async def test_component_index(self, tmp_path):
+        """Test that components loaded through the component index match a full import."""
+        index_path = tmp_path / "component_index.json"
+        expected = await import_langflow_components()
+
+        assert await import_langflow_components(index_path) == expected
+        indexed_modules = json.loads(index_path.read_text())["modules"]
+        assert indexed_modules, "The component index should be written"
+
+        with patch(
+            "langflow.interface.components._process_single_module", wraps=_process_single_module
+        ) as mock_process:
+            assert await import_langflow_components(index_path) == expected
+        # Only the modules that failed to import are imported again
+        assert not any(call.args[0] in indexed_modules for call in mock_process.call_args_list)
+
     @pytest.mark.no_blockbuster
     @pytest.mark.asyncio
     async def test_aget_all_types_dict_basic(self, base_components_path):
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from uuid import UUID, uuid4
 
 import pytest
@@ -7,6 +7,7 @@ from langflow.memory import (
     aadd_messagetables,
     add_messages,
     adelete_messages,
+    aget_message_history,
     aget_messages,
     astore_message,
     aupdate_messages,
@@ -75,6 +76,38 @@ async def test_aget_messages():
     assert messages[1].text == "Test message 2"
 
 
+@pytest.mark.usefixtures("client")
+async def test_aget_message_history():
+    session_id = str(uuid4())
+    base_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    await aadd_messages(
+        [
+            Message(
+                text=f"Test message {i}",
+                sender="User" if i % 2 else "Machine",
+                sender_name="User" if i % 2 else "AI",
+                session_id=session_id,
+                timestamp=base_time + timedelta(seconds=i),
+            )
+            for i in range(5)
+        ]
+    )
+
+    page = await aget_message_history(session_id, limit=2)
+    assert [message.text for message in page.messages] == ["Test message 3", "Test message 4"]
+    assert page.next_cursor is not None
+
+    page = await aget_message_history(session_id, limit=2, before=page.next_cursor)
+    assert [message.text for message in page.messages] == ["Test message 1", "Test message 2"]
+
+    page = await aget_message_history(session_id, limit=2, before=page.next_cursor)
+    assert [message.text for message in page.messages] == ["Test message 0"]
+    assert page.next_cursor is None
+
+    page = await aget_message_history(session_id, limit=10, sender="User")
+    assert [message.text for message in page.messages] == ["Test message 1", "Test message 3"]
+
+
 @pytest.mark.usefixtures("client")
 def test_add_messages():
     message = Message(text="New Test message", sender="User", sender_name="User", session_id="new_session_id")
@@ -1,3 +1,9 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from langflow.processing.graph_cache import GraphTemplateCache, hash_tweaks
 from langflow.processing.process import process_tweaks
 from langflow.services.deps import get_session_service
 
@@ -306,3 +312,50 @@ async def test_load_langchain_object_with_cached_session(basic_graph_data):
 #     )
 #
 #     assert graph1 == graph2
+
+
+def test_hash_tweaks_is_independent_of_key_order():
+    assert hash_tweaks({"a": {"x": 1}, "b": 2}) == hash_tweaks({"b": 2, "a": {"x": 1}})
+    assert hash_tweaks({"a": {"x": 1}}) != hash_tweaks({"a": {"x": 2}})
+    assert hash_tweaks(None) == hash_tweaks({}) == ""
+
+
+def test_graph_template_cache(json_memory_chatbot_no_llm):
+    flow_data = json.loads(json_memory_chatbot_no_llm)["data"]
+    flow = SimpleNamespace(id=uuid4(), name="Memory Chatbot", data=flow_data, updated_at=datetime.now(timezone.utc))
+    cache = GraphTemplateCache(max_size=10 * 1024 * 1024)
+
+    first = cache.get_graph(flow, user_id="user")
+    second = cache.get_graph(flow, user_id="user")
+
+    assert first is not second
+    assert [vertex.id for vertex in first.vertices] == [vertex.id for vertex in second.vertices]
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+    cache.get_graph(flow, tweaks={"stream": True}, user_id="user")
+    assert len(cache) == 2
+
+    # A new version of the flow replaces the templates of the previous one
+    flow.updated_at = datetime.now(timezone.utc)
+    cache.get_graph(flow, user_id="user")
+    assert len(cache) == 1
+
+    cache.invalidate(str(flow.id))
+    assert len(cache) == 0
+    assert cache.total_size == 0
+
+
+def test_graph_template_cache_evicts_when_full(json_memory_chatbot_no_llm):
+    flow_data = json.loads(json_memory_chatbot_no_llm)["data"]
+    flow_size = len(json.dumps(flow_data))
+    cache = GraphTemplateCache(max_size=int(flow_size * 1.5))
+    flows = [
+        SimpleNamespace(id=uuid4(), name="Memory Chatbot", data=flow_data, updated_at=datetime.now(timezone.utc))
+        for _ in range(2)
+    ]
+
+    for flow in flows:
+        cache.get_graph(flow)
+
+    assert len(cache) == 1
+    assert cache.total_size <= cache.max_size
@@ -0,0 +1,47 @@
+import gzip
+import json
+
+from langflow.utils.compression import PrecompressedJSON
+from starlette.requests import Request
+
+
+def _request(headers: dict[str, str]) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/",
+            "headers": [(key.lower().encode(), value.encode()) for key, value in headers.items()],
+        }
+    )
+
+
+def test_precompressed_json_selects_accepted_encoding():
+    data = {"components": {"ChatInput": {"display_name": "Chat Input"}}}
+    payload = PrecompressedJSON(data)
+
+    response = payload.response(_request({"Accept-Encoding": "gzip"}))
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(response.body)) == data
+
+    response = payload.response(_request({"Accept-Encoding": "gzip;q=0"}))
+    assert "Content-Encoding" not in response.headers
+    assert json.loads(response.body) == data
+
+    response = payload.response(_request({}))
+    assert json.loads(response.body) == data
+
+
+def test_precompressed_json_not_modified():
+    payload = PrecompressedJSON({"key": "value"})
+    etag = payload.response(_request({"Accept-Encoding": "gzip"})).headers["ETag"]
+
+    response = payload.response(_request({"Accept-Encoding": "gzip", "If-None-Match": etag}))
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    other = PrecompressedJSON({"key": "other"})
+    response = other.response(_request({"Accept-Encoding": "gzip", "If-None-Match": etag}))
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
@@ -0,0 +1,41 @@
+import httpx
+import respx
+from httpx import Response
+from langflow.utils.http_client import HttpResponseCache, close_http_client, get_http_client
+
+
+@respx.mock
+async def test_shared_client_does_not_keep_cookies():
+    route = respx.get("https://example.com/login").mock(
+        return_value=Response(200, headers={"Set-Cookie": "session=secret; Path=/"})
+    )
+    client = get_http_client()
+    try:
+        await client.get("https://example.com/login")
+        await client.get("https://example.com/login")
+    finally:
+        await close_http_client()
+
+    assert "cookie" not in route.calls[-1].request.headers
+    assert not client.cookies
+
+
+async def test_revalidated_response_keeps_repeated_headers():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"Cache-Control": "max-age=60"})
+        headers = [("ETag", '"v1"'), ("Cache-Control", "no-cache"), ("Set-Cookie", "a=1"), ("Set-Cookie", "b=2")]
+        return httpx.Response(200, headers=headers, content=b"body")
+
+    cache = HttpResponseCache(max_size=1024)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        await cache.get(client, "https://example.com/page")
+        revalidated = await cache.get(client, "https://example.com/page")
+        fresh = await cache.get(client, "https://example.com/page")
+
+    for response in (revalidated, fresh):
+        assert response.content == b"body"
+        assert response.headers.get_list("Set-Cookie") == ["a=1", "b=2"]
+        assert response.headers["Cache-Control"] == "max-age=60"
+    assert cache.hits == 2
+    assert cache.misses == 1
@@ -0,0 +1,34 @@
+import io
+import zipfile
+
+from langflow.utils.zip_stream import stream_zip
+
+
+async def _chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _members():
+    yield "flow.json", b'{"name": "flow"}'
+    yield "large.bin", _chunks(b"a" * 1000, b"b" * 1000, b"c" * 1000)
+
+
+async def test_stream_zip_builds_a_valid_archive():
+    parts = [part async for part in stream_zip(_members())]
+
+    # The archive is sent as the members are written, not once it is complete
+    assert len(parts) > 2
+    with zipfile.ZipFile(io.BytesIO(b"".join(parts))) as zip_file:
+        assert zip_file.testzip() is None
+        assert zip_file.namelist() == ["flow.json", "large.bin"]
+        assert zip_file.read("flow.json") == b'{"name": "flow"}'
+        assert zip_file.read("large.bin") == b"a" * 1000 + b"b" * 1000 + b"c" * 1000
+
+
+async def test_stream_zip_compressed():
+    parts = [part async for part in stream_zip(_members(), compression=zipfile.ZIP_DEFLATED)]
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(parts))) as zip_file:
+        assert zip_file.read("large.bin") == b"a" * 1000 + b"b" * 1000 + b"c" * 1000
+        assert zip_file.getinfo("large.bin").compress_size < 3000